@@ -1,14 +1,113 @@
 """Flow engine for executing YAML-defined flows using Questionary."""
 
+import copy
+import functools
+import os
 import signal
 import sys
 import questionary
 from questionary import Style
 import yaml
-from typing import Dict, Any, Optional, List, Callable, Union
+from typing import Dict, Any, Optional, List, Callable, Tuple, Union
 from pathlib import Path
 import re
 from .exceptions import FlowValidationError, FlowExecutionError
+from .yaml_loader import SafeLoader
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_condition(expression: str) -> Optional[Tuple[str, Any]]:
+    """
+    Split an equality condition like "enable_email == true" into its key
+    and literal value. Flows re-check the same few conditions on every run,
+    so the parsed form is cached per expression string.
+
+    Returns:
+        (context key, comparison value), or None if not an equality check
+    """
+    if "==" not in expression:
+        return None
+
+    left, right = expression.split("==", 1)
+    left = left.strip()
+    right = right.strip().strip("'\\\"")
+
+    # Convert string boolean values
+    if right.lower() == "true":
+        right = True
+    elif right.lower() == "false":
+        right = False
+    elif right.isdigit():
+        right = int(right)
+    elif right.replace(".", "", 1).isdigit():
+        right = float(right)
+
+    return left, right
+
+
+@functools.lru_cache(maxsize=512)
+def _split_key_path(key: str) -> Tuple[str, ...]:
+    """Split a dotted context key ("user.profile.email") once per key."""
+    return tuple(key.split("."))
+
+
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_DOMAIN_RE = re.compile(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+
+def _required_validator(value: str) -> bool:
+    """Validate that value is not empty."""
+    if not value or not value.strip():
+        raise questionary.ValidationError(message="This field is required")
+    return True
+
+
+def _email_validator(value: str) -> bool:
+    """Validate email format."""
+    if not value:
+        return True  # Allow empty for optional fields
+    if not _EMAIL_RE.match(value):
+        raise questionary.ValidationError(message="Invalid email format")
+    return True
+
+
+def _domain_validator(value: str) -> bool:
+    """Validate domain format."""
+    if not value:
+        raise questionary.ValidationError(message="Domain cannot be empty")
+    if not _DOMAIN_RE.match(value):
+        raise questionary.ValidationError(message="Invalid domain format")
+    return True
+
+
+def _integer_validator(value: str) -> bool:
+    """Validate integer format."""
+    if not value:
+        return True  # Allow empty for optional fields
+    try:
+        int(value)
+        return True
+    except ValueError:
+        raise questionary.ValidationError(message="Must be a valid integer")
+
+
+def _password_length_validator(value: str) -> bool:
+    """Validate password length (minimum 8 characters)."""
+    if len(value) < 8:
+        raise questionary.ValidationError(
+            message="Password must be at least 8 characters long"
+        )
+    return True
+
+
+# Built once at import rather than as closures on every FlowEngine()
+_BUILTIN_VALIDATORS: Dict[str, Callable[[str], bool]] = {
+    "required": _required_validator,
+    "email": _email_validator,
+    "domain": _domain_validator,
+    "integer": _integer_validator,
+    "password_length": _password_length_validator,
+}
 
 
 class FlowEngine:
@@ -33,6 +132,11 @@ class FlowEngine:
         self.validators = self._load_validators()
         self._exit_requested = False
         self._original_sigint_handler = None
+        # Parsed flow definitions keyed by path, with the (mtime_ns, size)
+        # they were read at
+        self._flow_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        # ((mtime_ns, size) of flows_dir, flow IDs); see get_available_flows
+        self._available_flows: Optional[Tuple[Tuple[int, int], List[str]]] = None
 
     def _get_theme_style(self, theme: str) -> Style:
         """Get predefined theme styles."""
@@ -71,14 +175,27 @@ class FlowEngine:
         return themes.get(theme, themes["default"])
 
     def get_available_flows(self) -> List[str]:
-        """Get list of available flow IDs."""
-        if not self.flows_dir.exists():
+        """
+        Get list of available flow IDs.
+
+        The directory is only re-listed when its mtime changes, which happens
+        whenever a flow file is added, removed or renamed.
+        """
+        try:
+            st = os.stat(self.flows_dir)
+        except OSError:
             return []
 
-        flows = []
-        for flow_file in self.flows_dir.glob("*.yml"):
-            flows.append(flow_file.stem)
-        return flows
+        dir_signature = (st.st_mtime_ns, st.st_size)
+        if self._available_flows is None or self._available_flows[0] != dir_signature:
+            with os.scandir(self.flows_dir) as entries:
+                flows = [
+                    entry.name[:-4]
+                    for entry in entries
+                    if entry.name.endswith(".yml")
+                ]
+            self._available_flows = (dir_signature, flows)
+        return list(self._available_flows[1])
 
     def _emergency_exit_handler(self, signum, frame):
         """Handle double Ctrl+C for emergency exit."""
@@ -462,23 +579,10 @@ class FlowEngine:
         # Simple expression evaluator for conditions like "enable_email == true"
 
         # Handle simple equality checks
-        if "==" in expression:
-            left, right = expression.split("==", 1)
-            left = left.strip()
-            right = right.strip().strip("'\\\"")
-
-            # Convert string boolean values
-            if right.lower() == "true":
-                right = True
-            elif right.lower() == "false":
-                right = False
-            elif right.isdigit():
-                right = int(right)
-            elif right.replace(".", "", 1).isdigit():
-                right = float(right)
-
-            left_value = self._get_nested_value(context, left)
-            return left_value == right
+        condition = _parse_condition(expression)
+        if condition is not None:
+            left, right = condition
+            return self._get_nested_value(context, left) == right
 
         # Handle simple boolean checks
         if expression in context:
@@ -488,9 +592,8 @@ class FlowEngine:
 
     def _get_nested_value(self, data: Dict[str, Any], key: str) -> Any:
         """Get nested value using dot notation."""
-        keys = key.split(".")
         value = data
-        for k in keys:
+        for k in _split_key_path(key):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
@@ -507,21 +610,48 @@ class FlowEngine:
 
         return re.sub(r"\{([^}]+)\}", replace_var, preview_template)
 
+    def load_flow(self, flow_id: str) -> Dict[str, Any]:
+        """
+        Load a flow definition by ID.
+
+        Unchanged files are served from the engine's cache; the caller gets
+        its own copy and may modify it freely.
+
+        Raises:
+            FlowValidationError: If the file is missing or not valid YAML
+        """
+        return self._load_flow(flow_id)
+
     def _load_flow(self, flow_id: str) -> Dict[str, Any]:
-        """Load flow definition from YAML file."""
+        """
+        Load flow definition from YAML file.
+
+        Parsed definitions are reused while the file keeps the same mtime and
+        size; callers always get their own deep copy.
+        """
         flow_path = self.flows_dir / f"{flow_id}.yml"
-        if not flow_path.exists():
+        try:
+            st = flow_path.stat()
+        except OSError:
             raise FlowValidationError(f"Flow definition not found: {flow_path}")
 
+        cache_key = str(flow_path)
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._flow_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+
         try:
-            with open(flow_path, "r", encoding="utf-8") as f:
-                flow_def = yaml.safe_load(f)
-                if not flow_def:
-                    raise FlowValidationError(f"Empty or invalid YAML in {flow_path}")
-                return flow_def
+            with open(flow_path, "rb") as f:
+                flow_def = yaml.load(f, Loader=SafeLoader)
+            if not flow_def:
+                raise FlowValidationError(f"Empty or invalid YAML in {flow_path}")
         except yaml.YAMLError as e:
             raise FlowValidationError(f"Invalid YAML in {flow_path}: {e}")
 
+        self._flow_cache[cache_key] = (signature, flow_def)
+        return copy.deepcopy(flow_def)
+
     def _apply_output_mapping(
         self, answers: Dict[str, Any], mapping: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -547,51 +677,6 @@ class FlowEngine:
 
     def _load_validators(self) -> Dict[str, Callable]:
         """Load built-in validators."""
-
-        def required_validator(value: str) -> bool:
-            """Validate that value is not empty."""
-            if not value or not value.strip():
-                raise questionary.ValidationError(message="This field is required")
-            return True
-
-        def email_validator(value: str) -> bool:
-            """Validate email format."""
-            if not value:
-                return True  # Allow empty for optional fields
-            if not re.match(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", value):
-                raise questionary.ValidationError(message="Invalid email format")
-            return True
-
-        def domain_validator(value: str) -> bool:
-            """Validate domain format."""
-            if not value:
-                raise questionary.ValidationError(message="Domain cannot be empty")
-            if not re.match(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", value):
-                raise questionary.ValidationError(message="Invalid domain format")
-            return True
-
-        def integer_validator(value: str) -> bool:
-            """Validate integer format."""
-            if not value:
-                return True  # Allow empty for optional fields
-            try:
-                int(value)
-                return True
-            except ValueError:
-                raise questionary.ValidationError(message="Must be a valid integer")
-
-        def password_length_validator(value: str) -> bool:
-            """Validate password length (minimum 8 characters)."""
-            if len(value) < 8:
-                raise questionary.ValidationError(
-                    message="Password must be at least 8 characters long"
-                )
-            return True
-
-        return {
-            "required": required_validator,
-            "email": email_validator,
-            "domain": domain_validator,
-            "integer": integer_validator,
-            "password_length": password_length_validator,
-        }
+        # The validator functions are shared; each engine gets its own dict
+        # so registering a custom validator does not leak between engines
+        return dict(_BUILTIN_VALIDATORS)
@@ -0,0 +1,8 @@
+"""YAML loader shared by the flow engine and the designer tools."""
+
+try:  # libyaml-backed parser when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader
+
+__all__ = ["SafeLoader"]
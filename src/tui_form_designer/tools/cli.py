@@ -7,12 +7,82 @@ Provides access to all tools through a single command interface.
 import argparse
 import sys
 from pathlib import Path
+from typing import List, Optional
 
 from ..ui.questionary_ui import QuestionaryUI
 
 
-def main():
-    """Main CLI entry point."""
+def _add_design_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--flow", help="Flow ID to edit")
+
+
+def _add_validate_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("flows", nargs="*", help="Flow files to validate")
+    parser.add_argument("--interactive", "-i", action="store_true", 
+                        help="Interactive validation mode")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Number of flows to validate in parallel (1 = serial)")
+
+
+def _add_test_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--flow", help="Flow ID to test")
+    parser.add_argument("--mock-data", help="JSON file with mock responses")
+    parser.add_argument("--all", action="store_true", help="Test all flows")
+    parser.add_argument("--interactive", "-i", action="store_true", 
+                        help="Interactive testing mode")
+
+
+def _add_preview_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--flow", help="Flow ID to preview")
+    parser.add_argument("--step", help="Specific step to preview")
+    parser.add_argument("--list", "-l", action="store_true", help="List all flows")
+    parser.add_argument("--interactive", "-i", action="store_true", 
+                        help="Interactive preview mode")
+
+
+def _add_demo_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--flow", help="Specific flow to demonstrate")
+
+
+# Command name -> (help text, function adding the command's arguments)
+_COMMANDS = {
+    "design": ("Interactive flow designer", _add_design_arguments),
+    "validate": ("Validate flow definitions", _add_validate_arguments),
+    "test": ("Test flow execution", _add_test_arguments),
+    "preview": ("Preview flow definitions", _add_preview_arguments),
+    "demo": ("Run demonstration", _add_demo_arguments),
+}
+
+
+class _SilentArgumentParser(argparse.ArgumentParser):
+    """Parser that raises on bad input instead of printing usage and exiting."""
+
+    def error(self, message):
+        raise argparse.ArgumentError(None, message)
+
+
+def _find_command(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named in argv, parsed the way the full parser would."""
+    # Only the top-level options are declared, so argparse itself handles
+    # "--flows-dir=x" and abbreviations like "--flows x"; everything after
+    # the command is left for the full parser
+    parser = _SilentArgumentParser(add_help=False)
+    parser.add_argument("--flows-dir")
+    parser.add_argument("command", nargs="?")
+    try:
+        args, _ = parser.parse_known_args(argv)
+    except argparse.ArgumentError:
+        return None  # e.g. "--flows-dir" without a value; the full parser reports it
+    return args.command if args.command in _COMMANDS else None
+
+
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI argument parser.
+
+    Every command is registered so top-level help lists them all, but only
+    the arguments of ``command`` are added; the rest are never needed.
+    """
     parser = argparse.ArgumentParser(
         prog="tui-designer",
         description="Interactive form designer for Questionary-based terminal user interfaces",
@@ -31,47 +101,28 @@ Examples:
     parser.add_argument("--version", action="version", version="TUI Form Designer 1.0.0")
     
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    for name, (help_text, add_arguments) in _COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if name == command:
+            add_arguments(command_parser)
     
-    # Design command
-    design_parser = subparsers.add_parser("design", help="Interactive flow designer")
-    design_parser.add_argument("--flow", help="Flow ID to edit")
-    
-    # Validate command  
-    validate_parser = subparsers.add_parser("validate", help="Validate flow definitions")
-    validate_parser.add_argument("flows", nargs="*", help="Flow files to validate")
-    validate_parser.add_argument("--interactive", "-i", action="store_true", 
-                                help="Interactive validation mode")
-    
-    # Test command
-    test_parser = subparsers.add_parser("test", help="Test flow execution")
-    test_parser.add_argument("--flow", help="Flow ID to test")
-    test_parser.add_argument("--mock-data", help="JSON file with mock responses")
-    test_parser.add_argument("--all", action="store_true", help="Test all flows")
-    test_parser.add_argument("--interactive", "-i", action="store_true", 
-                            help="Interactive testing mode")
-    
-    # Preview command
-    preview_parser = subparsers.add_parser("preview", help="Preview flow definitions")
-    preview_parser.add_argument("--flow", help="Flow ID to preview")
-    preview_parser.add_argument("--step", help="Specific step to preview")
-    preview_parser.add_argument("--list", "-l", action="store_true", help="List all flows")
-    preview_parser.add_argument("--interactive", "-i", action="store_true", 
-                               help="Interactive preview mode")
-    
-    # Demo command
-    demo_parser = subparsers.add_parser("demo", help="Run demonstration")
-    demo_parser.add_argument("--flow", help="Specific flow to demonstrate")
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    parser = _build_parser(_find_command(sys.argv[1:]))
     
     args = parser.parse_args()
     
-    # Set flows directory for all tools
-    flows_dir = args.flows_dir
+    # Set flows directory for all tools; built once and shared with each tool
+    flows_dir = Path(args.flows_dir)
     
     # Ensure flows directory exists
-    if not Path(flows_dir).exists() and args.command in ['design', 'validate', 'test', 'preview']:
+    if args.command in ['design', 'validate', 'test', 'preview'] and not flows_dir.exists():
         ui = QuestionaryUI()
         if ui.confirm(f"Flows directory '{flows_dir}' doesn't exist. Create it?"):
-            Path(flows_dir).mkdir(parents=True, exist_ok=True)
+            flows_dir.mkdir(parents=True, exist_ok=True)
             ui.show_success(f"Created flows directory: {flows_dir}")
         else:
             ui.show_error("Cannot proceed without flows directory")
@@ -88,7 +139,7 @@ Examples:
         
     elif args.command == "validate":
         from .validator import FlowValidator
-        validator = FlowValidator(flows_dir=flows_dir)
+        validator = FlowValidator(flows_dir=flows_dir, jobs=args.jobs)
         
         if args.interactive:
             validator.interactive_validate()
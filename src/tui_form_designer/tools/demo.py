@@ -4,6 +4,7 @@ Demo Tool
 Demonstrate TUI Form Designer capabilities with example flows.
 """
 
+import yaml
 from pathlib import Path
 import sys
 from typing import Optional
@@ -49,10 +50,7 @@ def demo_interactive_selection(flow_engine: FlowEngine, flows: list, ui: Questio
         flow_descriptions = []
         for flow_id in flows:
             try:
-                flow_path = flow_engine.flows_dir / f"{flow_id}.yml"
-                import yaml
-                with open(flow_path, 'r') as f:
-                    flow_def = yaml.safe_load(f)
+                flow_def = flow_engine.load_flow(flow_id)
                 
                 title = flow_def.get('title', flow_id)
                 description = flow_def.get('description', 'No description')
@@ -87,10 +85,7 @@ def demo_specific_flow(flow_engine: FlowEngine, flow_id: str, ui: QuestionaryUI)
         ui.show_phase_header(f"Demonstrating: {flow_id}", "🎬")
         
         # Show flow information
-        flow_path = flow_engine.flows_dir / f"{flow_id}.yml"
-        import yaml
-        with open(flow_path, 'r') as f:
-            flow_def = yaml.safe_load(f)
+        flow_def = flow_engine.load_flow(flow_id)
         
         title = flow_def.get('title', flow_id)
         description = flow_def.get('description', 'No description')
@@ -309,7 +304,6 @@ def create_sample_flows(flows_dir: str):
         ('user_registration.yml', registration_flow)
     ]
     
-    import yaml
     for filename, flow_data in samples:
         flow_path = flows_path / filename
         with open(flow_path, 'w') as f:
@@ -21,47 +21,49 @@ from ..ui.questionary_ui import QuestionaryUI
 class InteractiveFlowDesigner:
     """Interactive tool for designing and editing YAML flows."""
     
+    # Available step types and their configurations. These class-level tables
+    # are shared by every designer instance and are not copied, so never
+    # modify them in place.
+    step_types = {
+        'text': {
+            'name': 'Text Input',
+            'description': 'Single line text input with optional validation',
+            'required_fields': ['id', 'message'],
+            'optional_fields': ['default', 'instruction', 'validate']
+        },
+        'select': {
+            'name': 'Single Selection',
+            'description': 'Choose one option from a list',
+            'required_fields': ['id', 'message', 'choices'],
+            'optional_fields': ['default', 'instruction']
+        },
+        'confirm': {
+            'name': 'Yes/No Confirmation',
+            'description': 'Boolean confirmation prompt',
+            'required_fields': ['id', 'message'],
+            'optional_fields': ['default', 'instruction']
+        },
+        'password': {
+            'name': 'Password Input',
+            'description': 'Secure password input field',
+            'required_fields': ['id', 'message'],
+            'optional_fields': ['instruction', 'validate']
+        }
+    }
+    
+    validators = [
+        'required',
+        'email', 
+        'domain',
+        'integer',
+        'password_length'
+    ]
+    
     def __init__(self, flows_dir: str = "flows"):
         self.flows_dir = Path(flows_dir)
         self.flows_dir.mkdir(exist_ok=True)
         self.ui = QuestionaryUI()
         self.flow_engine = FlowEngine(flows_dir=flows_dir)
-        
-        # Available step types and their configurations
-        self.step_types = {
-            'text': {
-                'name': 'Text Input',
-                'description': 'Single line text input with optional validation',
-                'required_fields': ['id', 'message'],
-                'optional_fields': ['default', 'instruction', 'validate']
-            },
-            'select': {
-                'name': 'Single Selection',
-                'description': 'Choose one option from a list',
-                'required_fields': ['id', 'message', 'choices'],
-                'optional_fields': ['default', 'instruction']
-            },
-            'confirm': {
-                'name': 'Yes/No Confirmation',
-                'description': 'Boolean confirmation prompt',
-                'required_fields': ['id', 'message'],
-                'optional_fields': ['default', 'instruction']
-            },
-            'password': {
-                'name': 'Password Input',
-                'description': 'Secure password input field',
-                'required_fields': ['id', 'message'],
-                'optional_fields': ['instruction', 'validate']
-            }
-        }
-        
-        self.validators = [
-            'required',
-            'email', 
-            'domain',
-            'integer',
-            'password_length'
-        ]
     
     def run(self):
         """Run the interactive flow designer."""
@@ -189,9 +191,7 @@ class InteractiveFlowDesigner:
         self.ui.show_section_header("Available Flows", "📁")
         for flow_id in flows:
             try:
-                flow_path = self.flows_dir / f"{flow_id}.yml"
-                with open(flow_path, 'r') as f:
-                    flow_def = yaml.safe_load(f)
+                flow_def = self.flow_engine.load_flow(flow_id)
                 title = flow_def.get('title', flow_id)
                 description = flow_def.get('description', 'No description')
                 icon = flow_def.get('icon', '📄')
@@ -212,17 +212,14 @@ class InteractiveFlowDesigner:
         flow_id = self.ui.select("Select flow to validate:", flows)
         
         try:
-            flow_path = self.flows_dir / f"{flow_id}.yml"
-            with open(flow_path, 'r') as f:
-                flow_def = yaml.safe_load(f)
+            flow_def = self.flow_engine.load_flow(flow_id)
             
             errors = self.flow_engine.validate_flow(flow_def)
             if not errors:
                 self.ui.show_success(f"Flow '{flow_id}' is valid! ✨")
             else:
                 self.ui.show_error(f"Flow '{flow_id}' has validation errors:")
-                for error in errors:
-                    self.ui.show_step(error)
+                self.ui.show_steps(errors)
         except Exception as e:
             self.ui.show_error(f"Failed to validate flow: {e}")
     
@@ -4,7 +4,6 @@ Flow Preview Tool
 Preview flow definitions and their structure without execution.
 """
 
-import yaml
 from pathlib import Path
 import sys
 from typing import Dict, Any, Optional
@@ -25,18 +24,18 @@ class FlowPreviewer:
     
     def preview_flow(self, flow_id: str, step_id: Optional[str] = None):
         """Preview a flow or specific step."""
+        if flow_id not in self.flow_engine.get_available_flows():
+            self.ui.show_error(f"Flow not found: {flow_id}")
+            return
+        
         try:
-            flow_path = self.flows_dir / f"{flow_id}.yml"
-            with open(flow_path, 'r') as f:
-                flow_def = yaml.safe_load(f)
+            flow_def = self.flow_engine.load_flow(flow_id)
             
             if step_id:
                 self._preview_step(flow_def, step_id)
             else:
                 self._preview_full_flow(flow_def)
                 
-        except FileNotFoundError:
-            self.ui.show_error(f"Flow not found: {flow_id}")
         except Exception as e:
             self.ui.show_error(f"Error loading flow: {e}")
     
@@ -61,10 +60,10 @@ class FlowPreviewer:
         errors = self.flow_engine.validate_flow(flow_def)
         if errors:
             self.ui.show_warning(f"Validation Issues: {len(errors)}")
-            for error in errors[:3]:  # Show first 3 errors
-                self.ui.show_step(f"• {error}")
+            lines = [f"• {error}" for error in errors[:3]]  # Show first 3 errors
             if len(errors) > 3:
-                self.ui.show_step(f"• ... and {len(errors) - 3} more")
+                lines.append(f"• ... and {len(errors) - 3} more")
+            self.ui.show_steps(lines)
         else:
             self.ui.show_success("✅ Flow is valid")
         
@@ -143,11 +142,10 @@ class FlowPreviewer:
         # Type-specific details
         if step.get('type') == 'select' and step.get('choices'):
             self.ui.show_section_header("Choices", "📋")
-            for i, choice in enumerate(step['choices'], 1):
-                if isinstance(choice, dict):
-                    self.ui.show_step(f"{i}. {choice.get('name', choice)}")
-                else:
-                    self.ui.show_step(f"{i}. {choice}")
+            self.ui.show_steps([
+                f"{i}. {choice.get('name', choice) if isinstance(choice, dict) else choice}"
+                for i, choice in enumerate(step['choices'], 1)
+            ])
         
         # Optional fields
         if step.get('default'):
@@ -184,9 +182,7 @@ class FlowPreviewer:
         
         for flow_id in flows:
             try:
-                flow_path = self.flows_dir / f"{flow_id}.yml"
-                with open(flow_path, 'r') as f:
-                    flow_def = yaml.safe_load(f)
+                flow_def = self.flow_engine.load_flow(flow_id)
                 
                 title = flow_def.get('title', flow_id)
                 description = flow_def.get('description', 'No description')
@@ -236,9 +232,7 @@ class FlowPreviewer:
                 flow_id = self.ui.select("Select flow:", flows)
                 # Load flow to get steps
                 try:
-                    flow_path = self.flows_dir / f"{flow_id}.yml"
-                    with open(flow_path, 'r') as f:
-                        flow_def = yaml.safe_load(f)
+                    flow_def = self.flow_engine.load_flow(flow_id)
                     
                     steps = flow_def.get('steps', [])
                     if not steps:
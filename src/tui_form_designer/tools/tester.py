@@ -7,7 +7,7 @@ Test flow execution with mock responses and validation.
 import json
 from pathlib import Path
 import sys
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 import argparse
 
 from ..core.flow_engine import FlowEngine
@@ -78,16 +78,12 @@ class FlowTester:
             
             try:
                 # Just validate the flow without executing
-                flow_path = self.flows_dir / f"{flow_id}.yml"
-                import yaml
-                with open(flow_path, 'r') as f:
-                    flow_def = yaml.safe_load(f)
+                flow_def = self.flow_engine.load_flow(flow_id)
                 
                 errors = self.flow_engine.validate_flow(flow_def)
                 if errors:
                     self.ui.show_error(f"❌ {flow_id}: Validation failed")
-                    for error in errors:
-                        self.ui.show_step(f"• {error}")
+                    self.ui.show_steps([f"• {error}" for error in errors])
                     all_passed = False
                 else:
                     self.ui.show_success(f"✅ {flow_id}: Valid")
@@ -146,13 +142,16 @@ class FlowTester:
             elif action == "Exit":
                 break
     
-    def generate_mock_template(self, flow_id: str):
-        """Generate a mock response template for a flow."""
+    def generate_mock_template(
+        self, flow_id: str, output_dir: Optional[Union[str, Path]] = None
+    ):
+        """Generate a mock response template for a flow.
+
+        The template is written to output_dir, or the current directory if
+        none is given.
+        """
         try:
-            flow_path = self.flows_dir / f"{flow_id}.yml"
-            import yaml
-            with open(flow_path, 'r') as f:
-                flow_def = yaml.safe_load(f)
+            flow_def = self.flow_engine.load_flow(flow_id)
             
             mock_template = {}
             for step in flow_def.get('steps', []):
@@ -179,7 +178,7 @@ class FlowTester:
                     mock_template[step_id] = "sample_value"
             
             # Save template
-            template_file = f"{flow_id}_mock_template.json"
+            template_file = Path(output_dir or ".") / f"{flow_id}_mock_template.json"
             with open(template_file, 'w') as f:
                 json.dump(mock_template, f, indent=2)
             
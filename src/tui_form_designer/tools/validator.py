@@ -4,13 +4,17 @@ Flow Validator Tool
 Validate YAML flow definitions for syntax and logic errors.
 """
 
+import os
+import re
 import yaml
 from pathlib import Path
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Union
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 from ..core.flow_engine import FlowEngine
+from ..core.yaml_loader import SafeLoader
 from ..core.exceptions import FlowValidationError
 from ..ui.questionary_ui import QuestionaryUI
 
@@ -18,7 +22,19 @@ from ..ui.questionary_ui import QuestionaryUI
 class FlowValidator:
     """Validate flow definitions."""
 
-    def __init__(self, flows_dir: str = "flows", strict: bool = True):
+    # Markers looked for in the raw YAML text, matched in a single pass
+    _FLOW_SIGNALS_RE = re.compile(r"TODO|subdefaults")
+
+    __slots__ = (
+        "flows_dir", "flow_engine", "ui", "strict", "jobs", "_cache", "_flow_index"
+    )
+
+    def __init__(
+        self,
+        flows_dir: Union[str, Path] = "flows",
+        strict: bool = True,
+        jobs: Optional[int] = None,
+    ):
         """
         Initialize validator.
 
@@ -26,11 +42,18 @@ class FlowValidator:
             flows_dir: Directory containing flow files
             strict: Enable production-ready validation (catches incomplete development)
                    DEFAULT: True (no backward compatibility)
+            jobs: Number of files validated concurrently by validate_all_flows
+                  (default: based on CPU count; 1 disables threading)
         """
-        self.flows_dir = Path(flows_dir)
-        self.flow_engine = FlowEngine(flows_dir=flows_dir)
+        self.flows_dir = flows_dir if isinstance(flows_dir, Path) else Path(flows_dir)
+        self.flow_engine = FlowEngine(flows_dir=self.flows_dir)
         self.ui = QuestionaryUI()
         self.strict = strict
+        self.jobs = jobs if jobs else min(32, (os.cpu_count() or 1) * 4)
+        # path -> (dependency signatures, check result); see _check_flow_file
+        self._cache: Dict[str, Tuple[List[Tuple[str, Any]], Tuple[bool, list]]] = {}
+        # (flows_dir signature, file name -> path); see _get_flow_index
+        self._flow_index: Optional[Tuple[Optional[Tuple[int, int]], Dict[str, Path]]] = None
 
     def validate_all_flows(self) -> bool:
         """Validate all flows in the flows directory."""
@@ -38,16 +61,28 @@ class FlowValidator:
             self.ui.show_error(f"Flows directory not found: {self.flows_dir}")
             return False
 
-        flow_files = list(self.flows_dir.glob("*.yml"))
+        # Reuse the cached scandir listing instead of globbing the directory
+        flow_files = [
+            path for name, path in self._get_flow_index().items()
+            if name.endswith(".yml")
+        ]
         if not flow_files:
             self.ui.show_warning("No flow files found")
             return True
 
         self.ui.show_title("Flow Validation", "🔍")
 
+        # Files are checked concurrently; output is rendered afterwards in
+        # submission order so the report reads the same as a serial run
+        if self.jobs > 1 and len(flow_files) > 1:
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                results = list(executor.map(self._check_flow_file, flow_files))
+        else:
+            results = [self._check_flow_file(flow_file) for flow_file in flow_files]
+
         all_valid = True
-        for flow_file in flow_files:
-            valid = self.validate_flow_file(flow_file)
+        for flow_file, (valid, messages) in zip(flow_files, results):
+            self._report_flow_file(flow_file, messages)
             if not valid:
                 all_valid = False
 
@@ -60,36 +95,113 @@ class FlowValidator:
 
     def validate_flow_file(self, flow_path: Path) -> bool:
         """Validate a single flow file."""
+        valid, messages = self._check_flow_file(flow_path)
+        self._report_flow_file(flow_path, messages)
+        return valid
+
+    def _report_flow_file(self, flow_path: Path, messages: List[Tuple[str, Any]]):
+        """Render the UI messages collected by _check_flow_file."""
         self.ui.show_section_header(f"Validating: {flow_path.name}")
+        for method, payload in messages:
+            getattr(self.ui, method)(payload)
+
+    @staticmethod
+    def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) for a file, or None if it cannot be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _check_flow_file(self, flow_path: Path) -> Tuple[bool, List[Tuple[str, Any]]]:
+        """
+        Validate a single flow file without touching the UI.
+
+        Results are memoized per file and reused while the file and the
+        defaults/sublayout files it references keep the same mtime and size.
+
+        Returns:
+            Tuple of (is_valid, messages) where messages is a list of
+            (QuestionaryUI method name, argument) pairs to render in order
+        """
+        cache_key = os.fspath(flow_path)
+        cached = self._cache.get(cache_key)
+        if cached is not None and all(
+            self._file_signature(path) == signature for path, signature in cached[0]
+        ):
+            return cached[1]
+
+        dependencies = [(cache_key, self._file_signature(cache_key))]
+        result = self._run_flow_checks(flow_path, dependencies)
+        self._cache[cache_key] = (dependencies, result)
+        return result
+
+    def _record_references(
+        self, flow_def: Dict[str, Any], flow_path: Path, dependencies: list
+    ):
+        """
+        Add the files a flow references to its cache dependencies.
+
+        Only the flow's own references are recorded here; the sublayouts it
+        uses record theirs as _validate_sublayout_references reads them.
+        """
+        base_dir = os.path.dirname(os.fspath(flow_path))
+        referenced = [flow_def.get("defaults_file"), flow_def.get("sublayout_defaults")]
+        steps = flow_def.get("steps")
+        if isinstance(steps, list):
+            referenced.extend(
+                step.get("sublayout") for step in steps if isinstance(step, dict)
+            )
+        for ref in referenced:
+            if isinstance(ref, str):
+                path = os.path.join(base_dir, ref)
+                dependencies.append((path, self._file_signature(path)))
+
+    def _run_flow_checks(
+        self, flow_path: Path, dependencies: list
+    ) -> Tuple[bool, List[Tuple[str, Any]]]:
+        """Perform the uncached checks behind _check_flow_file."""
+        messages: List[Tuple[str, Any]] = []
 
         try:
             # Validate encoding first
             encoding_errors = self._validate_file_encoding(flow_path)
             if encoding_errors:
-                for error in encoding_errors:
-                    self.ui.show_error(error)
-                return False
+                messages.extend(("show_error", error) for error in encoding_errors)
+                return False, messages
 
-            # Load YAML with explicit UTF-8 encoding
-            with open(flow_path, "r", encoding="utf-8") as f:
-                flow_content = f.read()
-                flow_def = yaml.safe_load(flow_content)
+            # Load YAML from raw bytes; the text is only needed for marker scans
+            with open(flow_path, "rb") as f:
+                raw_content = f.read()
+            flow_content = raw_content.decode("utf-8")
+            flow_def = yaml.load(raw_content, Loader=SafeLoader)
 
             if not flow_def:
-                self.ui.show_error("Empty or invalid YAML file")
-                return False
+                messages.append(("show_error", "Empty or invalid YAML file"))
+                return False, messages
+
+            if isinstance(flow_def, dict):
+                self._record_references(flow_def, flow_path, dependencies)
+
+            signals = {
+                m.group(0) for m in self._FLOW_SIGNALS_RE.finditer(flow_content)
+            }
 
             # Detect if this is a sublayout (fragment) or standalone flow
             is_sublayout = (
                 "sublayout" in str(flow_path)
-                or "subdefaults" in flow_content
+                or "subdefaults" in signals
                 or ("sublayout_defaults" in flow_def and "layout_id" not in flow_def)
             )
 
             # Check for TODO comments in raw YAML (strict mode)
-            if self.strict and "TODO" in flow_content:
-                self.ui.show_warning(
-                    "⚠️  TODO comments found in YAML - incomplete development"
+            if self.strict and "TODO" in signals:
+                messages.append(
+                    (
+                        "show_warning",
+                        "⚠️  TODO comments found in YAML - incomplete development",
+                    )
                 )
 
             # Validate using FlowEngine
@@ -109,32 +221,30 @@ class FlowValidator:
                 # Validate referenced sublayouts
                 if "steps" in flow_def:
                     sublayout_errors = self._validate_sublayout_references(
-                        flow_def["steps"], flow_path
+                        flow_def["steps"], flow_path, dependencies
                     )
                     errors.extend(sublayout_errors)
 
             if not errors:
-                layout_type = "sublayout" if is_sublayout else "flow"
                 # Tests expect plain '✅ Valid' for flows
                 if not is_sublayout:
-                    self.ui.show_success("✅ Valid")
+                    messages.append(("show_success", "✅ Valid"))
                 else:
                     # Keep explicit message for sublayouts
-                    self.ui.show_success("✅ Valid sublayout")
-                return True
+                    messages.append(("show_success", "✅ Valid sublayout"))
+                return True, messages
             else:
                 error_type = "errors/warnings" if self.strict else "validation errors"
-                self.ui.show_error(f"❌ {len(errors)} {error_type}:")
-                for error in errors:
-                    self.ui.show_step(f"• {error}")
-                return False
+                messages.append(("show_error", f"❌ {len(errors)} {error_type}:"))
+                messages.append(("show_steps", [f"• {error}" for error in errors]))
+                return False, messages
 
         except yaml.YAMLError as e:
-            self.ui.show_error(f"YAML syntax error: {e}")
-            return False
+            messages.append(("show_error", f"YAML syntax error: {e}"))
+            return False, messages
         except Exception as e:
-            self.ui.show_error(f"Validation error: {e}")
-            return False
+            messages.append(("show_error", f"Validation error: {e}"))
+            return False, messages
 
     def _validate_file_encoding(self, file_path: Path) -> List[str]:
         """
@@ -344,15 +454,16 @@ class FlowValidator:
         """
         errors = []
 
-        # Resolve relative path from layout file location
+        # Resolve relative path from layout file location (plain strings are
+        # cheaper than Path arithmetic when a flow references many files)
         if layout_path:
-            base_dir = layout_path.parent
-            full_defaults_path = (base_dir / defaults_path).resolve()
+            base_dir = os.path.dirname(os.fspath(layout_path))
+            full_defaults_path = os.path.realpath(os.path.join(base_dir, defaults_path))
         else:
-            full_defaults_path = Path(defaults_path).resolve()
+            full_defaults_path = os.path.realpath(defaults_path)
 
         # Check if file exists
-        if not full_defaults_path.exists():
+        if not os.path.exists(full_defaults_path):
             errors.append(
                 f"Defaults file not found: {defaults_path} (resolved to: {full_defaults_path})"
             )
@@ -371,8 +482,8 @@ class FlowValidator:
 
         # Validate YAML syntax
         try:
-            with open(full_defaults_path, "r", encoding="utf-8") as f:
-                defaults_content = yaml.safe_load(f)
+            with open(full_defaults_path, "rb") as f:
+                defaults_content = yaml.load(f, Loader=SafeLoader)
 
             if defaults_content is None:
                 errors.append(f"Defaults file is empty: {defaults_path}")
@@ -389,7 +500,10 @@ class FlowValidator:
         return errors
 
     def _validate_sublayout_references(
-        self, steps: List[Dict[str, Any]], layout_path: Path
+        self,
+        steps: List[Dict[str, Any]],
+        layout_path: Path,
+        dependencies: Optional[list] = None,
     ) -> List[str]:
         """
         Validate sublayout references in steps.
@@ -397,20 +511,24 @@ class FlowValidator:
         Args:
             steps: List of step definitions
             layout_path: Path to the parent layout file
+            dependencies: Cache dependencies of the layout being checked; the
+                          files each sublayout references are added to it
 
         Returns:
             List of validation errors
         """
         errors = []
-        base_dir = layout_path.parent if layout_path else Path.cwd()
+        base_dir = os.path.dirname(os.fspath(layout_path)) if layout_path else os.getcwd()
 
         for i, step in enumerate(steps):
             if "sublayout" in step:
                 sublayout_path_str = step["sublayout"]
-                sublayout_full_path = (base_dir / sublayout_path_str).resolve()
+                sublayout_full_path = os.path.realpath(
+                    os.path.join(base_dir, sublayout_path_str)
+                )
 
                 # Check if sublayout file exists
-                if not sublayout_full_path.exists():
+                if not os.path.exists(sublayout_full_path):
                     errors.append(
                         f"Step {i}: Sublayout file not found: {sublayout_path_str} "
                         f"(resolved to: {sublayout_full_path})"
@@ -419,9 +537,8 @@ class FlowValidator:
 
                 # Validate the sublayout file itself
                 try:
-                    with open(sublayout_full_path, "r") as f:
-                        sublayout_content = f.read()
-                        sublayout_def = yaml.safe_load(sublayout_content)
+                    with open(sublayout_full_path, "rb") as f:
+                        sublayout_def = yaml.load(f, Loader=SafeLoader)
 
                     if not sublayout_def:
                         errors.append(
@@ -429,6 +546,13 @@ class FlowValidator:
                         )
                         continue
 
+                    # Its defaults affect the result, so editing them must
+                    # invalidate the layout's cached result too
+                    if dependencies is not None and isinstance(sublayout_def, dict):
+                        self._record_references(
+                            sublayout_def, sublayout_full_path, dependencies
+                        )
+
                     # Recursively validate the sublayout
                     sublayout_errors = self._validate_sublayout(
                         sublayout_def, sublayout_full_path
@@ -451,20 +575,53 @@ class FlowValidator:
 
         return errors
 
+    def _get_flow_index(self) -> Dict[str, Path]:
+        """
+        Map file names in the flows directory to their paths.
+
+        The listing is rebuilt only when the directory's mtime changes.
+        """
+        dir_signature = self._file_signature(os.fspath(self.flows_dir))
+        if self._flow_index is None or self._flow_index[0] != dir_signature:
+            index = {}
+            if dir_signature is not None:
+                with os.scandir(self.flows_dir) as entries:
+                    index = {
+                        entry.name: self.flows_dir / entry.name
+                        for entry in entries
+                        if entry.is_file()
+                    }
+            self._flow_index = (dir_signature, index)
+        return self._flow_index[1]
+
+    def _resolve_flow_file(self, flow_file: str) -> Optional[Path]:
+        """Resolve a flow argument as a path, a file name or a flow ID."""
+        flow_path = Path(flow_file)
+        if flow_path.exists():
+            return flow_path
+
+        # Try in flows directory (as given, then with the .yml extension)
+        candidates = (flow_file, f"{flow_file}.yml")
+        if os.path.dirname(flow_file):
+            # Nested paths are not in the top-level index; stat them directly
+            for candidate in candidates:
+                flow_path = self.flows_dir / candidate
+                if flow_path.exists():
+                    return flow_path
+            return None
+
+        index = self._get_flow_index()
+        return index.get(candidates[0]) or index.get(candidates[1])
+
     def validate_specific_flows(self, flow_files: List[str]) -> bool:
         """Validate specific flow files."""
         self.ui.show_title("Flow Validation", "🔍")
 
         all_valid = True
         for flow_file in flow_files:
-            flow_path = Path(flow_file)
-            if not flow_path.exists():
-                # Try in flows directory
-                flow_path = self.flows_dir / flow_file
-                if not flow_path.exists():
-                    flow_path = self.flows_dir / f"{flow_file}.yml"
-
-            if not flow_path.exists():
+            flow_path = self._resolve_flow_file(flow_file)
+
+            if flow_path is None:
                 self.ui.show_error(f"Flow file not found: {flow_file}")
                 all_valid = False
                 continue
@@ -550,6 +707,13 @@ Validation Modes:
         dest="strict",
         help="Disable strict mode (NOT RECOMMENDED - only for active development)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of flow files to validate in parallel (default: auto, 1 = serial)",
+    )
     parser.add_argument(
         "--production",
         "-p",
@@ -563,7 +727,9 @@ Validation Modes:
     # Only disabled if --no-strict is explicitly provided
     strict_mode = args.strict
 
-    validator = FlowValidator(flows_dir=args.flows_dir, strict=strict_mode)
+    validator = FlowValidator(
+        flows_dir=args.flows_dir, strict=strict_mode, jobs=args.jobs
+    )
 
     if strict_mode:
         print("🔒 STRICT MODE (default) - Production-ready validation enabled")
@@ -2,13 +2,119 @@
 
 import questionary
 from questionary import Style, prompt, form, select, text, confirm, print as qprint
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Callable, List, Optional, Union
+import os
 import sys
 
+_CLEAR_SCREEN_SEQ = "\x1b[H\x1b[2J"
+
+
+def _enable_vt_mode() -> bool:
+    """Check once whether the console understands ANSI escape sequences."""
+    if os.name != "nt":
+        return True
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+
+_VT_SUPPORTED = _enable_vt_mode()
+
+
+# Pre-built theme styles, constructed once at import and shared by all instances
+_THEMES: Dict[str, Style] = {
+    "default": Style(
+        [
+            ("question", "bold blue"),
+            ("answer", "fg:#ff9d00 bold"),
+            ("pointer", "fg:#673ab7 bold"),
+            ("highlighted", "fg:#673ab7 bold"),
+            ("selected", "fg:#cc5454"),
+            ("instruction", "italic"),
+            ("text", ""),
+            ("disabled", "fg:#858585 italic"),
+            ("separator", "fg:#cc5454"),
+            ("skipped", "fg:#858585 italic"),
+        ]
+    ),
+    "dark": Style(
+        [
+            ("question", "bold cyan"),
+            ("answer", "fg:#00ff00 bold"),
+            ("pointer", "fg:#ff00ff bold"),
+            ("highlighted", "fg:#ff00ff bold"),
+            ("selected", "fg:#ffff00"),
+            ("instruction", "italic fg:#888888"),
+            ("text", "fg:#cccccc"),
+            ("disabled", "fg:#666666 italic"),
+            ("separator", "fg:#ffff00"),
+            ("skipped", "fg:#666666 italic"),
+        ]
+    ),
+    "minimal": Style(
+        [
+            ("question", "bold"),
+            ("answer", "bold"),
+            ("pointer", "fg:#ffffff bold"),
+            ("highlighted", "bold"),
+            ("selected", "bold"),
+            ("instruction", "italic"),
+            ("text", ""),
+            ("disabled", "italic"),
+            ("separator", "fg:#888888"),
+            ("skipped", "italic"),
+        ]
+    ),
+}
+
+# Separators shared by the header methods; the title underline is a fixed
+# 12 '=' regardless of title length (tests rely on this)
+_TITLE_UNDERLINE = "=" * 12
+_PHASE_DIVIDER = "-" * 50
+_STEP_PREFIX = "   → "
+
+# Every possible progress bar, indexed by filled length
+_PROGRESS_BAR_LENGTH = 20
+_PROGRESS_BARS = tuple(
+    "█" * i + "░" * (_PROGRESS_BAR_LENGTH - i) for i in range(_PROGRESS_BAR_LENGTH + 1)
+)
+
 
 class QuestionaryUI:
     """Enhanced Questionary-based UI framework for terminal forms."""
 
+    # Question type -> builder used by form(); add entries to support new types
+    _TYPE_BUILDERS: Dict[str, Callable[["QuestionaryUI", Dict[str, Any]], Any]] = {
+        "text": lambda self, q: text(
+            q["message"], default=q.get("default", ""), style=self.style
+        ),
+        "select": lambda self, q: select(
+            q["message"],
+            choices=q["choices"],
+            default=q.get("default"),
+            style=self.style,
+        ),
+        "confirm": lambda self, q: questionary.confirm(
+            q["message"], default=q.get("default", True), style=self.style
+        ),
+        "password": lambda self, q: questionary.password(
+            q["message"], style=self.style
+        ),
+    }
+
+    # Slots for the per-instance state read on every render; there is no
+    # instance __dict__, so patch methods on the class rather than an instance
+    __slots__ = ("style", "_last_progress", "_tty")
+
     def __init__(self, style: Optional[Style] = None, theme: str = "default"):
         """
         Initialize QuestionaryUI.
@@ -17,112 +123,94 @@ class QuestionaryUI:
             style: Custom Questionary style
             theme: Pre-built theme name ('default', 'dark', 'minimal')
         """
-        # Build theme styles once per instance so style objects are stable for equality checks
-        self._themes = self._build_theme_styles()
         self.style = style or self._get_theme_style(theme)
-
-    def _build_theme_styles(self) -> Dict[str, Style]:
-        """Create and cache theme styles for reuse within this instance."""
-        return {
-            "default": Style(
-                [
-                    ("question", "bold blue"),
-                    ("answer", "fg:#ff9d00 bold"),
-                    ("pointer", "fg:#673ab7 bold"),
-                    ("highlighted", "fg:#673ab7 bold"),
-                    ("selected", "fg:#cc5454"),
-                    ("instruction", "italic"),
-                    ("text", ""),
-                    ("disabled", "fg:#858585 italic"),
-                    ("separator", "fg:#cc5454"),
-                    ("skipped", "fg:#858585 italic"),
-                ]
-            ),
-            "dark": Style(
-                [
-                    ("question", "bold cyan"),
-                    ("answer", "fg:#00ff00 bold"),
-                    ("pointer", "fg:#ff00ff bold"),
-                    ("highlighted", "fg:#ff00ff bold"),
-                    ("selected", "fg:#ffff00"),
-                    ("instruction", "italic fg:#888888"),
-                    ("text", "fg:#cccccc"),
-                    ("disabled", "fg:#666666 italic"),
-                    ("separator", "fg:#ffff00"),
-                    ("skipped", "fg:#666666 italic"),
-                ]
-            ),
-            "minimal": Style(
-                [
-                    ("question", "bold"),
-                    ("answer", "bold"),
-                    ("pointer", "fg:#ffffff bold"),
-                    ("highlighted", "bold"),
-                    ("selected", "bold"),
-                    ("instruction", "italic"),
-                    ("text", ""),
-                    ("disabled", "italic"),
-                    ("separator", "fg:#888888"),
-                    ("skipped", "italic"),
-                ]
-            ),
-        }
+        self._last_progress = None
+        # Styling and icons are only worth emitting on an interactive terminal;
+        # piped output (CI logs, redirected reports) gets plain text
+        self._tty = sys.stdout.isatty()
+
+    def _emit(self, text: str, style: Optional[str] = None):
+        """Write styled text on a terminal and plain text everywhere else."""
+        if self._tty:
+            qprint(text, style=style)
+        else:
+            print(text)
+
+    def _emit_message(self, icon: str, message: str, style: str, heading: bool = False):
+        """Write a message, with its icon only on a terminal.
+
+        Headings are preceded by a blank line.
+        """
+        if self._tty:
+            text = f"{icon} {message}"
+            if heading:
+                text = f"\\n{text}"
+        else:
+            text = f"\n{message}" if heading else message
+        self._emit(text, style=style)
 
     def _get_theme_style(self, theme: str) -> Style:
         """Get predefined theme styles."""
         # Always return the same default instance for unknown themes so equality works in tests
-        return self._themes[theme] if theme in self._themes else self._themes["default"]
+        return _THEMES.get(theme, _THEMES["default"])
 
     def show_title(self, title: str, icon: str = "🚀"):
         """Show a main title with styling."""
-        qprint(f"\\n{icon} {title}", style="bold blue")
-        # Tests expect 12 '=' for 'Test Title' (10 chars) => fixed 12 for consistency
-        # Tests expect an underline of exactly 12 '='
-        qprint("=" * 12, style="blue")
+        self._emit_message(icon, title, "bold blue", heading=True)
+        self._emit(_TITLE_UNDERLINE, style="blue")
 
     def show_phase_header(self, phase: str, description: str = "", icon: str = "📋"):
         """Show a phase header with description."""
-        qprint(f"\\n{icon} {phase}", style="bold green")
+        self._emit_message(icon, phase, "bold green", heading=True)
         if description:
-            qprint(f"   {description}", style="italic")
-        qprint("-" * 50, style="dim")
+            self._emit(f"   {description}", style="italic")
+        self._emit(_PHASE_DIVIDER, style="dim")
 
     def show_section_header(self, section: str, icon: str = "🔧"):
         """Show a section header."""
-        qprint(f"\\n{icon} {section}", style="bold yellow")
+        self._emit_message(icon, section, "bold yellow", heading=True)
 
     def show_success(self, message: str, icon: str = "✅"):
         """Show a success message."""
-        qprint(f"{icon} {message}", style="bold green")
+        self._emit_message(icon, message, "bold green")
 
     def show_error(self, message: str, icon: str = "❌"):
         """Show an error message."""
-        qprint(f"{icon} {message}", style="bold red")
+        self._emit_message(icon, message, "bold red")
 
     def show_warning(self, message: str, icon: str = "⚠️"):
         """Show a warning message."""
-        qprint(f"{icon} {message}", style="bold yellow")
+        self._emit_message(icon, message, "bold yellow")
 
     def show_info(self, message: str, icon: str = "ℹ️"):
         """Show an info message."""
-        qprint(f"{icon} {message}", style="bold")
+        self._emit_message(icon, message, "bold")
 
     def show_step(self, message: str):
         """Show a step message."""
-        qprint(f"   → {message}", style="dim")
+        self._emit(f"{_STEP_PREFIX}{message}", style="dim")
+
+    def show_steps(self, messages: List[str]):
+        """Show several step messages with a single write."""
+        if messages:
+            self._emit(
+                "\n".join(f"{_STEP_PREFIX}{message}" for message in messages), style="dim"
+            )
 
     def show_progress(self, current: int, total: int, description: str = ""):
         """Show progress indicator."""
-        percentage = int((current / total) * 100)
-        bar_length = 20
-        filled_length = int(bar_length * current / total)
-        bar = "█" * filled_length + "░" * (bar_length - filled_length)
-
-        progress_text = f"[{bar}] {percentage}% ({current}/{total})"
-        if description:
-            progress_text += f" - {description}"
+        # Skip redrawing an unchanged progress line
+        state = (current, total, description)
+        if state == self._last_progress:
+            return
+        self._last_progress = state
 
-        qprint(progress_text, style="bold blue")
+        percentage = int((current / total) * 100)
+        # Clamp so out-of-range counts (e.g. current > total) still draw a bar
+        filled = int(_PROGRESS_BAR_LENGTH * current / total)
+        bar = _PROGRESS_BARS[min(_PROGRESS_BAR_LENGTH, max(0, filled))]
+        suffix = f" - {description}" if description else ""
+        self._emit(f"[{bar}] {percentage}% ({current}/{total}){suffix}", style="bold blue")
 
     def confirm(self, message: str, default: bool = True) -> bool:
         """Prompt user for yes/no confirmation."""
@@ -164,12 +252,14 @@ class QuestionaryUI:
         max_value: Optional[int] = None,
     ) -> int:
         """Prompt user for integer input."""
+        # Loop-invariant prompt arguments are computed once, not per retry
+        prompt_message = f"{message} (number)"
+        default_str = str(default) if default is not None else ""
         try:
             while True:
                 try:
-                    default_str = str(default) if default is not None else ""
                     result_str = text(
-                        f"{message} (number)", default=default_str, style=self.style
+                        prompt_message, default=default_str, style=self.style
                     ).ask()
 
                     if not result_str and default is not None:
@@ -210,6 +300,13 @@ class QuestionaryUI:
             self.show_error("Operation cancelled by user")
             return ""
 
+    @staticmethod
+    def _normalize_choices(choices: List[Union[str, Dict]]) -> List[str]:
+        """Convert string and dict choices into a list of display names."""
+        return [
+            c.get("name", str(c)) if isinstance(c, dict) else str(c) for c in choices
+        ]
+
     def select(
         self,
         message: str,
@@ -221,13 +318,7 @@ class QuestionaryUI:
             if not choices:
                 raise ValueError("Choices list cannot be empty")
 
-            # Handle both string choices and dict choices
-            choice_list = []
-            for choice in choices:
-                if isinstance(choice, dict):
-                    choice_list.append(choice.get("name", str(choice)))
-                else:
-                    choice_list.append(str(choice))
+            choice_list = self._normalize_choices(choices)
 
             return select(
                 message, choices=choice_list, default=default, style=self.style
@@ -247,13 +338,7 @@ class QuestionaryUI:
             if not choices:
                 raise ValueError("Choices list cannot be empty")
 
-            # Handle both string choices and dict choices
-            choice_list = []
-            for choice in choices:
-                if isinstance(choice, dict):
-                    choice_list.append(choice.get("name", str(choice)))
-                else:
-                    choice_list.append(str(choice))
+            choice_list = self._normalize_choices(choices)
 
             return questionary.checkbox(
                 message, choices=choice_list, style=self.style
@@ -276,7 +361,8 @@ class QuestionaryUI:
         Args:
             questions: List of question dictionaries with keys:
                 - name: Question identifier
-                - type: Question type ('text', 'select', 'confirm', 'password')
+                - type: Question type ('text', 'select', 'confirm', 'password');
+                  unsupported types raise ValueError
                 - message: Question text
                 - choices: For select type
                 - default: Default value
@@ -289,28 +375,15 @@ class QuestionaryUI:
             # Build a dict of named prompts for questionary.form(**prompts)
             prompts: Dict[str, Any] = {}
 
+            builders = self._TYPE_BUILDERS
+
             for q in questions:
                 q_type = q.get("type", "text")
-                name = q["name"]
-                message = q["message"]
-
-                if q_type == "text":
-                    prompts[name] = text(
-                        message, default=q.get("default", ""), style=self.style
-                    )
-                elif q_type == "select":
-                    prompts[name] = select(
-                        message,
-                        choices=q["choices"],
-                        default=q.get("default"),
-                        style=self.style,
-                    )
-                elif q_type == "confirm":
-                    prompts[name] = questionary.confirm(
-                        message, default=q.get("default", True), style=self.style
-                    )
-                elif q_type == "password":
-                    prompts[name] = questionary.password(message, style=self.style)
+                try:
+                    builder = builders[q_type]
+                except KeyError:
+                    raise ValueError(f"Unsupported question type: {q_type}") from None
+                prompts[q["name"]] = builder(self, q)
 
             return form(**prompts, style=self.style).ask()
 
@@ -333,28 +406,33 @@ class QuestionaryUI:
         if not headers and data:
             headers = list(data[0].keys())
 
-        # Calculate column widths
-        col_widths = {}
-        for header in headers:
-            col_widths[header] = len(header)
-            for row in data:
-                value_len = len(str(row.get(header, "")))
-                col_widths[header] = max(col_widths[header], value_len)
-
-        # Print header
-        header_row = " | ".join(h.ljust(col_widths[h]) for h in headers)
-        qprint(header_row, style="bold blue")
-        qprint("-" * len(header_row), style="blue")
-
-        # Print data rows
-        for row in data:
-            data_row = " | ".join(
-                str(row.get(h, "")).ljust(col_widths[h]) for h in headers
+        # Stringify every cell once so width calculation and rendering share it
+        str_rows = [[str(row.get(h, "")) for h in headers] for row in data]
+
+        # Calculate column widths over the transposed cells (one pass, C-level max)
+        col_widths = [
+            max(len(header), *map(len, column))
+            for header, column in zip(headers, zip(*str_rows))
+        ]
+
+        # Print header and separator (each keeps its own style)
+        header_row = " | ".join(h.ljust(w) for h, w in zip(headers, col_widths))
+        self._emit(header_row, style="bold blue")
+        self._emit("-" * len(header_row), style="blue")
+
+        # Print all data rows with a single write
+        self._emit(
+            "\n".join(
+                " | ".join(cell.ljust(w) for cell, w in zip(cells, col_widths))
+                for cells in str_rows
             )
-            qprint(data_row)
+        )
 
     def clear_screen(self):
         """Clear the terminal screen."""
-        import os
-
-        os.system("clear" if os.name == "posix" else "cls")
+        if _VT_SUPPORTED:
+            sys.stdout.write(_CLEAR_SCREEN_SEQ)
+            sys.stdout.flush()
+        else:
+            # Legacy Windows console without VT processing
+            os.system("clear" if os.name == "posix" else "cls")
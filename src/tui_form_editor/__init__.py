@@ -19,11 +19,31 @@ __email__ = "support@openproject.org"
 # Import engine components
 from tui_form_engine import FlowEngine, QuestionaryUI, FlowValidationError, FlowExecutionError
 
-# Import editor-specific tools
-from .tools.designer import InteractiveFlowDesigner
-from .tools.validator import FlowValidator
-from .tools.tester import FlowTester
-from .tools.preview import FlowPreviewer
+# Editor-specific tools are imported on first access (PEP 562) so that CLI
+# commands only pay for the tool they actually run
+_LAZY_IMPORTS = {
+    "InteractiveFlowDesigner": ("tui_form_editor.tools.designer", "InteractiveFlowDesigner"),
+    "FlowValidator": ("tui_form_editor.tools.validator", "FlowValidator"),
+    "FlowTester": ("tui_form_editor.tools.tester", "FlowTester"),
+    "FlowPreviewer": ("tui_form_editor.tools.preview", "FlowPreviewer"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Engine components (re-exported)
@@ -221,8 +221,7 @@ class InteractiveFlowDesigner:
                 self.ui.show_success(f"Flow '{flow_id}' is valid! ✨")
             else:
                 self.ui.show_error(f"Flow '{flow_id}' has validation errors:")
-                for error in errors:
-                    self.ui.show_step(error)
+                self.ui.show_steps(errors)
         except Exception as e:
             self.ui.show_error(f"Failed to validate flow: {e}")
     
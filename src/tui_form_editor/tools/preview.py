@@ -61,10 +61,10 @@ class FlowPreviewer:
         errors = self.flow_engine.validate_flow(flow_def)
         if errors:
             self.ui.show_warning(f"Validation Issues: {len(errors)}")
-            for error in errors[:3]:  # Show first 3 errors
-                self.ui.show_step(f"• {error}")
+            lines = [f"• {error}" for error in errors[:3]]  # Show first 3 errors
             if len(errors) > 3:
-                self.ui.show_step(f"• ... and {len(errors) - 3} more")
+                lines.append(f"• ... and {len(errors) - 3} more")
+            self.ui.show_steps(lines)
         else:
             self.ui.show_success("✅ Flow is valid")
         
@@ -143,11 +143,10 @@ class FlowPreviewer:
         # Type-specific details
         if step.get('type') == 'select' and step.get('choices'):
             self.ui.show_section_header("Choices", "📋")
-            for i, choice in enumerate(step['choices'], 1):
-                if isinstance(choice, dict):
-                    self.ui.show_step(f"{i}. {choice.get('name', choice)}")
-                else:
-                    self.ui.show_step(f"{i}. {choice}")
+            self.ui.show_steps([
+                f"{i}. {choice.get('name', choice) if isinstance(choice, dict) else choice}"
+                for i, choice in enumerate(step['choices'], 1)
+            ])
         
         # Optional fields
         if step.get('default'):
@@ -86,8 +86,7 @@ class FlowTester:
                 errors = self.flow_engine.validate_flow(flow_def)
                 if errors:
                     self.ui.show_error(f"❌ {flow_id}: Validation failed")
-                    for error in errors:
-                        self.ui.show_step(f"• {error}")
+                    self.ui.show_steps([f"• {error}" for error in errors])
                     all_passed = False
                 else:
                     self.ui.show_success(f"✅ {flow_id}: Valid")
@@ -70,8 +70,7 @@ class FlowValidator:
                 return True
             else:
                 self.ui.show_error(f"❌ {len(errors)} validation errors:")
-                for error in errors:
-                    self.ui.show_step(f"• {error}")
+                self.ui.show_steps([f"• {error}" for error in errors])
                 return False
                 
         except yaml.YAMLError as e:
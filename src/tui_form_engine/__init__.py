@@ -11,7 +11,11 @@ __version__ = "1.0.0"
 __author__ = "OpenProject Team"
 __email__ = "support@openproject.org"
 
-from .core.form_executor import FormExecutor
+from .core.form_executor import (
+    FormExecutor,
+    # Backward compatibility alias
+    FormExecutor as FlowEngine,
+)
 from .ui.questionary_ui import QuestionaryUI
 from .core.exceptions import (
     FormValidationError, 
@@ -20,7 +24,29 @@ from .core.exceptions import (
     FlowValidationError,
     FlowExecutionError,
 )
-from .preprocessing import LayoutPreprocessor, DefaultsPreprocessor
+
+# Preprocessors are only needed for modular layouts; import them on first access
+_LAZY_IMPORTS = {
+    "LayoutPreprocessor": ("tui_form_engine.preprocessing", "LayoutPreprocessor"),
+    "DefaultsPreprocessor": ("tui_form_engine.preprocessing", "DefaultsPreprocessor"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 # Export new names
 __all__ = [
@@ -35,6 +61,3 @@ __all__ = [
     "FlowValidationError",
     "FlowExecutionError",
 ]
-
-# Backward compatibility alias
-FlowEngine = FormExecutor
\ No newline at end of file
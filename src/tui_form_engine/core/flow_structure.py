@@ -0,0 +1,98 @@
+"""
+Structural validation of flow definitions.
+
+Kept free of engine imports and fully annotated so the module can be compiled
+with mypyc (``mypyc src/tui_form_engine/core/flow_structure.py``); the
+resulting extension module shadows this file with no import changes.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
+
+# Marks a field that is absent, as opposed to present with a None value
+_MISSING: Any = object()
+
+
+def _step_label(step_id: Any) -> Any:
+    """The step name used in validation messages."""
+    return 'unnamed' if step_id is _MISSING else step_id
+
+
+def _choice_values(choices: Iterable[Any]) -> Iterator[Any]:
+    """Yield the selectable value of each choice (plain strings or dicts)."""
+    for choice in choices:
+        if isinstance(choice, str):
+            yield choice
+        elif isinstance(choice, dict):
+            # One lookup per key; the sentinel keeps falsy values (0, '') valid
+            value = choice.get('value', _MISSING)
+            if value is _MISSING:
+                value = choice.get('name', _MISSING)
+            if value is not _MISSING:
+                yield value
+
+
+def _default_in_choices(default: Any, choices: Iterable[Any]) -> bool:
+    """Whether a select step's default matches one of its choices."""
+    # Membership on the generator stops at the first match and builds nothing;
+    # for a single lookup that beats materializing a set of every choice
+    return default in _choice_values(choices)
+
+
+def scan_flow_structure(flow_def: Dict[str, Any]) -> Tuple[List[str], bool]:
+    """
+    Validate a flow's structure and detect sublayout references in one pass.
+
+    Args:
+        flow_def: The flow definition (main layout or merged virtual layout)
+
+    Returns:
+        (validation error messages, whether any step references a sublayout)
+    """
+    errors: List[str] = []
+    has_sublayouts = False
+
+    # Check required top-level fields
+    if 'title' not in flow_def:
+        errors.append("Missing required field: 'title'")
+
+    if 'steps' not in flow_def:
+        errors.append("Missing required field: 'steps'")
+    elif not isinstance(flow_def['steps'], list) or len(flow_def['steps']) == 0:
+        errors.append("'steps' must be a non-empty list")
+    else:
+        # Validate each step; each field is looked up once, and error
+        # messages are only formatted for steps that actually fail
+        step_ids: Set[Any] = set()
+        for i, step in enumerate(flow_def['steps'], 1):
+            if not isinstance(step, dict):
+                errors.append(f"Step {i}: Must be a dictionary")
+                continue
+
+            # Sublayouts are identified by having 'subid' and 'sublayout' fields
+            if not has_sublayouts and 'subid' in step and 'sublayout' in step:
+                has_sublayouts = True
+
+            step_id = step.get('id', _MISSING)
+            step_type = step.get('type', _MISSING)
+
+            if step_id is _MISSING:
+                errors.append(f"Step {i}: Missing required field 'id'")
+            elif step_id in step_ids:
+                errors.append(f"Step {i}: Duplicate step ID '{step_id}'")
+            else:
+                step_ids.add(step_id)
+
+            if step_type is _MISSING:
+                errors.append(f"Step {i} ({_step_label(step_id)}): Missing required field 'type'")
+
+            # Validate choice fields
+            elif step_type == 'select':
+                choices = step.get('choices', _MISSING)
+                default = step.get('default')
+                if choices is _MISSING:
+                    errors.append(f"Step {i} ({_step_label(step_id)}): Select type requires 'choices' field")
+                elif default is not None and not _default_in_choices(default, choices):
+                    valid_choices = list(_choice_values(choices))
+                    errors.append(f"Step {i} ({_step_label(step_id)}): Default value '{default}' not in choices {valid_choices}")
+
+    return errors, has_sublayouts
@@ -3,19 +3,196 @@
 import questionary
 from questionary import Style
 import yaml
-from typing import Dict, Any, Optional, List, Callable, Union
+from typing import Dict, Any, Optional, List, Callable, NamedTuple, Tuple, Union
 from pathlib import Path
+import copy
 import re
+import functools
+import json
+import os
 from .exceptions import FormValidationError, FormExecutionError
+from .yaml_loader import load_yaml
+
+
+# Compiled once at import; used by the built-in validators and _format_preview
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_DOMAIN_RE = re.compile(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PREVIEW_RE = re.compile(r'\{([^}]+)\}')
+
+
+def _required_validator(value: str) -> bool:
+    """Validate that value is not empty."""
+    if not value or not value.strip():
+        raise questionary.ValidationError(message="This field is required")
+    return True
+
+
+def _email_validator(value: str) -> bool:
+    """Validate email format."""
+    if not value:
+        return True  # Allow empty for optional fields
+    if not _EMAIL_RE.match(value):
+        raise questionary.ValidationError(message="Invalid email format")
+    return True
+
+
+def _domain_validator(value: str) -> bool:
+    """Validate domain format."""
+    if not value:
+        raise questionary.ValidationError(message="Domain cannot be empty")
+    if not _DOMAIN_RE.match(value):
+        raise questionary.ValidationError(message="Invalid domain format")
+    return True
+
+
+def _integer_validator(value: str) -> bool:
+    """Validate integer format."""
+    if not value:
+        return True  # Allow empty for optional fields
+    try:
+        int(value)
+        return True
+    except ValueError:
+        raise questionary.ValidationError(message="Must be a valid integer")
+
+
+def _password_length_validator(value: str) -> bool:
+    """Validate password length (minimum 8 characters)."""
+    if len(value) < 8:
+        raise questionary.ValidationError(message="Password must be at least 8 characters long")
+    return True
+
+
+@functools.lru_cache(maxsize=512)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted key path; cached since templates reuse the same keys."""
+    return tuple(key.split('.'))
+
+
+def _walk(data: Dict[str, Any], keys) -> Any:
+    """Follow keys through nested dicts; None if any key is missing."""
+    value = data
+    for k in keys:
+        if isinstance(value, dict) and k in value:
+            value = value[k]
+        else:
+            return None
+    return value
+
+
+def _compile_output_mapping(mapping: Dict[str, Any]) -> List[Tuple[Tuple[str, ...], Optional[str]]]:
+    """
+    Flatten an output mapping into (target path, source answer) pairs.
+    
+    Nested mappings appear before their children with a source of None, so a
+    single pass over the plan can create each nested dict and then fill it.
+    Entries that are neither a dict nor an answer name are dropped.
+    """
+    plan = []
+    stack = [((), iter(mapping.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            path = prefix + (key,)
+            if isinstance(value, dict):
+                plan.append((path, None))
+                stack.append((path, iter(value.items())))
+                break
+            if isinstance(value, str):
+                plan.append((path, value))
+        else:
+            stack.pop()
+    return plan
+
+
+# Built-in validators by name, shared by every FormExecutor
+_BUILTIN_VALIDATORS: Dict[str, Callable] = {
+    'required': _required_validator,
+    'email': _email_validator,
+    'domain': _domain_validator,
+    'integer': _integer_validator,
+    'password_length': _password_length_validator,
+}
+
+
+_REQUIRED_FLOW_FIELDS = ('flow_id', 'title', 'steps')
+_STEP_TYPES = frozenset({'text', 'select', 'confirm', 'password', 'computed'})
+
+# Pre-built themes, constructed once and shared by every FormExecutor
+_THEMES: Dict[str, Style] = {
+    "default": Style([
+        ('question', 'bold blue'),
+        ('answer', 'fg:#ff9d00 bold'),
+        ('pointer', 'fg:#673ab7 bold'),
+        ('highlighted', 'fg:#673ab7 bold'),
+        ('selected', 'fg:#cc5454'),
+        ('instruction', 'italic'),
+    ]),
+    "dark": Style([
+        ('question', 'bold cyan'),
+        ('answer', 'fg:#00ff00 bold'),
+        ('pointer', 'fg:#ff00ff bold'),
+        ('highlighted', 'fg:#ff00ff bold'),
+        ('selected', 'fg:#ffff00'),
+        ('instruction', 'italic fg:#888888'),
+    ]),
+    "minimal": Style([
+        ('question', 'bold'),
+        ('answer', 'bold'),
+        ('pointer', 'fg:#ffffff bold'),
+        ('highlighted', 'bold'),
+        ('selected', 'bold'),
+        ('instruction', 'italic'),
+    ]),
+}
+
+
+def _bind_question(prompt: Callable, *args, **kwargs) -> Callable[[Dict[str, Any]], Any]:
+    """Bind a questionary prompt's arguments into a question factory."""
+    bound = functools.partial(prompt, *args, **kwargs)
+    return lambda context: bound()
+
+
+def _file_signature(path: Path) -> Optional[List[int]]:
+    """Return [mtime_ns, size] for a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+class _StepPlan(NamedTuple):
+    """A flow step with its condition, computation and question prepared."""
+    id: str
+    computed: bool
+    compute: Optional[Callable[[Dict[str, Any]], Any]]
+    condition: Optional[Callable[[Dict[str, Any]], Any]]
+    ask: Optional[Callable[[Dict[str, Any]], Any]]
+    message: Any
+    preview: Optional[str]
+
+
+class _FlowPlan(NamedTuple):
+    """Everything execute_flow needs from a flow definition, prepared once."""
+    header: str
+    description: Optional[str]
+    steps: Tuple[_StepPlan, ...]
+    output_plan: Optional[List[Tuple[Tuple[str, ...], Optional[str]]]]
 
 
 class FormExecutor:
     """Execute YAML-defined forms using Questionary."""
     
+    __slots__ = (
+        'flows_dir', 'json_cache', 'style', 'validators', '_plan_cache', '_expr_cache'
+    )
+    
     def __init__(self, 
                  flows_dir: Optional[Union[str, Path]] = None,
                  style: Optional[Style] = None,
-                 theme: str = "default"):
+                 theme: str = "default",
+                 json_cache: bool = False):
         """
         Initialize FormExecutor.
         
@@ -23,50 +200,35 @@ class FormExecutor:
             flows_dir: Directory containing flow definition files
             style: Custom Questionary style
             theme: Pre-built theme name ('default', 'dark', 'minimal')
+            json_cache: Opt in to keeping a '<flow>.yml.json' sidecar of each
+                        loaded flow (defaults merged) in flows_dir and reusing it
+                        while its sources are unchanged; off by default so the
+                        flows directory is never written to unasked
         """
         self.flows_dir = Path(flows_dir or "flows")
+        self.json_cache = json_cache
         self.style = style or self._get_theme_style(theme)
         self.validators = self._load_validators()
+        # flow_id -> (flow definition, execution plan); see _get_flow_plan
+        self._plan_cache: Dict[str, Tuple[Dict[str, Any], _FlowPlan]] = {}
+        # expression -> compiled evaluator; see _evaluate_expression
+        self._expr_cache: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
     
     def _get_theme_style(self, theme: str) -> Style:
         """Get predefined theme styles."""
-        themes = {
-            "default": Style([
-                ('question', 'bold blue'),
-                ('answer', 'fg:#ff9d00 bold'),
-                ('pointer', 'fg:#673ab7 bold'),
-                ('highlighted', 'fg:#673ab7 bold'),
-                ('selected', 'fg:#cc5454'),
-                ('instruction', 'italic'),
-            ]),
-            "dark": Style([
-                ('question', 'bold cyan'),
-                ('answer', 'fg:#00ff00 bold'),
-                ('pointer', 'fg:#ff00ff bold'),
-                ('highlighted', 'fg:#ff00ff bold'),
-                ('selected', 'fg:#ffff00'),
-                ('instruction', 'italic fg:#888888'),
-            ]),
-            "minimal": Style([
-                ('question', 'bold'),
-                ('answer', 'bold'),
-                ('pointer', 'fg:#ffffff bold'),
-                ('highlighted', 'bold'),
-                ('selected', 'bold'),
-                ('instruction', 'italic'),
-            ])
-        }
-        return themes.get(theme, themes["default"])
+        return _THEMES.get(theme, _THEMES["default"])
     
     def get_available_flows(self) -> List[str]:
         """Get list of available flow IDs."""
-        if not self.flows_dir.exists():
+        # scandir entries carry the name and file type, so no per-file stat or Path
+        try:
+            with os.scandir(self.flows_dir) as entries:
+                return [
+                    entry.name[:-4] for entry in entries
+                    if entry.name.endswith('.yml') and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
             return []
-        
-        flows = []
-        for flow_file in self.flows_dir.glob("*.yml"):
-            flows.append(flow_file.stem)
-        return flows
     
     def execute_flow(self, 
                      flow_id: str, 
@@ -93,56 +255,100 @@ class FormExecutor:
         context = context or {}
         mock_responses = mock_responses or {}
         
-        # Validate flow definition
-        self.validate_flow(flow_def)
+        # Validation and per-step preparation happen once per flow definition
+        plan = self._get_flow_plan(flow_def.get('flow_id', flow_id), flow_def)
         
         # Show flow header
-        questionary.print(f"\\n{flow_def.get('icon', '🔧')} {flow_def['title']}", style="bold blue")
-        if flow_def.get('description'):
-            questionary.print(f"   {flow_def['description']}", style="italic")
+        questionary.print(plan.header, style="bold blue")
+        if plan.description:
+            questionary.print(f"   {plan.description}", style="italic")
         
         # Execute steps sequentially to handle conditional logic
         answers = {}
+        # Context overlaid with the answers so far, kept in step with answers
+        # rather than rebuilt for every condition, question and preview
+        merged = dict(context)
         
-        for step in flow_def['steps']:
-            if step['type'] == 'computed':
+        for step in plan.steps:
+            step_id = step.id
+            if step.computed:
                 # Handle computed values
-                if 'compute' in step:
-                    computed_value = self._evaluate_expression(step['compute'], {**context, **answers})
-                    answers[step['id']] = computed_value
+                if step.compute:
+                    answers[step_id] = merged[step_id] = step.compute(merged)
                 continue
                 
             # Check if step should be shown
-            if not self._should_show_step(step, {**context, **answers}):
+            if step.condition and not step.condition(merged):
                 continue
             
             # Use mock response if provided
-            if step['id'] in mock_responses:
-                answers[step['id']] = mock_responses[step['id']]
-                questionary.print(f"   🤖 Mock: {step['message']} -> {mock_responses[step['id']]}", style="italic")
+            if step_id in mock_responses:
+                answers[step_id] = merged[step_id] = mock_responses[step_id]
+                questionary.print(f"   🤖 Mock: {step.message} -> {mock_responses[step_id]}", style="italic")
                 continue
                 
             # Build and ask question
-            question = self._build_question(step, {**context, **answers})
+            question = step.ask(merged) if step.ask else None
             if question:
                 try:
                     answer = question.ask()
-                    answers[step['id']] = answer
+                    answers[step_id] = merged[step_id] = answer
                     
                     # Show preview if defined
-                    if 'preview' in step:
-                        preview_text = self._format_preview(step['preview'], {**context, **answers})
+                    if step.preview is not None:
+                        preview_text = self._format_preview(step.preview, merged)
                         questionary.print(f"   📋 {preview_text}", style="bold green")
                 except KeyboardInterrupt:
                     questionary.print("\\n❌ Flow execution cancelled by user.", style="bold red")
                     raise FormExecutionError("Flow execution cancelled by user")
         
         # Apply output mapping if specified
-        if 'output_mapping' in flow_def:
-            return self._apply_output_mapping(answers, flow_def['output_mapping'])
+        if plan.output_plan is not None:
+            return self._apply_output_mapping(answers, flow_def['output_mapping'], plan.output_plan)
         
         return answers
     
+    def _get_flow_plan(self, flow_id: str, flow_def: Dict[str, Any]) -> _FlowPlan:
+        """
+        Return the execution plan for a flow, rebuilding it if the definition
+        changed since it was cached.
+        """
+        cached = self._plan_cache.get(flow_id)
+        if cached is not None and cached[0] == flow_def:
+            return cached[1]
+        
+        # Validate flow definition
+        self.validate_flow(flow_def)
+        
+        steps = []
+        for step in flow_def['steps']:
+            computed = step['type'] == 'computed'
+            if 'condition' in step or 'when' in step:
+                condition = self._compiled_expression(step.get('condition') or step.get('when'))
+            else:
+                condition = None
+            steps.append(_StepPlan(
+                id=step['id'],
+                computed=computed,
+                compute=self._compiled_expression(step['compute']) if computed and 'compute' in step else None,
+                condition=condition,
+                ask=None if computed else self._make_question_factory(step),
+                message=step.get('message'),
+                preview=step.get('preview'),
+            ))
+        
+        plan = _FlowPlan(
+            header=f"\\n{flow_def.get('icon', '🔧')} {flow_def['title']}",
+            description=flow_def.get('description'),
+            steps=tuple(steps),
+            output_plan=(
+                _compile_output_mapping(flow_def['output_mapping'])
+                if 'output_mapping' in flow_def else None
+            ),
+        )
+        self._plan_cache[flow_id] = (copy.deepcopy(flow_def), plan)
+        return plan
+    
     def validate_flow(self, flow_definition: Dict[str, Any]) -> List[str]:
         """
         Validate flow definition and return list of errors.
@@ -154,48 +360,62 @@ class FormExecutor:
             List of validation error messages (empty if valid)
         """
         errors = []
+        add_error = errors.append
         
         # Required top-level fields
-        required_fields = ['flow_id', 'title', 'steps']
-        for field in required_fields:
+        for field in _REQUIRED_FLOW_FIELDS:
             if field not in flow_definition:
-                errors.append(f"Missing required field: {field}")
-        
-        # Validate steps
-        if 'steps' in flow_definition:
-            step_ids = set()
-            for i, step in enumerate(flow_definition['steps']):
-                # Check required step fields
-                if 'id' not in step:
-                    errors.append(f"Step {i}: Missing 'id' field")
-                elif step['id'] in step_ids:
-                    errors.append(f"Step {i}: Duplicate step ID '{step['id']}'")
-                else:
-                    step_ids.add(step['id'])
-                
-                if 'type' not in step:
-                    errors.append(f"Step {i}: Missing 'type' field")
-                elif step['type'] not in ['text', 'select', 'confirm', 'password', 'computed']:
-                    errors.append(f"Step {i}: Invalid step type '{step['type']}'")
-                
-                if 'message' not in step and step.get('type') != 'computed':
-                    errors.append(f"Step {i}: Missing 'message' field")
-                
-                # Validate select choices
-                if step.get('type') == 'select' and 'choices' not in step:
-                    errors.append(f"Step {i}: Select step missing 'choices' field")
+                add_error(f"Missing required field: {field}")
+        
+        # Validate steps in a single pass
+        step_ids = set()
+        for i, step in enumerate(flow_definition.get('steps') or ()):
+            # Check required step fields
+            step_id = step.get('id')
+            if 'id' not in step:
+                add_error(f"Step {i}: Missing 'id' field")
+            elif step_id in step_ids:
+                add_error(f"Step {i}: Duplicate step ID '{step_id}'")
+            else:
+                step_ids.add(step_id)
+            
+            step_type = step.get('type')
+            if 'type' not in step:
+                add_error(f"Step {i}: Missing 'type' field")
+            elif step_type not in _STEP_TYPES:
+                add_error(f"Step {i}: Invalid step type '{step_type}'")
+            
+            if 'message' not in step and step_type != 'computed':
+                add_error(f"Step {i}: Missing 'message' field")
+            
+            # Validate select choices
+            if step_type == 'select' and 'choices' not in step:
+                add_error(f"Step {i}: Select step missing 'choices' field")
         
         return errors
     
     def _build_question(self, step: Dict[str, Any], context: Dict[str, Any]):
         """Build a questionary question from step definition."""
+        factory = self._make_question_factory(step)
+        return factory(context) if factory else None
+    
+    def _make_question_factory(self, step: Dict[str, Any]) -> Optional[Callable]:
+        """
+        Prepare everything a step's question needs up front.
         
-        if step['type'] == 'info':
-            # Info/message steps - just print and continue
-            title = step.get('title', '')
-            message = step.get('message', '')
-            instruction = step.get('instruction', 'Press Enter to continue')
-            
+        Returns a callable taking the context and returning a fresh questionary
+        question (questions are single-use), or None for unsupported types.
+        """
+        builder = self._QUESTION_BUILDERS.get(step['type'])
+        return builder(self, step) if builder else None
+    
+    def _info_question(self, step: Dict[str, Any]) -> Callable:
+        # Info/message steps - just print and continue
+        title = step.get('title', '')
+        message = step.get('message', '')
+        instruction = step.get('instruction', 'Press Enter to continue')
+        
+        def ask_info(context):
             if title:
                 questionary.print(f"\n{title}", style="bold blue")
             if message:
@@ -207,58 +427,72 @@ class FormExecutor:
                 style=self.style
             )
         
-        elif step['type'] == 'select':
-            choices = []
-            for choice in step['choices']:
-                if isinstance(choice, dict):
-                    choices.append(choice['name'])
-                else:
-                    choices.append(choice)
-            
-            return questionary.select(
-                step['message'],
-                choices=choices,
-                default=step.get('default'),
-                instruction=step.get('instruction'),
-                style=self.style
-            )
-        
-        elif step['type'] == 'text':
-            # Build text question with validation
-            if 'validate' in step:
-                validator_name = step['validate']
-                validator_func = self.validators.get(validator_name)
-                return questionary.text(
-                    step['message'],
-                    default=step.get('default', ''),
-                    instruction=step.get('instruction'),
-                    validate=validator_func,
-                    style=self.style
-                )
+        return ask_info
+    
+    def _select_question(self, step: Dict[str, Any]) -> Callable:
+        choices = []
+        for choice in step['choices']:
+            if isinstance(choice, dict):
+                choices.append(choice['name'])
             else:
-                return questionary.text(
-                    step['message'],
-                    default=step.get('default', ''),
-                    instruction=step.get('instruction'),
-                    style=self.style
-                )
-        
-        elif step['type'] == 'password':
-            return questionary.password(
+                choices.append(choice)
+        
+        return _bind_question(
+            questionary.select,
+            step['message'],
+            choices=choices,
+            default=step.get('default'),
+            instruction=step.get('instruction'),
+            style=self.style
+        )
+    
+    def _text_question(self, step: Dict[str, Any]) -> Callable:
+        # Build text question with validation
+        if 'validate' in step:
+            validator_name = step['validate']
+            validator_func = self.validators.get(validator_name)
+            return _bind_question(
+                questionary.text,
                 step['message'],
+                default=step.get('default', ''),
                 instruction=step.get('instruction'),
+                validate=validator_func,
                 style=self.style
             )
-        
-        elif step['type'] == 'confirm':
-            return questionary.confirm(
+        else:
+            return _bind_question(
+                questionary.text,
                 step['message'],
-                default=step.get('default', True),
+                default=step.get('default', ''),
                 instruction=step.get('instruction'),
                 style=self.style
             )
-        
-        return None
+    
+    def _password_question(self, step: Dict[str, Any]) -> Callable:
+        return _bind_question(
+            questionary.password,
+            step['message'],
+            instruction=step.get('instruction'),
+            style=self.style
+        )
+    
+    def _confirm_question(self, step: Dict[str, Any]) -> Callable:
+        return _bind_question(
+            questionary.confirm,
+            step['message'],
+            default=step.get('default', True),
+            instruction=step.get('instruction'),
+            style=self.style
+        )
+    
+    # Step type -> question factory builder; add entries to support new types
+    _QUESTION_BUILDERS: Dict[str, Callable[['FormExecutor', Dict[str, Any]], Callable]] = {
+        'info': _info_question,
+        'select': _select_question,
+        'text': _text_question,
+        'password': _password_question,
+        'confirm': _confirm_question,
+    }
     
     def _should_show_step(self, step: Dict[str, Any], context: Dict[str, Any]) -> bool:
         """Check if a step should be shown based on conditions."""
@@ -270,12 +504,25 @@ class FormExecutor:
     
     def _evaluate_expression(self, expression: str, context: Dict[str, Any]) -> Any:
         """Evaluate a simple expression against context."""
+        return self._compiled_expression(expression)(context)
+    
+    def _compiled_expression(self, expression: str) -> Callable[[Dict[str, Any]], Any]:
+        """Return the compiled form of an expression, compiling it on first use."""
+        # Each distinct expression is parsed once; later calls run the compiled check
+        evaluate = self._expr_cache.get(expression)
+        if evaluate is None:
+            evaluate = self._expr_cache[expression] = self._compile_expression(expression)
+        return evaluate
+    
+    @staticmethod
+    def _compile_expression(expression: str) -> Callable[[Dict[str, Any]], Any]:
+        """Compile an expression into a function of the context."""
         # Simple expression evaluator for conditions like "enable_email == true"
         
         # Handle simple equality checks
         if '==' in expression:
             left, right = expression.split('==', 1)
-            left = left.strip()
+            keys = tuple(left.strip().split('.'))
             right = right.strip().strip("'\\\"")
             
             # Convert string boolean values
@@ -288,54 +535,112 @@ class FormExecutor:
             elif right.replace('.', '', 1).isdigit():
                 right = float(right)
             
-            left_value = self._get_nested_value(context, left)
-            return left_value == right
+            if len(keys) == 1:
+                # Flat variable (the common case): one dict lookup, no walk
+                key = keys[0]
+                return lambda context: context.get(key) == right
+            return lambda context: _walk(context, keys) == right
         
         # Handle simple boolean checks
-        if expression in context:
-            return bool(context[expression])
-        
-        return False
+        return lambda context: bool(context.get(expression, False))
     
     def _get_nested_value(self, data: Dict[str, Any], key: str) -> Any:
         """Get nested value using dot notation."""
-        keys = key.split('.')
-        value = data
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return None
-        return value
+        if '.' not in key:
+            return data.get(key) if isinstance(data, dict) else None
+        return _walk(data, _split_key(key))
     
     def _format_preview(self, preview_template: str, context: Dict[str, Any]) -> str:
         """Format preview text with context variables."""
         def replace_var(match):
             var_name = match.group(1)
-            value = self._get_nested_value(context, var_name)
+            if '.' in var_name:
+                value = _walk(context, _split_key(var_name))
+            else:
+                value = context.get(var_name)
             return str(value) if value is not None else f"{{{var_name}}}"
         
-        return re.sub(r'\\{([^}]+)\\}', replace_var, preview_template)
+        return _PREVIEW_RE.sub(replace_var, preview_template)
     
     def _load_flow(self, flow_id: str) -> Dict[str, Any]:
         """Load flow definition from YAML file."""
         flow_path = self.flows_dir / f"{flow_id}.yml"
-        if not flow_path.exists():
-            raise FormValidationError(f"Flow definition not found: {flow_path}")
+        cache_path = flow_path.with_suffix('.yml.json')
         
-        try:
-            with open(flow_path, 'r') as f:
-                flow_def = yaml.safe_load(f)
-                if not flow_def:
-                    raise FormValidationError(f"Empty or invalid YAML in {flow_path}")
-                
-                # Load and merge defaults if defaults_file is specified
-                if 'defaults_file' in flow_def:
-                    flow_def = self._merge_defaults(flow_def, flow_path)
-                
+        if self.json_cache:
+            flow_def = self._read_json_cache(cache_path)
+            if flow_def is not None:
                 return flow_def
+        
+        try:
+            # Repeat loads of an unchanged file come from the parse cache
+            flow_def = load_yaml(flow_path)
+        except FileNotFoundError:
+            raise FormValidationError(f"Flow definition not found: {flow_path}")
         except yaml.YAMLError as e:
             raise FormValidationError(f"Invalid YAML in {flow_path}: {e}")
+        
+        if not flow_def:
+            raise FormValidationError(f"Empty or invalid YAML in {flow_path}")
+        
+        # Load and merge defaults if defaults_file is specified
+        sources = [flow_path]
+        if 'defaults_file' in flow_def:
+            sources.append(self._resolve_defaults_path(flow_def['defaults_file'], flow_path))
+            flow_def = self._merge_defaults(flow_def, flow_path)
+        
+        if self.json_cache:
+            self._write_json_cache(cache_path, flow_def, sources)
+        
+        return flow_def
+    
+    def _read_json_cache(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """Return the cached flow if the sidecar exists and its sources are unchanged."""
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = json.load(f)
+            sources = cached['sources']
+            flow_def = cached['flow']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        
+        for source, signature in sources:
+            if _file_signature(source) != signature:
+                return None
+        return flow_def
+    
+    def _write_json_cache(self, cache_path: Path, flow_def: Dict[str, Any], sources: List[Path]):
+        """Write the sidecar cache; skipped for flows JSON cannot round-trip."""
+        payload = {
+            'sources': [[str(source), _file_signature(source)] for source in sources],
+            'flow': flow_def,
+        }
+        try:
+            data = json.dumps(payload, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return  # e.g. YAML dates or other non-JSON values
+        # JSON silently turns non-string keys into strings; don't cache a lossy copy
+        if json.loads(data)['flow'] != flow_def:
+            return
+        
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(data.encode('utf-8'))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Read-only flows directory etc.; the cache is only an optimization
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
+    @staticmethod
+    def _resolve_defaults_path(defaults_file: str, flow_path: Path) -> Path:
+        """Resolve a defaults file path (absolute or relative to the flow file)."""
+        defaults_path = Path(defaults_file)
+        if not defaults_path.is_absolute():
+            defaults_path = flow_path.parent / defaults_file
+        return defaults_path
     
     def _merge_defaults(self, flow_def: Dict[str, Any], flow_path: Path) -> Dict[str, Any]:
         """
@@ -356,17 +661,12 @@ class FormExecutor:
         if not defaults_file:
             return flow_def
         
-        # Resolve defaults file path (can be absolute or relative to flow file)
-        defaults_path = Path(defaults_file)
-        if not defaults_path.is_absolute():
-            defaults_path = flow_path.parent / defaults_file
-        
+        defaults_path = self._resolve_defaults_path(defaults_file, flow_path)
         if not defaults_path.exists():
             return flow_def
         
         try:
-            with open(defaults_path, 'r') as f:
-                defaults_data = yaml.safe_load(f)
+            defaults_data = load_yaml(defaults_path)
             
             if not defaults_data or 'defaults' not in defaults_data:
                 return flow_def
@@ -386,67 +686,29 @@ class FormExecutor:
             # Silently fail - use hardcoded defaults if defaults file fails
             return flow_def
     
-    def _apply_output_mapping(self, answers: Dict[str, Any], mapping: Dict[str, Any]) -> Dict[str, Any]:
+    def _apply_output_mapping(self,
+                              answers: Dict[str, Any],
+                              mapping: Dict[str, Any],
+                              plan: Optional[List[Tuple[Tuple[str, ...], Optional[str]]]] = None) -> Dict[str, Any]:
         """Apply output mapping to transform answers."""
-        result = {}
+        if plan is None:
+            plan = _compile_output_mapping(mapping)
         
-        def apply_mapping(source_dict: Dict[str, Any], mapping_dict: Dict[str, Any], target_dict: Dict[str, Any]):
-            for key, value in mapping_dict.items():
-                if isinstance(value, dict):
-                    # Nested mapping
-                    target_dict[key] = {}
-                    apply_mapping(source_dict, value, target_dict[key])
-                elif isinstance(value, str) and value in source_dict:
-                    # Direct mapping
-                    target_dict[key] = source_dict[value]
-        
-        apply_mapping(answers, mapping, result)
+        result = {}
+        for path, source in plan:
+            # Parents come earlier in the plan, so they already exist
+            target = result
+            for key in path[:-1]:
+                target = target[key]
+            if source is None:
+                # Nested mapping
+                target[path[-1]] = {}
+            elif source in answers:
+                # Direct mapping
+                target[path[-1]] = answers[source]
         return result
     
     def _load_validators(self) -> Dict[str, Callable]:
         """Load built-in validators."""
-        def required_validator(value: str) -> bool:
-            """Validate that value is not empty."""
-            if not value or not value.strip():
-                raise questionary.ValidationError(message="This field is required")
-            return True
-        
-        def email_validator(value: str) -> bool:
-            """Validate email format."""
-            if not value:
-                return True  # Allow empty for optional fields
-            if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$', value):
-                raise questionary.ValidationError(message="Invalid email format")
-            return True
-        
-        def domain_validator(value: str) -> bool:
-            """Validate domain format."""
-            if not value:
-                raise questionary.ValidationError(message="Domain cannot be empty")
-            if not re.match(r'^[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$', value):
-                raise questionary.ValidationError(message="Invalid domain format")
-            return True
-        
-        def integer_validator(value: str) -> bool:
-            """Validate integer format."""
-            if not value:
-                return True  # Allow empty for optional fields
-            try:
-                int(value)
-                return True
-            except ValueError:
-                raise questionary.ValidationError(message="Must be a valid integer")
-        
-        def password_length_validator(value: str) -> bool:
-            """Validate password length (minimum 8 characters)."""
-            if len(value) < 8:
-                raise questionary.ValidationError(message="Password must be at least 8 characters long")
-            return True
-        
-        return {
-            'required': required_validator,
-            'email': email_validator,
-            'domain': domain_validator,
-            'integer': integer_validator,
-            'password_length': password_length_validator,
-        }
\ No newline at end of file
+        # Copied so validators registered on one executor don't leak to others
+        return dict(_BUILTIN_VALIDATORS)
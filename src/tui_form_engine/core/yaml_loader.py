@@ -0,0 +1,98 @@
+"""Cached YAML loading shared by the form executor and the preprocessors."""
+
+import copy
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Tuple, Union
+
+import yaml
+
+try:  # libyaml-backed parser when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader
+
+
+class _InterningLoader(SafeLoader):
+    """Safe loader that interns mapping keys so repeated keys share one string."""
+
+    def construct_mapping(self, node, deep=False):
+        mapping = super().construct_mapping(node, deep=deep)
+        return {sys.intern(k) if type(k) is str else k: v for k, v in mapping.items()}
+
+
+_CACHE_SIZE = 100
+
+# path -> (mtime_ns, size, parsed document), least recently used first
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+# Guards _YAML_CACHE; files may be loaded from worker threads
+_CACHE_LOCK = threading.Lock()
+
+
+def read_file_bytes(path: Union[str, Path]) -> bytes:
+    """Read a whole file, hinting the kernel that access is sequential."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            # Loop until EOF in case the file grew or a read came back short
+            chunk = os.read(fd, max(size, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+def load_yaml(path: Union[str, Path], shared: bool = False) -> Any:
+    """
+    Load a YAML file, reusing the parsed tree while the file is unchanged.
+
+    Entries are validated against the file's mtime and size, so edits are
+    picked up on the next load. Callers receive a deep copy and may mutate it.
+
+    Args:
+        path: Path to the YAML file
+        shared: Return the cached tree itself instead of a copy. The caller
+            must treat it as read-only and copy whatever it needs to change.
+
+    Returns:
+        The parsed YAML document
+
+    Raises:
+        OSError: If the file cannot be read (FileNotFoundError if missing)
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    key = os.fspath(path)
+    st = os.stat(key)
+    with _CACHE_LOCK:
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _YAML_CACHE.move_to_end(key)
+            data = cached[2]
+        else:
+            data = None
+    if data is not None:
+        return data if shared else copy.deepcopy(data)
+
+    data = yaml.load(read_file_bytes(key), Loader=_InterningLoader)
+
+    with _CACHE_LOCK:
+        _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+        _YAML_CACHE.move_to_end(key)
+        if len(_YAML_CACHE) > _CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+    return data if shared else copy.deepcopy(data)
+
+
+def clear_yaml_cache():
+    """Drop every cached YAML document."""
+    with _CACHE_LOCK:
+        _YAML_CACHE.clear()
@@ -7,11 +7,22 @@ Creates a unified defaults object with proper priority: sublayout > global > har
 
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+from ..core.yaml_loader import load_yaml
+
+try:  # libyaml-backed dumper when PyYAML was built with it
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeDumper
+
 logger = logging.getLogger(__name__)
 
+# Output directories already created by _save_unified_defaults in this process
+_created_dirs = set()
+
 
 class DefaultsPreprocessor:
     """
@@ -51,40 +62,86 @@ class DefaultsPreprocessor:
         Returns:
             Dictionary of merged defaults with proper hierarchy applied
         """
-        logger.info(f"📊 Merging hierarchical defaults for {layout_path.name}")
+        layout_dir = layout_path.parent
+        
+        # Find which sublayouts declare their own defaults file
+        sublayout_paths = [
+            layout_dir / step['sublayout']
+            for step in layout_data.get('steps', [])
+            if 'sublayout' in step
+        ]
+        sublayout_paths = [path for path in sublayout_paths if path.exists()]
+        
+        # Files are read and parsed concurrently, then merged in step order
+        sublayout_defaults = []
+        for sublayout_path, sublayout_data in zip(
+            sublayout_paths, self._map_files(self._load_yaml, sublayout_paths)
+        ):
+            # Check for sublayout_defaults declaration
+            if 'sublayout_defaults' in sublayout_data:
+                sublayout_defaults.append((sublayout_path, sublayout_data['sublayout_defaults']))
+        
+        return self.merge_declared_defaults(
+            layout_path,
+            layout_data.get('defaults_file'),
+            sublayout_defaults,
+            save_unified=save_unified,
+            output_path=output_path
+        )
+    
+    def merge_declared_defaults(
+        self,
+        layout_path: Path,
+        defaults_file: Optional[str],
+        sublayout_defaults: List[Tuple[Path, str]],
+        save_unified: bool = False,
+        output_path: Optional[Path] = None
+    ) -> Dict[str, Any]:
+        """
+        Merge defaults whose declarations have already been collected.
+        
+        This is the second half of merge_defaults(), for callers (such as
+        LayoutPreprocessor.reconstruct_and_merge_defaults) that have already
+        read the sublayouts and need not read them again.
+        
+        Args:
+            layout_path: Path to the main layout file
+            defaults_file: The main layout's defaults_file entry, if any
+            sublayout_defaults: (sublayout path, sublayout_defaults entry) pairs
+                in step order; entries are relative to the main layout dir
+            save_unified: Whether to save the unified defaults to a file
+            output_path: Where to save the unified defaults (if save_unified=True)
+            
+        Returns:
+            Dictionary of merged defaults with proper hierarchy applied
+        """
+        logger.info("📊 Merging hierarchical defaults for %s", layout_path.name)
         
         merged_defaults = {}
         layout_dir = layout_path.parent
         
         # Step 1: Load global defaults (base layer)
-        if 'defaults_file' in layout_data:
-            defaults_file_path = layout_dir / layout_data['defaults_file']
-            global_defaults = self._load_defaults_file(defaults_file_path)
+        if defaults_file:
+            global_defaults = self._load_defaults_file(layout_dir / defaults_file)
             
             if global_defaults:
                 merged_defaults.update(global_defaults)
-                logger.info(f"📊 Loaded {len(global_defaults)} global defaults")
-        
-        # Step 2: Load and merge sublayout defaults (override layer)
-        for step in layout_data.get('steps', []):
-            if 'sublayout' in step:
-                sublayout_path = layout_dir / step['sublayout']
-                
-                if sublayout_path.exists():
-                    sublayout_data = self._load_yaml(sublayout_path)
-                    
-                    # Check for sublayout_defaults declaration
-                    if 'sublayout_defaults' in sublayout_data:
-                        # Path is relative to main layout dir
-                        sublayout_defaults_path = layout_dir / sublayout_data['sublayout_defaults']
-                        sublayout_defaults = self._load_defaults_file(sublayout_defaults_path)
-                        
-                        if sublayout_defaults:
-                            # Sublayout defaults override global defaults
-                            merged_defaults.update(sublayout_defaults)
-                            logger.info(f"📦 Merged {len(sublayout_defaults)} defaults from {sublayout_path.name}")
-        
-        logger.info(f"✅ Total unified defaults: {len(merged_defaults)}")
+                logger.info("📊 Loaded %d global defaults", len(global_defaults))
+        
+        # Step 2: Merge sublayout defaults (override layer); the path is
+        # relative to the main layout dir
+        all_sublayout_defaults = self._map_files(
+            self._load_defaults_file, [layout_dir / ref for _, ref in sublayout_defaults]
+        )
+        log_merges = logger.isEnabledFor(logging.INFO)
+        for (sublayout_path, _), defaults in zip(sublayout_defaults, all_sublayout_defaults):
+            if defaults:
+                # Sublayout defaults override global defaults
+                merged_defaults.update(defaults)
+                if log_merges:
+                    logger.info("📦 Merged %d defaults from %s", len(defaults), sublayout_path.name)
+        
+        logger.info("✅ Total unified defaults: %d", len(merged_defaults))
         
         # Save unified defaults if requested
         if save_unified:
@@ -93,6 +150,14 @@ class DefaultsPreprocessor:
         
         return merged_defaults
     
+    @staticmethod
+    def _map_files(load: Callable[[Path], Any], paths: List[Path]) -> List[Any]:
+        """Apply a loader to each path, on a thread pool when there are several."""
+        if len(paths) < 2:
+            return [load(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            return list(executor.map(load, paths))
+    
     def _load_defaults_file(self, defaults_path: Path) -> Dict[str, Any]:
         """
         Load defaults from a YAML file.
@@ -104,7 +169,7 @@ class DefaultsPreprocessor:
             Dictionary of defaults (key: value pairs), or empty dict if not found
         """
         if not defaults_path.exists():
-            logger.debug(f"Defaults file not found: {defaults_path}")
+            logger.debug("Defaults file not found: %s", defaults_path)
             return {}
         
         try:
@@ -113,17 +178,17 @@ class DefaultsPreprocessor:
             if defaults_data and 'defaults' in defaults_data:
                 return defaults_data['defaults']
             
-            logger.warning(f"⚠️  No 'defaults' section in {defaults_path}")
+            logger.warning("⚠️  No 'defaults' section in %s", defaults_path)
             return {}
             
         except Exception as e:
-            logger.warning(f"⚠️  Failed to load defaults from {defaults_path}: {e}")
+            logger.warning("⚠️  Failed to load defaults from %s: %s", defaults_path, e)
             return {}
     
-    def _load_yaml(self, file_path: Path) -> Dict[str, Any]:
-        """Load and parse a YAML file."""
-        with open(file_path, 'r') as f:
-            return yaml.safe_load(f)
+    @staticmethod
+    def _load_yaml(file_path: Path) -> Dict[str, Any]:
+        """Load and parse a YAML file (cached while the file is unchanged)."""
+        return load_yaml(file_path)
     
     def _save_unified_defaults(self, merged_defaults: Dict[str, Any], output_path: Path):
         """
@@ -133,17 +198,30 @@ class DefaultsPreprocessor:
             merged_defaults: The merged defaults dictionary
             output_path: Where to save the file
         """
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_dir = output_path.parent
+        if output_dir not in _created_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(output_dir)
         
         unified_data = {'defaults': merged_defaults}
         
-        with open(output_path, 'w') as f:
-            yaml.safe_dump(
+        try:
+            f = open(output_path, 'wb')
+        except FileNotFoundError:
+            # Directory was removed after we created it
+            output_dir.mkdir(parents=True, exist_ok=True)
+            f = open(output_path, 'wb')
+        
+        # With an encoding the dumper emits UTF-8 bytes directly
+        with f:
+            yaml.dump(
                 unified_data,
                 f,
+                Dumper=SafeDumper,
                 default_flow_style=False,
                 sort_keys=False,
-                allow_unicode=True
+                allow_unicode=True,
+                encoding='utf-8'
             )
         
-        logger.info(f"💾 Unified defaults saved to: {output_path}")
+        logger.info("💾 Unified defaults saved to: %s", output_path)
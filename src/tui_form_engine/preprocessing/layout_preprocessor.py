@@ -5,10 +5,20 @@ Merges main layout + sublayouts into a single unified virtual layout structure.
 The TUI Form Engine receives a complete layout after sublayout resolution and step merging.
 """
 
+import copy
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from ..core.yaml_loader import load_yaml, read_file_bytes
+from .defaults_preprocessor import DefaultsPreprocessor
+
+try:  # libyaml-backed loader/dumper when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader, SafeDumper
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +42,11 @@ class LayoutPreprocessor:
             layouts_dir: Base directory for layout files (for relative path resolution)
         """
         self.layouts_dir = Path(layouts_dir) if layouts_dir else Path.cwd()
-        self.loaded_sublayouts = set()  # Track loaded files for circular reference detection
+        self.loaded_sublayouts = set()  # Sublayout files loaded by the current reconstruction
+        self._ancestor_stack: List[Path] = []  # Layouts being expanded, for cycle detection
+        self._resolve_cache: Dict[Path, Path] = {}  # Path.resolve() results for this run
+        # (sublayout path, sublayout_defaults entry) pairs seen by this run, in step order
+        self.sublayout_defaults: List[Tuple[Path, str]] = []
         
     def reconstruct_virtual_layout(
         self, 
@@ -55,14 +69,17 @@ class LayoutPreprocessor:
             FileNotFoundError: If layout file or sublayout not found
             ValueError: If circular sublayout references detected
         """
-        logger.info(f"🔄 Reconstructing virtual layout from {layout_path.name}")
+        logger.info("🔄 Reconstructing virtual layout from %s", layout_path.name)
         
         # Reset tracking for this reconstruction
         self.loaded_sublayouts = set()
+        self._resolve_cache = {}
+        self._ancestor_stack = []
+        self.sublayout_defaults = []
         
         # Load main layout
-        main_layout = self._load_yaml(layout_path)
-        layout_dir = layout_path.parent
+        raw = read_file_bytes(layout_path)
+        main_layout = self._parse_yaml(raw, layout_path)
         
         # Initialize virtual layout with main metadata
         virtual_layout = {
@@ -75,33 +92,21 @@ class LayoutPreprocessor:
             'steps': []
         }
         
-        # Process each step/subid in order
-        step_count = 0
-        sublayout_count = 0
-        
-        for step in main_layout.get('steps', []):
-            if 'sublayout' in step:
-                # This is a sublayout reference
-                sublayout_path = layout_dir / step['sublayout']
-                subid = step.get('subid', sublayout_path.stem)
-                
-                logger.info(f"📦 Processing sublayout '{subid}': {sublayout_path.name}")
-                
-                # Load and merge sublayout steps
-                sublayout_steps = self._load_sublayout(sublayout_path, layout_dir)
-                virtual_layout['steps'].extend(sublayout_steps)
-                
-                step_count += len(sublayout_steps)
-                sublayout_count += 1
-            else:
-                # Regular inline step
-                virtual_layout['steps'].append(step)
-                step_count += 1
+        layout_steps = main_layout.get('steps', [])
+        if b'sublayout' not in raw:
+            # Nothing in the file can reference a sublayout, so the main
+            # layout's steps are the virtual layout's steps
+            steps = list(layout_steps)
+            sublayout_paths = []
+        else:
+            steps, sublayout_paths = self._merge_sublayouts(layout_path, layout_steps)
         
-        logger.info(f"✅ Virtual layout created: {step_count} steps from {sublayout_count} sublayouts")
+        virtual_layout['steps'] = steps
+        logger.info("✅ Virtual layout created: %d steps from %d sublayouts", len(steps), len(sublayout_paths))
         
-        # Validate step ID uniqueness
-        self._validate_step_ids(virtual_layout['steps'])
+        duplicates = self._duplicate_step_ids(steps)
+        if duplicates:
+            raise ValueError(f"Duplicate step IDs found: {', '.join(duplicates)}")
         
         # Save virtual layout if requested
         if save_virtual:
@@ -110,6 +115,107 @@ class LayoutPreprocessor:
         
         return virtual_layout
     
+    def reconstruct_and_merge_defaults(
+        self,
+        layout_path: Path,
+        save_virtual: bool = False,
+        virtual_output_path: Optional[Path] = None,
+        save_defaults: bool = False,
+        defaults_output_path: Optional[Path] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Build the virtual layout and its unified defaults in one pass.
+        
+        Equivalent to reconstruct_virtual_layout() followed by
+        DefaultsPreprocessor.merge_defaults() on the main layout, except that
+        each sublayout file is read only once.
+        
+        Returns:
+            (virtual layout, merged defaults)
+        """
+        virtual_layout = self.reconstruct_virtual_layout(
+            layout_path, save_virtual=save_virtual, output_path=virtual_output_path
+        )
+        merged_defaults = DefaultsPreprocessor(self.layouts_dir).merge_declared_defaults(
+            layout_path,
+            virtual_layout['defaults_file'],
+            self.sublayout_defaults,
+            save_unified=save_defaults,
+            output_path=defaults_output_path
+        )
+        return virtual_layout, merged_defaults
+    
+    def _merge_sublayouts(
+        self,
+        layout_path: Path,
+        layout_steps: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Path]]:
+        """
+        Expand the sublayout references in a layout's steps.
+        
+        Returns:
+            The merged steps and the sublayout paths that were loaded
+        """
+        self._ancestor_stack.append(self._resolve(layout_path))
+        layout_dir = layout_path.parent
+        
+        # Process each step/subid in order
+        steps = []
+        add_step = steps.append
+        log_sublayouts = logger.isEnabledFor(logging.INFO)
+        processed = []  # (subid, file name) pairs, logged together below
+        
+        sublayout_paths = []
+        add_sublayout_path = sublayout_paths.append
+        paths_by_ref = {}  # Each distinct reference is joined onto layout_dir once
+        for step in layout_steps:
+            sublayout_ref = step.get('sublayout')
+            if sublayout_ref is not None:
+                # This is a sublayout reference
+                sublayout_path = paths_by_ref.get(sublayout_ref)
+                if sublayout_path is None:
+                    sublayout_path = paths_by_ref[sublayout_ref] = layout_dir / sublayout_ref
+                add_sublayout_path(sublayout_path)
+                
+                if log_sublayouts:
+                    subid = step.get('subid')
+                    if subid is None:
+                        subid = sublayout_path.stem
+                    processed.append((subid, sublayout_path.name))
+        
+        if processed:
+            logger.info(
+                "📦 Processing %d sublayouts: %s",
+                len(processed),
+                ", ".join(f"'{subid}' ({name})" for subid, name in processed)
+            )
+        
+        # Load all sublayouts (concurrently when there are several), then
+        # splice their steps in at the position of each reference
+        sublayout_steps = iter(self._load_sublayouts(sublayout_paths, layout_dir))
+        for entry in layout_steps:
+            # A sublayout reference expands to its steps; anything else is an inline step
+            if entry.get('sublayout') is not None:
+                steps.extend(next(sublayout_steps))
+            else:
+                add_step(entry)
+        
+        return steps, sublayout_paths
+    
+    @staticmethod
+    def _duplicate_step_ids(steps: List[Dict[str, Any]]) -> List[str]:
+        """Return the step IDs that repeat an earlier step's ID."""
+        step_ids = set()
+        duplicates = []
+        for step in steps:
+            step_id = step.get('id')
+            if step_id:
+                if step_id in step_ids:
+                    duplicates.append(step_id)
+                else:
+                    step_ids.add(step_id)
+        return duplicates
+    
     def _load_sublayout(self, sublayout_path: Path, base_dir: Path) -> List[Dict[str, Any]]:
         """
         Load a sublayout file and return its steps.
@@ -125,55 +231,104 @@ class LayoutPreprocessor:
             FileNotFoundError: If sublayout file not found
             ValueError: If circular reference detected
         """
-        # Check for circular references
-        abs_path = sublayout_path.resolve()
-        if abs_path in self.loaded_sublayouts:
-            raise ValueError(f"Circular sublayout reference detected: {sublayout_path}")
+        abs_path = self._check_sublayout(sublayout_path)
         
-        if not sublayout_path.exists():
-            raise FileNotFoundError(f"Sublayout not found: {sublayout_path}")
+        self._ancestor_stack.append(abs_path)
+        try:
+            sublayout_data = self._read_sublayout(sublayout_path, abs_path)
+        finally:
+            self._ancestor_stack.pop()
         
         # Track this sublayout
         self.loaded_sublayouts.add(abs_path)
         
-        # Load sublayout YAML
-        sublayout_data = self._load_yaml(sublayout_path)
+        return self._sublayout_steps(sublayout_path, sublayout_data)
+    
+    def _load_sublayouts(self, sublayout_paths: List[Path], base_dir: Path) -> List[List[Dict[str, Any]]]:
+        """
+        Load the steps of several sublayouts, returned in the given order.
         
+        Cycle checks run serially up front; with more than two sublayouts the
+        files are then read and parsed on a thread pool.
+        """
+        if len(sublayout_paths) <= 2:
+            return [self._load_sublayout(path, base_dir) for path in sublayout_paths]
+        
+        abs_paths = [self._check_sublayout(path) for path in sublayout_paths]
+        with ThreadPoolExecutor(max_workers=min(8, len(abs_paths))) as executor:
+            all_data = list(executor.map(self._read_sublayout, sublayout_paths, abs_paths))
+        self.loaded_sublayouts.update(abs_paths)
+        
+        return [
+            self._sublayout_steps(path, data)
+            for path, data in zip(sublayout_paths, all_data)
+        ]
+    
+    def _check_sublayout(self, sublayout_path: Path) -> Path:
+        """Return the sublayout's resolved path after checking for cycles."""
+        # Only a layout that is still being expanded can close a cycle; the same
+        # sublayout used from two different places is not circular
+        abs_path = self._resolve(sublayout_path)
+        if abs_path in self._ancestor_stack:
+            raise ValueError(f"Circular sublayout reference detected: {sublayout_path}")
+        
+        return abs_path
+    
+    @staticmethod
+    def _read_sublayout(sublayout_path: Path, abs_path: Path) -> Dict[str, Any]:
+        # Shared sublayouts are parsed once while unchanged. A missing file
+        # surfaces from the read itself rather than a separate exists() stat.
+        try:
+            return LayoutPreprocessor._load_yaml(abs_path, cached=True)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Sublayout not found: {sublayout_path}") from None
+    
+    def _sublayout_steps(self, sublayout_path: Path, sublayout_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         # Extract steps
         steps = sublayout_data.get('steps', [])
         
         if not steps:
-            logger.warning(f"⚠️  Sublayout {sublayout_path.name} contains no steps")
+            logger.warning("⚠️  Sublayout %s contains no steps", sublayout_path.name)
+        
+        # Remembered so defaults can be merged without reading the file again
+        defaults_ref = sublayout_data.get('sublayout_defaults')
+        if defaults_ref is not None:
+            self.sublayout_defaults.append((sublayout_path, defaults_ref))
         
-        return steps
+        # The parsed sublayout is shared with the YAML cache; copy the steps
+        # (nested choices included) so callers can never modify the cache
+        return copy.deepcopy(steps)
     
-    def _validate_step_ids(self, steps: List[Dict[str, Any]]):
+    def _resolve(self, path: Path) -> Path:
+        """Path.resolve() with results cached for the current reconstruction."""
+        resolved = self._resolve_cache.get(path)
+        if resolved is None:
+            resolved = self._resolve_cache[path] = path.resolve()
+        return resolved
+    
+    @staticmethod
+    def _load_yaml(file_path: Path, cached: bool = False) -> Dict[str, Any]:
         """
-        Validate that all step IDs are unique.
+        Load and parse a YAML file.
         
-        Args:
-            steps: List of step dictionaries
-            
-        Raises:
-            ValueError: If duplicate step IDs found
+        With cached=True the parsed tree is reused across calls and
+        preprocessor instances until the file's mtime or size changes. It is
+        shared with the cache, so it must not be modified in place.
         """
-        step_ids = set()
-        duplicates = []
+        if not cached:
+            return LayoutPreprocessor._parse_yaml(read_file_bytes(file_path), file_path)
         
-        for step in steps:
-            step_id = step.get('id')
-            if step_id:
-                if step_id in step_ids:
-                    duplicates.append(step_id)
-                step_ids.add(step_id)
+        data = load_yaml(file_path, shared=True)
+        if not data:
+            raise ValueError(f"Empty or invalid YAML file: {file_path}")
         
-        if duplicates:
-            raise ValueError(f"Duplicate step IDs found: {', '.join(duplicates)}")
+        return data
     
-    def _load_yaml(self, file_path: Path) -> Dict[str, Any]:
-        """Load and parse a YAML file."""
-        with open(file_path, 'r') as f:
-            data = yaml.safe_load(f)
+    @staticmethod
+    def _parse_yaml(raw: bytes, file_path: Path) -> Dict[str, Any]:
+        """Parse YAML bytes already read from file_path."""
+        # The parser decodes UTF-8 itself
+        data = yaml.load(raw, Loader=SafeLoader)
         
         if not data:
             raise ValueError(f"Empty or invalid YAML file: {file_path}")
@@ -190,13 +345,28 @@ class LayoutPreprocessor:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            yaml.safe_dump(
-                virtual_layout,
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True
-            )
+        dump_options = dict(
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+            width=10_000,  # Skip folding long scalars
+            encoding='utf-8'  # With a binary file the C emitter writes bytes directly
+        )
+        steps = virtual_layout.get('steps')
+        
+        with open(output_path, 'wb') as f:
+            if not steps:
+                yaml.dump(virtual_layout, f, **dump_options)
+            else:
+                # Emit the header and then one step at a time so no single dump
+                # holds the whole layout. Block sequences under a mapping key
+                # are not indented, so the output matches a one-shot dump.
+                header = {key: value for key, value in virtual_layout.items() if key != 'steps'}
+                if header:
+                    yaml.dump(header, f, **dump_options)
+                f.write(b'steps:\n')
+                for step in steps:
+                    yaml.dump([step], f, **dump_options)
         
-        logger.info(f"💾 Virtual layout saved to: {output_path}")
+        logger.info("💾 Virtual layout saved to: %s", output_path)
@@ -7,31 +7,86 @@ A lightweight, production-ready renderer for executing TUI forms without
 design/editing capabilities. This is what end users interact with.
 """
 
+import os
 import sys
 import json
-import argparse
+import contextlib
+import functools
+from types import MappingProxyType
 from pathlib import Path
-from typing import Dict, Any, Optional
-import yaml
-from datetime import datetime
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union
 
 from .core.form_executor import FormExecutor
+from .core.yaml_loader import load_yaml
+from .core.flow_structure import scan_flow_structure
 from .core.exceptions import FormValidationError, FormExecutionError
-from .preprocessing import LayoutPreprocessor, DefaultsPreprocessor
+from .preprocessing import LayoutPreprocessor
+
+# rich (and the stdlib argparse/datetime) are imported where they are used so
+# that starting the renderer does not pay for modules a run may never touch
+if TYPE_CHECKING:  # pragma: no cover
+    from rich.console import Console
+
+try:  # optional: pip install tui-form-engine[fast]
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    # json detects the UTF-8 encoding of bytes itself
+    return json.loads(data)
+
+
+# Read-only stand-in for a flow without metadata, so lookups need no fresh {}
+_NO_METADATA = MappingProxyType({})
+
+# Console shared by renderers that were not given one; creating a Console
+# probes the terminal, so it is done once per process
+_DEFAULT_CONSOLE: Optional["Console"] = None
+
+
+def _default_console() -> "Console":
+    """Return the process-wide default console, creating it on first use."""
+    global _DEFAULT_CONSOLE
+    if _DEFAULT_CONSOLE is None:
+        from rich.console import Console
+        _DEFAULT_CONSOLE = Console()
+    return _DEFAULT_CONSOLE
 
 
 class FormRenderer:
     """Production renderer for TUI forms - end-user facing interface."""
     
-    def __init__(self, console: Optional[Console] = None):
+    def __init__(self, console: Optional["Console"] = None):
         """Initialize the renderer."""
-        self.console = console or Console()
+        # Created on first use, so quiet runs that never print skip importing rich
+        self._console = console
         self.engine = FormExecutor()
     
+    @property
+    def console(self) -> "Console":
+        """The rich console used for all renderer output."""
+        if self._console is None:
+            self._console = _default_console()
+        return self._console
+    
+    @functools.cached_property
+    def _fancy(self) -> bool:
+        # Panels are only drawn for an interactive terminal; piped output gets
+        # plain one-line summaries instead of rich's layout pass
+        return self.console.is_terminal and not os.environ.get('NO_COLOR')
+    
     def render_flow(
         self, 
         flow_path: str, 
@@ -62,61 +117,77 @@ class FormRenderer:
         try:
             # Load flow definition
             flow_path_obj = Path(flow_path)
-            flow_data = self._load_flow_yaml(flow_path)
+            flow_dir = flow_path_obj.parent
+            flow_data = self._load_flow_yaml(flow_path_obj)
+            
+            # One pass over the steps both validates them and detects
+            # sublayout references
+            errors, has_sublayouts = self._scan_flow(flow_data)
             
             # === IN-MEMORY PREPROCESSING ===
             # Detect and handle sublayouts + hierarchical defaults transparently
-            if self._has_sublayouts(flow_data):
+            if has_sublayouts:
                 if not quiet:
                     self.console.print("🔄 Processing sublayouts...", style="dim")
                 
-                # Use LayoutPreprocessor to merge sublayouts in-memory
-                layout_preprocessor = LayoutPreprocessor(layouts_dir=flow_path_obj.parent)
-                flow_data = layout_preprocessor.reconstruct_virtual_layout(
+                # Merge sublayouts and hierarchical defaults in-memory, reading
+                # each sublayout file once for both
+                layout_preprocessor = LayoutPreprocessor(layouts_dir=flow_dir)
+                flow_data, unified_defaults = layout_preprocessor.reconstruct_and_merge_defaults(
                     layout_path=flow_path_obj,
                     save_virtual=bool(debug_output_dir),
-                    output_path=debug_output_dir / f"{flow_path_obj.stem}_virtual.yml" if debug_output_dir else None
+                    virtual_output_path=debug_output_dir / f"{flow_path_obj.stem}_virtual.yml" if debug_output_dir else None,
+                    save_defaults=bool(debug_output_dir),
+                    defaults_output_path=debug_output_dir / "unified_defaults.yml" if debug_output_dir else None
                 )
                 
-                # Use DefaultsPreprocessor to merge hierarchical defaults in-memory
-                defaults_preprocessor = DefaultsPreprocessor(layouts_dir=flow_path_obj.parent)
-                unified_defaults = defaults_preprocessor.merge_defaults(
-                    layout_path=flow_path_obj,
-                    layout_data=flow_data,
-                    save_unified=bool(debug_output_dir),
-                    output_path=debug_output_dir / "unified_defaults.yml" if debug_output_dir else None
-                )
+                # The engine runs flow_data as given without reading a
+                # defaults_file, so apply the unified defaults to the steps here
+                # (they override hardcoded step defaults)
+                if unified_defaults:
+                    for step in flow_data['steps']:
+                        step_id = step.get('id')
+                        if step_id in unified_defaults:
+                            step['default'] = unified_defaults[step_id]
+                    if debug_output_dir:
+                        flow_data['defaults_file'] = str((debug_output_dir / "unified_defaults.yml").absolute())
                 
-                # Update flow to use unified defaults
-                if unified_defaults and debug_output_dir:
-                    flow_data['defaults_file'] = str((debug_output_dir / "unified_defaults.yml").absolute())
-            
-            flow_id = flow_data.get('metadata', {}).get('id', 'unnamed_flow')
+                # The references themselves are not valid steps; check the merged flow
+                errors, _ = self._scan_flow(flow_data)
             
             # Pre-validate flow structure before showing progress
-            self._validate_flow_structure(flow_data)
+            self._raise_for_errors(errors)
+            
+            # The flow ID comes from the metadata, falling back to the filename
+            flow_id = (flow_data.get('metadata') or _NO_METADATA).get('id') or flow_path_obj.stem
             
             if not quiet:
                 self.console.print(f"📁 Loading flow from: [cyan]{flow_path}[/cyan]")
                 self._show_flow_info(flow_data)
             
-            # Execute the flow using the engine
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console,
-                transient=True
-            ) as progress:
-                if not quiet:
+            # Execute the flow using the engine. Headless runs (mock responses
+            # or quiet mode) skip the spinner and its refresh thread entirely.
+            show_spinner = not (quiet or mock_responses)
+            if show_spinner:
+                from rich.progress import Progress, SpinnerColumn, TextColumn
+                progress_context = Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=self.console,
+                    transient=True
+                )
+            else:
+                progress_context = contextlib.nullcontext()
+            
+            with progress_context as progress:
+                if show_spinner:
                     task = progress.add_task("Preparing form...", total=None)
                 
                 # Execute the flow - use the preprocessed flow definition directly
-                # Create a temporary flow ID from the metadata or filename
-                flow_id = flow_data.get('metadata', {}).get('id') or Path(flow_path).stem
-                
-                # Set the flows directory to the directory containing the flow file
-                flow_dir = Path(flow_path).parent
-                self.engine.flows_dir = flow_dir
+                # Point the engine at the directory containing the flow file;
+                # repeated renders from the same directory leave it untouched
+                if self.engine.flows_dir != flow_dir:
+                    self.engine.flows_dir = flow_dir
                 
                 # Execute using the preprocessed flow data directly (bypasses file loading)
                 responses = self.engine.execute_flow(
@@ -125,17 +196,19 @@ class FormRenderer:
                     flow_data=flow_data  # Pass preprocessed data (with merged sublayouts)
                 )
                 
-                if not quiet:
+                if show_spinner:
                     progress.update(task, description="Complete!")
             
-            # Create response object
+            # Create response object (both timestamps record the same moment)
+            from datetime import datetime
+            completed_at = datetime.now().isoformat()
             response_data = {
                 "flow_id": flow_id,
-                "completed_at": datetime.now().isoformat(),
+                "completed_at": completed_at,
                 "responses": responses,
                 "metadata": {
                     "total_steps": len(responses),
-                    "execution_time": datetime.now().isoformat()
+                    "execution_time": completed_at
                 }
             }
             
@@ -152,82 +225,45 @@ class FormRenderer:
             self.console.print(f"[red]❌ Error: {str(e)}[/red]")
             raise
     
-    def _has_sublayouts(self, flow_data: Dict[str, Any]) -> bool:
-        """Check if the flow definition contains sublayout references."""
-        steps = flow_data.get('steps', [])
-        for step in steps:
-            # Sublayouts are identified by having 'subid' and 'sublayout' fields
-            if 'subid' in step and 'sublayout' in step:
-                return True
-        return False
-    
-    def _load_flow_yaml(self, flow_path: str) -> Dict[str, Any]:
+    def _load_flow_yaml(self, flow_path: Union[str, Path]) -> Dict[str, Any]:
         """Load flow definition from YAML file."""
-        path = Path(flow_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Flow definition not found: {flow_path}")
-        
-        with open(path, 'r') as f:
-            flow_data = yaml.safe_load(f)
+        # Parsed once per (mtime, size); later runs get a fresh copy of the tree
+        try:
+            flow_data = load_yaml(flow_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Flow definition not found: {flow_path}") from None
         
         return flow_data
     
     def _validate_flow_structure(self, flow_def: Dict[str, Any]):
         """Validate flow structure and provide clear error messages."""
-        errors = []
-        
-        # Check required top-level fields
-        if 'title' not in flow_def:
-            errors.append("Missing required field: 'title'")
-        
-        if 'steps' not in flow_def:
-            errors.append("Missing required field: 'steps'")
-        elif not isinstance(flow_def['steps'], list) or len(flow_def['steps']) == 0:
-            errors.append("'steps' must be a non-empty list")
-        else:
-            # Validate each step
-            step_ids = set()
-            for i, step in enumerate(flow_def['steps']):
-                if not isinstance(step, dict):
-                    errors.append(f"Step {i+1}: Must be a dictionary")
-                    continue
-                    
-                if 'id' not in step:
-                    errors.append(f"Step {i+1}: Missing required field 'id'")
-                elif step['id'] in step_ids:
-                    errors.append(f"Step {i+1}: Duplicate step ID '{step['id']}'")
-                else:
-                    step_ids.add(step['id'])
-                
-                if 'type' not in step:
-                    errors.append(f"Step {i+1} ({step.get('id', 'unnamed')}): Missing required field 'type'")
-                
-                # Validate choice fields
-                if step.get('type') == 'select':
-                    if 'choices' not in step:
-                        errors.append(f"Step {i+1} ({step.get('id', 'unnamed')}): Select type requires 'choices' field")
-                    elif step.get('default') is not None:
-                        choices = step.get('choices', [])
-                        default = step.get('default')
-                        # Check if default matches any choice (handle both string and dict formats)
-                        valid_choices = []
-                        for choice in choices:
-                            if isinstance(choice, str):
-                                valid_choices.append(choice)
-                            elif isinstance(choice, dict) and 'value' in choice:
-                                valid_choices.append(choice['value'])
-                            elif isinstance(choice, dict) and 'name' in choice:
-                                valid_choices.append(choice['name'])
-                        
-                        if default not in valid_choices:
-                            errors.append(f"Step {i+1} ({step.get('id', 'unnamed')}): Default value '{default}' not in choices {valid_choices}")
+        errors, _ = self._scan_flow(flow_def)
+        self._raise_for_errors(errors)
+    
+    def _scan_flow(self, flow_def: Dict[str, Any]) -> Tuple[List[str], bool]:
+        """
+        Validate the flow structure and detect sublayout references in one pass.
         
+        Returns:
+            (validation error messages, whether any step references a sublayout)
+        """
+        return scan_flow_structure(flow_def)
+    
+    @staticmethod
+    def _raise_for_errors(errors: List[str]):
+        """Raise a single ValueError listing every validation error."""
         if errors:
             error_msg = "Flow validation failed:\n" + "\n".join(f"  ❌ {error}" for error in errors)
             raise ValueError(error_msg)
     
     def _show_welcome(self):
         """Show welcome message."""
+        if not self._fancy:
+            return
+        
+        from rich.panel import Panel
+        from rich.text import Text
+        
         welcome_text = Text("🎯 Interactive Configuration", style="bold blue")
         self.console.print(Panel(
             welcome_text,
@@ -238,7 +274,7 @@ class FormRenderer:
     
     def _show_flow_info(self, flow_def: Dict[str, Any]):
         """Show flow information."""
-        metadata = flow_def.get('metadata', {})
+        metadata = flow_def.get('metadata') or _NO_METADATA
         steps = flow_def.get('steps', [])
         
         # Extract title and icon from root level (flow engine structure)
@@ -246,6 +282,13 @@ class FormRenderer:
         icon = flow_def.get('icon', '🔧')
         description = flow_def.get('description', '')
         
+        if not self._fancy:
+            self.console.print(f"Flow: {title} ({len(steps)} steps)", markup=False, highlight=False)
+            return
+        
+        from rich.panel import Panel
+        from rich.text import Text
+        
         info_text = Text()
         info_text.append(f"{icon} Flow: ", style="bold")
         info_text.append(f"{title}\n", style="bold cyan")
@@ -274,11 +317,20 @@ class FormRenderer:
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(response_data, f, indent=2)
+        output_path.write_bytes(_dumps(response_data))
     
     def _show_completion(self, response_data: Dict[str, Any], output_file: Optional[str]):
         """Show completion message."""
+        if not self._fancy:
+            summary = f"Completed: {len(response_data['responses'])} responses"
+            if output_file:
+                summary += f", saved to {output_file}"
+            self.console.print(summary, markup=False, highlight=False)
+            return
+        
+        from rich.panel import Panel
+        from rich.text import Text
+        
         completion_text = Text()
         completion_text.append("🎉 Configuration completed successfully!\n\n", style="bold green")
         
@@ -302,6 +354,8 @@ class FormRenderer:
 
 def main():
     """CLI entry point for the form renderer."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="TUI Form Engine - Production Renderer",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -347,13 +401,13 @@ Examples:
     # Load mock responses if provided
     mock_responses = None
     if args.mock:
-        mock_path = Path(args.mock)
-        if not mock_path.exists():
+        try:
+            raw = Path(args.mock).read_bytes()
+        except FileNotFoundError:
             print(f"Error: Mock file not found: {args.mock}", file=sys.stderr)
             sys.exit(1)
         
-        with open(mock_path, 'r') as f:
-            mock_responses = json.load(f)
+        mock_responses = _loads(raw)
     
     # Create renderer and execute flow
     renderer = FormRenderer()
@@ -368,7 +422,9 @@ Examples:
         
         if args.quiet:
             # In quiet mode, just output the response data
-            print(json.dumps(response.responses, indent=2))
+            sys.stdout.flush()
+            sys.stdout.buffer.write(_dumps(response['responses']) + b"\n")
+            sys.stdout.buffer.flush()
         
     except KeyboardInterrupt:
         print("\n👋 Configuration cancelled by user", file=sys.stderr)
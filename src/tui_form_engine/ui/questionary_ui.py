@@ -97,6 +97,11 @@ class QuestionaryUI:
         """Show a step message."""
         qprint(f"   → {message}", style="dim")
     
+    def show_steps(self, messages: List[str]):
+        """Show several step messages with a single write."""
+        if messages:
+            qprint("\n".join(f"   → {message}" for message in messages), style="dim")
+    
     def show_progress(self, current: int, total: int, description: str = ""):
         """Show progress indicator."""
         percentage = int((current / total) * 100)
@@ -81,12 +81,16 @@ def test_flow_validation():
     try:
         from tui_form_designer import FlowEngine
         import yaml
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
         
         engine = FlowEngine(flows_dir="tui_layouts/basic")
         
         # Test simple_survey validation
-        with open("tui_layouts/basic/simple_survey.yml", 'r') as f:
-            flow_def = yaml.safe_load(f)
+        with open("tui_layouts/basic/simple_survey.yml", 'rb') as f:
+            flow_def = yaml.load(f, Loader=SafeLoader)
         
         errors = engine.validate_flow(flow_def)
         if not errors:
@@ -96,8 +100,8 @@ def test_flow_validation():
             return False
         
         # Test user_registration validation
-        with open("tui_layouts/basic/user_registration.yml", 'r') as f:
-            flow_def = yaml.safe_load(f)
+        with open("tui_layouts/basic/user_registration.yml", 'rb') as f:
+            flow_def = yaml.load(f, Loader=SafeLoader)
             
         errors = engine.validate_flow(flow_def)
         if not errors:
@@ -1,69 +1,131 @@
 """Test configuration and shared fixtures."""
 
+import copy
+import json
 import pytest
+import yaml
 from pathlib import Path
-import tempfile
 import shutil
-import yaml
-from typing import Dict, Any
+import uuid
+from typing import Dict, Any, Optional, Union
+from unittest.mock import MagicMock
 
 from tui_form_designer.core.flow_engine import FlowEngine
 from tui_form_designer.ui.questionary_ui import QuestionaryUI
 
 
+def _flow_file_bytes(definition: Dict[str, Any]) -> bytes:
+    """
+    Serialize an ad-hoc flow definition for a .yml fixture file.
+
+    JSON is a subset of YAML, so the engine loads it unchanged, and the C
+    json encoder is far cheaper than emitting block-style YAML. The sample
+    flow stays block-style YAML (sample_flow_yaml) so the YAML loaders are
+    still exercised on real YAML.
+    """
+    return json.dumps(definition, ensure_ascii=False).encode('utf-8')
+
+
+@pytest.fixture(scope="module")
+def flows_root(tmp_path_factory):
+    """Per-module parent of the temp_flows_dir directories, removed once."""
+    root = tmp_path_factory.mktemp("flows")
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
 @pytest.fixture
-def temp_flows_dir():
+def temp_flows_dir(flows_root):
     """Create a temporary directory for test flows."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+    flows_dir = flows_root / uuid.uuid4().hex
+    flows_dir.mkdir()
+    return flows_dir
+
+
+@pytest.fixture(scope="session")
+def empty_flows_dir(tmp_path_factory):
+    """An empty flows directory shared by tests that never write to it."""
+    return tmp_path_factory.mktemp("empty_flows")
+
+
+# Shared by sample_flow_definition (copied per test) and sample_flow_yaml
+_SAMPLE_FLOW_DEFINITION: Dict[str, Any] = {
+    'flow_id': 'test_flow',
+    'title': 'Test Flow',
+    'description': 'A flow for testing',
+    'icon': '🧪',
+    'steps': [
+        {
+            'id': 'name',
+            'type': 'text',
+            'message': 'Enter your name:',
+            'validate': 'required'
+        },
+        {
+            'id': 'age',
+            'type': 'text',
+            'message': 'Enter your age:',
+            'validate': 'integer'
+        },
+        {
+            'id': 'email',
+            'type': 'text', 
+            'message': 'Enter your email:',
+            'validate': 'email'
+        },
+        {
+            'id': 'subscribe',
+            'type': 'confirm',
+            'message': 'Subscribe to newsletter?',
+            'default': False
+        }
+    ],
+    'output_mapping': {
+        'user': {
+            'name': 'name',
+            'age': 'age',
+            'email': 'email'
+        },
+        'preferences': {
+            'newsletter': 'subscribe'
+        }
+    }
+}
 
 
 @pytest.fixture
 def sample_flow_definition() -> Dict[str, Any]:
     """Sample flow definition for testing."""
-    return {
-        'flow_id': 'test_flow',
-        'title': 'Test Flow',
-        'description': 'A flow for testing',
-        'icon': '🧪',
-        'steps': [
-            {
-                'id': 'name',
-                'type': 'text',
-                'message': 'Enter your name:',
-                'validate': 'required'
-            },
-            {
-                'id': 'age',
-                'type': 'text',
-                'message': 'Enter your age:',
-                'validate': 'integer'
-            },
-            {
-                'id': 'email',
-                'type': 'text', 
-                'message': 'Enter your email:',
-                'validate': 'email'
-            },
-            {
-                'id': 'subscribe',
-                'type': 'confirm',
-                'message': 'Subscribe to newsletter?',
-                'default': False
-            }
-        ],
-        'output_mapping': {
-            'user': {
-                'name': 'name',
-                'age': 'age',
-                'email': 'email'
-            },
-            'preferences': {
-                'newsletter': 'subscribe'
-            }
-        }
-    }
+    return copy.deepcopy(_SAMPLE_FLOW_DEFINITION)
+
+
+@pytest.fixture(scope="session")
+def sample_flow_yaml() -> bytes:
+    """The sample flow as block-style YAML, emitted once per session."""
+    return yaml.safe_dump(
+        _SAMPLE_FLOW_DEFINITION, sort_keys=False, allow_unicode=True
+    ).encode('utf-8')
+
+
+@pytest.fixture
+def write_flow(temp_flows_dir, sample_flow_yaml):
+    """
+    Write a flow file and return its path.
+
+    The target is a file name in temp_flows_dir or a full path; without a
+    definition the sample flow's YAML is written.
+    """
+    def write(
+        target: Union[str, Path] = "test_flow.yml",
+        definition: Optional[Dict[str, Any]] = None
+    ) -> Path:
+        flow_path = temp_flows_dir / target
+        if definition is None:
+            flow_path.write_bytes(sample_flow_yaml)
+        else:
+            flow_path.write_bytes(_flow_file_bytes(definition))
+        return flow_path
+    return write
 
 
 @pytest.fixture
@@ -96,35 +158,45 @@ def conditional_flow_definition() -> Dict[str, Any]:
     }
 
 
+# Shared by invalid_flow_definition (copied per test) and invalid_flow_bytes
+_INVALID_FLOW_DEFINITION: Dict[str, Any] = {
+    'flow_id': 'invalid_flow',
+    'title': 'Invalid Flow',
+    'steps': [
+        {
+            # Missing 'id' field
+            'type': 'text',
+            'message': 'This step has no ID'
+        },
+        {
+            'id': 'duplicate_id',
+            'type': 'text',
+            'message': 'First step'
+        },
+        {
+            'id': 'duplicate_id',  # Duplicate ID
+            'type': 'text',
+            'message': 'Second step with same ID'
+        },
+        {
+            'id': 'invalid_type',
+            'type': 'invalid_type',  # Invalid step type
+            'message': 'Invalid step type'
+        }
+    ]
+}
+
+
 @pytest.fixture
 def invalid_flow_definition() -> Dict[str, Any]:
     """Invalid flow definition for testing validation."""
-    return {
-        'flow_id': 'invalid_flow',
-        'title': 'Invalid Flow',
-        'steps': [
-            {
-                # Missing 'id' field
-                'type': 'text',
-                'message': 'This step has no ID'
-            },
-            {
-                'id': 'duplicate_id',
-                'type': 'text',
-                'message': 'First step'
-            },
-            {
-                'id': 'duplicate_id',  # Duplicate ID
-                'type': 'text',
-                'message': 'Second step with same ID'
-            },
-            {
-                'id': 'invalid_type',
-                'type': 'invalid_type',  # Invalid step type
-                'message': 'Invalid step type'
-            }
-        ]
-    }
+    return copy.deepcopy(_INVALID_FLOW_DEFINITION)
+
+
+@pytest.fixture(scope="session")
+def invalid_flow_bytes() -> bytes:
+    """The invalid flow definition serialized (as JSON) once per session."""
+    return _flow_file_bytes(_INVALID_FLOW_DEFINITION)
 
 
 @pytest.fixture
@@ -133,6 +205,12 @@ def flow_engine(temp_flows_dir):
     return FlowEngine(flows_dir=str(temp_flows_dir))
 
 
+@pytest.fixture(scope="session")
+def shared_flow_engine(tmp_path_factory):
+    """One FlowEngine for tests that never touch the flows directory."""
+    return FlowEngine(flows_dir=str(tmp_path_factory.mktemp("flows")))
+
+
 @pytest.fixture
 def questionary_ui():
     """QuestionaryUI instance for testing."""
@@ -140,12 +218,20 @@ def questionary_ui():
 
 
 @pytest.fixture
-def sample_flow_file(temp_flows_dir, sample_flow_definition):
+def mock_ui(monkeypatch):
+    """A single MagicMock standing in for QuestionaryUI in every CLI tool."""
+    ui = MagicMock()
+    for module in ("designer", "preview", "tester", "validator"):
+        monkeypatch.setattr(
+            f"tui_form_designer.tools.{module}.QuestionaryUI", lambda *args, **kwargs: ui
+        )
+    return ui
+
+
+@pytest.fixture
+def sample_flow_file(write_flow):
     """Create a sample flow file."""
-    flow_path = temp_flows_dir / "test_flow.yml"
-    with open(flow_path, 'w') as f:
-        yaml.dump(sample_flow_definition, f)
-    return flow_path
+    return write_flow()
 
 
 @pytest.fixture
@@ -2,9 +2,7 @@
 
 import pytest
 import yaml
-from pathlib import Path
-from unittest.mock import patch, MagicMock
-import tempfile
+from unittest.mock import MagicMock
 import json
 
 from tui_form_designer.tools.validator import FlowValidator
@@ -23,84 +21,135 @@ class TestFlowValidator:
         assert validator.ui is not None
         assert validator.flow_engine is not None
     
-    def test_validate_flow_file_valid(self, temp_flows_dir, sample_flow_definition):
+    def test_validate_flow_file_valid(self, mock_ui, temp_flows_dir, write_flow):
         """Test validating a valid flow file."""
         # Create valid flow file
-        flow_path = temp_flows_dir / "valid_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(sample_flow_definition, f)
+        flow_path = write_flow("valid_flow.yml")
         
         validator = FlowValidator(flows_dir=str(temp_flows_dir))
-        with patch.object(validator.ui, 'show_success') as mock_success:
-            result = validator.validate_flow_file(flow_path)
-            assert result is True
-            mock_success.assert_called_with("✅ Valid")
+        result = validator.validate_flow_file(flow_path)
+        assert result is True
+        mock_ui.show_success.assert_called_with("✅ Valid")
     
-    def test_validate_flow_file_invalid(self, temp_flows_dir, invalid_flow_definition):
+    def test_validate_flow_file_invalid(self, mock_ui, temp_flows_dir, invalid_flow_bytes):
         """Test validating an invalid flow file."""
         # Create invalid flow file
         flow_path = temp_flows_dir / "invalid_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(invalid_flow_definition, f)
+        flow_path.write_bytes(invalid_flow_bytes)
         
         validator = FlowValidator(flows_dir=str(temp_flows_dir))
-        with patch.object(validator.ui, 'show_error') as mock_error:
-            result = validator.validate_flow_file(flow_path)
-            assert result is False
-            mock_error.assert_called()
+        result = validator.validate_flow_file(flow_path)
+        assert result is False
+        mock_ui.show_error.assert_called()
     
-    def test_validate_flow_file_yaml_error(self, temp_flows_dir):
+    def test_validate_flow_file_yaml_error(self, mock_ui, temp_flows_dir):
         """Test validating a file with YAML syntax errors."""
         # Create file with invalid YAML
         flow_path = temp_flows_dir / "yaml_error.yml"
-        with open(flow_path, 'w') as f:
-            f.write("invalid: yaml: [")
+        flow_path.write_bytes(b"invalid: yaml: [")
         
         validator = FlowValidator(flows_dir=str(temp_flows_dir))
-        with patch.object(validator.ui, 'show_error') as mock_error:
-            result = validator.validate_flow_file(flow_path)
-            assert result is False
-            mock_error.assert_called()
+        result = validator.validate_flow_file(flow_path)
+        assert result is False
+        mock_ui.show_error.assert_called()
     
-    def test_validate_all_flows_empty(self, temp_flows_dir):
+    def test_validate_all_flows_empty(self, mock_ui, empty_flows_dir):
         """Test validating all flows in empty directory."""
-        validator = FlowValidator(flows_dir=str(temp_flows_dir))
-        with patch.object(validator.ui, 'show_warning') as mock_warning:
-            result = validator.validate_all_flows()
-            assert result is True
-            mock_warning.assert_called_with("No flow files found")
+        validator = FlowValidator(flows_dir=str(empty_flows_dir))
+        result = validator.validate_all_flows()
+        assert result is True
+        mock_ui.show_warning.assert_called_with("No flow files found")
     
-    def test_validate_all_flows_success(self, temp_flows_dir, sample_flow_definition):
+    def test_validate_all_flows_success(self, mock_ui, temp_flows_dir, write_flow):
         """Test validating all flows successfully."""
         # Create valid flow file
-        flow_path = temp_flows_dir / "test_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(sample_flow_definition, f)
+        write_flow("test_flow.yml")
+        
+        validator = FlowValidator(flows_dir=str(temp_flows_dir))
+        result = validator.validate_all_flows()
+        assert result is True
+        mock_ui.show_success.assert_called()
+    
+    def test_validate_all_flows_parallel_preserves_order(
+        self, mock_ui, temp_flows_dir, write_flow, invalid_flow_bytes
+    ):
+        """Test threaded validation reports files in directory order."""
+        for name in ("a_flow", "b_flow", "c_flow"):
+            write_flow(f"{name}.yml")
+        (temp_flows_dir / "d_flow.yml").write_bytes(invalid_flow_bytes)
+        
+        validator = FlowValidator(flows_dir=str(temp_flows_dir), jobs=4)
+        expected = [p.name for p in temp_flows_dir.glob("*.yml")]
+        result = validator.validate_all_flows()
+        
+        assert result is False
+        assert [c.args[0] for c in mock_ui.show_section_header.call_args_list] == [
+            f"Validating: {name}" for name in expected
+        ]
+        mock_ui.show_error.assert_called_with("Some flows have validation errors")
+    
+    def test_validate_flow_file_reuses_unchanged_result(
+        self, temp_flows_dir, write_flow,
+        sample_flow_definition, monkeypatch
+    ):
+        """Test unchanged files are not re-parsed, modified files are."""
+        flow_path = write_flow("cached_flow.yml")
+        
+        validator = FlowValidator(flows_dir=str(temp_flows_dir))
+        mock_load = MagicMock(wraps=yaml.load)
+        monkeypatch.setattr('tui_form_designer.tools.validator.yaml.load', mock_load)
+        assert validator.validate_flow_file(flow_path) is True
+        assert validator.validate_flow_file(flow_path) is True
+        assert mock_load.call_count == 1
+        
+        write_flow(flow_path, {**sample_flow_definition, 'extra_field': 'changed'})
+        assert validator.validate_flow_file(flow_path) is True
+        assert mock_load.call_count == 2
+    
+    def test_validate_flow_file_tracks_nested_defaults(self, mock_ui, temp_flows_dir):
+        """Test editing a sublayout's defaults file invalidates the cached result."""
+        flow_path = temp_flows_dir / "main.yml"
+        flow_path.write_text(
+            "flow_id: main\nlayout_id: main\ntitle: Main\nsteps:\n"
+            "  - id: name\n    type: text\n    message: 'Your name:'\n"
+            "  - subid: contact\n    sublayout: contact.yml\n"
+        )
+        (temp_flows_dir / "contact.yml").write_text(
+            "title: Contact\nsublayout_defaults: contact_defaults.yml\nsteps:\n"
+            "  - id: email\n    type: text\n    message: 'Your email:'\n"
+        )
+        defaults_path = temp_flows_dir / "contact_defaults.yml"
+        defaults_path.write_text("email: ann@example.com\n")
         
         validator = FlowValidator(flows_dir=str(temp_flows_dir))
-        with patch.object(validator.ui, 'show_success') as mock_success:
-            result = validator.validate_all_flows()
-            assert result is True
-            mock_success.assert_called()
+        assert validator.validate_flow_file(flow_path) is True
+        
+        defaults_path.write_text("- not a mapping\n")
+        assert validator.validate_flow_file(flow_path) is False
     
-    def test_validate_specific_flows(self, temp_flows_dir, sample_flow_definition):
+    def test_validate_specific_flows(self, temp_flows_dir, write_flow):
         """Test validating specific flow files."""
         # Create flow file
-        flow_path = temp_flows_dir / "test_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(sample_flow_definition, f)
+        write_flow("test_flow.yml")
         
         validator = FlowValidator(flows_dir=str(temp_flows_dir))
         result = validator.validate_specific_flows(["test_flow.yml"])
         assert result is True
     
-    def test_validate_specific_flows_not_found(self, temp_flows_dir):
-        """Test validating non-existent flow files."""
+    def test_validate_specific_flows_by_flow_id(self, mock_ui, temp_flows_dir, write_flow):
+        """Test specific flows can be given by ID and picked up once created."""
         validator = FlowValidator(flows_dir=str(temp_flows_dir))
-        with patch.object(validator.ui, 'show_error') as mock_error:
-            result = validator.validate_specific_flows(["nonexistent.yml"])
-            assert result is False
-            mock_error.assert_called()
+        assert validator.validate_specific_flows(["test_flow"]) is False
+        
+        write_flow("test_flow.yml")
+        assert validator.validate_specific_flows(["test_flow"]) is True
+    
+    def test_validate_specific_flows_not_found(self, mock_ui, empty_flows_dir):
+        """Test validating non-existent flow files."""
+        validator = FlowValidator(flows_dir=str(empty_flows_dir))
+        result = validator.validate_specific_flows(["nonexistent.yml"])
+        assert result is False
+        mock_ui.show_error.assert_called()
 
 
 class TestFlowTester:
@@ -113,84 +162,64 @@ class TestFlowTester:
         assert tester.ui is not None
         assert tester.flow_engine is not None
     
-    def test_test_flow_with_mocks(self, temp_flows_dir, sample_flow_definition, mock_responses):
+    def test_test_flow_with_mocks(self, mock_ui, temp_flows_dir, write_flow, mock_responses):
         """Test flow execution with mock responses."""
         # Create flow file
-        flow_path = temp_flows_dir / "test_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(sample_flow_definition, f)
+        write_flow("test_flow.yml")
         
         # Create mock file
         mock_file = temp_flows_dir / "mock_responses.json"
-        with open(mock_file, 'w') as f:
-            json.dump(mock_responses, f)
+        mock_file.write_text(json.dumps(mock_responses))
         
         tester = FlowTester(flows_dir=str(temp_flows_dir))
-        with patch.object(tester.ui, 'show_success') as mock_success:
-            result = tester.test_flow("test_flow", str(mock_file))
-            assert result is True
-            mock_success.assert_called()
+        result = tester.test_flow("test_flow", str(mock_file))
+        assert result is True
+        mock_ui.show_success.assert_called()
     
-    def test_test_flow_invalid_mock_file(self, temp_flows_dir, sample_flow_definition):
+    def test_test_flow_invalid_mock_file(self, mock_ui, temp_flows_dir, write_flow):
         """Test flow testing with invalid mock file."""
         # Create flow file
-        flow_path = temp_flows_dir / "test_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(sample_flow_definition, f)
+        write_flow("test_flow.yml")
         
         tester = FlowTester(flows_dir=str(temp_flows_dir))
-        with patch.object(tester.ui, 'show_error') as mock_error:
-            result = tester.test_flow("test_flow", "nonexistent.json")
-            assert result is False
-            mock_error.assert_called()
+        result = tester.test_flow("test_flow", "nonexistent.json")
+        assert result is False
+        mock_ui.show_error.assert_called()
     
-    def test_generate_mock_template(self, temp_flows_dir, sample_flow_definition):
+    def test_generate_mock_template(self, mock_ui, temp_flows_dir, write_flow):
         """Test generating mock response template."""
         # Create flow file
-        flow_path = temp_flows_dir / "test_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(sample_flow_definition, f)
+        write_flow("test_flow.yml")
         
         tester = FlowTester(flows_dir=str(temp_flows_dir))
         
-        # Change to temp directory to control where template is created
-        import os
-        original_cwd = os.getcwd()
-        os.chdir(str(temp_flows_dir))
-        
-        try:
-            with patch.object(tester.ui, 'show_success') as mock_success:
-                tester.generate_mock_template("test_flow")
-                
-                # Check template file was created
-                template_file = Path("test_flow_mock_template.json")
-                assert template_file.exists()
-                
-                # Verify template content
-                with open(template_file) as f:
-                    template = json.load(f)
-                
-                assert 'name' in template
-                assert 'age' in template
-                assert 'email' in template
-                assert 'subscribe' in template
-                
-                mock_success.assert_called()
-        finally:
-            os.chdir(original_cwd)
+        # Write the template into the temp directory; no chdir, so the test
+        # is safe to run alongside others in the same process
+        tester.generate_mock_template("test_flow", output_dir=temp_flows_dir)
+        
+        # Check template file was created
+        template_file = temp_flows_dir / "test_flow_mock_template.json"
+        assert template_file.exists()
+        
+        # Verify template content
+        template = json.loads(template_file.read_text())
+        
+        assert 'name' in template
+        assert 'age' in template
+        assert 'email' in template
+        assert 'subscribe' in template
+        
+        mock_ui.show_success.assert_called()
     
-    def test_test_all_flows(self, temp_flows_dir, sample_flow_definition):
+    def test_test_all_flows(self, mock_ui, temp_flows_dir, write_flow):
         """Test validating all flows."""
         # Create flow file
-        flow_path = temp_flows_dir / "test_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(sample_flow_definition, f)
+        write_flow("test_flow.yml")
         
         tester = FlowTester(flows_dir=str(temp_flows_dir))
-        with patch.object(tester.ui, 'show_success') as mock_success:
-            result = tester.test_all_flows()
-            assert result is True
-            mock_success.assert_called()
+        result = tester.test_all_flows()
+        assert result is True
+        mock_ui.show_success.assert_called()
 
 
 class TestFlowPreviewer:
@@ -203,73 +232,57 @@ class TestFlowPreviewer:
         assert previewer.ui is not None
         assert previewer.flow_engine is not None
     
-    def test_preview_flow(self, temp_flows_dir, sample_flow_definition):
+    def test_preview_flow(self, mock_ui, temp_flows_dir, write_flow):
         """Test previewing a flow."""
         # Create flow file
-        flow_path = temp_flows_dir / "test_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(sample_flow_definition, f)
+        write_flow("test_flow.yml")
         
         previewer = FlowPreviewer(flows_dir=str(temp_flows_dir))
-        with patch.object(previewer.ui, 'show_title') as mock_title, \
-             patch.object(previewer.ui, 'show_info') as mock_info:
-            previewer.preview_flow("test_flow")
-            
-            mock_title.assert_called()
-            mock_info.assert_called()
+        previewer.preview_flow("test_flow")
+        
+        mock_ui.show_title.assert_called()
+        mock_ui.show_info.assert_called()
     
-    def test_preview_flow_not_found(self, temp_flows_dir):
+    def test_preview_flow_not_found(self, mock_ui, empty_flows_dir):
         """Test previewing non-existent flow."""
-        previewer = FlowPreviewer(flows_dir=str(temp_flows_dir))
-        with patch.object(previewer.ui, 'show_error') as mock_error:
-            previewer.preview_flow("nonexistent")
-            mock_error.assert_called_with("Flow not found: nonexistent")
+        previewer = FlowPreviewer(flows_dir=str(empty_flows_dir))
+        previewer.preview_flow("nonexistent")
+        mock_ui.show_error.assert_called_with("Flow not found: nonexistent")
     
-    def test_preview_step(self, temp_flows_dir, sample_flow_definition):
+    def test_preview_step(self, mock_ui, temp_flows_dir, write_flow):
         """Test previewing a specific step."""
         # Create flow file
-        flow_path = temp_flows_dir / "test_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(sample_flow_definition, f)
+        write_flow("test_flow.yml")
         
         previewer = FlowPreviewer(flows_dir=str(temp_flows_dir))
-        with patch.object(previewer.ui, 'show_title') as mock_title:
-            previewer.preview_flow("test_flow", "name")
-            mock_title.assert_called()
+        previewer.preview_flow("test_flow", "name")
+        mock_ui.show_title.assert_called()
     
-    def test_preview_step_not_found(self, temp_flows_dir, sample_flow_definition):
+    def test_preview_step_not_found(self, mock_ui, temp_flows_dir, write_flow):
         """Test previewing non-existent step."""
         # Create flow file
-        flow_path = temp_flows_dir / "test_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(sample_flow_definition, f)
+        write_flow("test_flow.yml")
         
         previewer = FlowPreviewer(flows_dir=str(temp_flows_dir))
-        with patch.object(previewer.ui, 'show_error') as mock_error:
-            previewer.preview_flow("test_flow", "nonexistent_step")
-            mock_error.assert_called_with("Step not found: nonexistent_step")
+        previewer.preview_flow("test_flow", "nonexistent_step")
+        mock_ui.show_error.assert_called_with("Step not found: nonexistent_step")
     
-    def test_list_flows(self, temp_flows_dir, sample_flow_definition):
+    def test_list_flows(self, mock_ui, temp_flows_dir, write_flow):
         """Test listing all flows."""
         # Create flow file
-        flow_path = temp_flows_dir / "test_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(sample_flow_definition, f)
+        write_flow("test_flow.yml")
         
         previewer = FlowPreviewer(flows_dir=str(temp_flows_dir))
-        with patch.object(previewer.ui, 'show_title') as mock_title, \
-             patch.object(previewer.ui, 'show_section_header') as mock_header:
-            previewer.list_flows()
-            
-            mock_title.assert_called()
-            mock_header.assert_called()
+        previewer.list_flows()
+        
+        mock_ui.show_title.assert_called()
+        mock_ui.show_section_header.assert_called()
     
-    def test_list_flows_empty(self, temp_flows_dir):
+    def test_list_flows_empty(self, mock_ui, empty_flows_dir):
         """Test listing flows in empty directory."""
-        previewer = FlowPreviewer(flows_dir=str(temp_flows_dir))
-        with patch.object(previewer.ui, 'show_error') as mock_error:
-            previewer.list_flows()
-            mock_error.assert_called_with("No flows found")
+        previewer = FlowPreviewer(flows_dir=str(empty_flows_dir))
+        previewer.list_flows()
+        mock_ui.show_error.assert_called_with("No flows found")
 
 
 class TestInteractiveFlowDesigner:
@@ -284,50 +297,42 @@ class TestInteractiveFlowDesigner:
         assert isinstance(designer.step_types, dict)
         assert isinstance(designer.validators, list)
     
-    def test_create_step_text(self, temp_flows_dir):
+    def test_create_step_text(self, mock_ui, temp_flows_dir):
         """Test creating a text step."""
         designer = InteractiveFlowDesigner(flows_dir=str(temp_flows_dir))
         
-        with patch.object(designer.ui, 'select') as mock_select, \
-             patch.object(designer.ui, 'prompt') as mock_prompt, \
-             patch.object(designer.ui, 'confirm') as mock_confirm:
-            
-            # Mock user selections
-            mock_select.return_value = "Text Input - Single line text input with optional validation"
-            mock_prompt.side_effect = ["test_id", "Test message"]
-            mock_confirm.side_effect = [False, False, False, False]  # No optional fields
-            
-            step = designer.create_step()
-            
-            assert step is not None
-            assert step['type'] == 'text'
-            assert step['id'] == 'test_id'
-            assert step['message'] == 'Test message'
+        # Mock user selections
+        mock_ui.select.return_value = "Text Input - Single line text input with optional validation"
+        mock_ui.prompt.side_effect = ["test_id", "Test message"]
+        mock_ui.confirm.side_effect = [False, False, False, False]  # No optional fields
+        
+        step = designer.create_step()
+        
+        assert step is not None
+        assert step['type'] == 'text'
+        assert step['id'] == 'test_id'
+        assert step['message'] == 'Test message'
     
-    def test_create_step_select(self, temp_flows_dir):
+    def test_create_step_select(self, mock_ui, temp_flows_dir):
         """Test creating a select step."""
         designer = InteractiveFlowDesigner(flows_dir=str(temp_flows_dir))
         
-        with patch.object(designer.ui, 'select') as mock_select, \
-             patch.object(designer.ui, 'prompt') as mock_prompt, \
-             patch.object(designer.ui, 'confirm') as mock_confirm:
-            
-            # Mock user selections
-            mock_select.return_value = "Single Selection - Choose one option from a list"
-            mock_prompt.side_effect = [
-                "choice_id", "Choose option:", 
-                "Option 1", "Option 2", ""  # Choices, empty to finish
-            ]
-            mock_confirm.side_effect = [False, False, False, False]  # No optional fields
-            
-            step = designer.create_step()
-            
-            assert step is not None
-            assert step['type'] == 'select'
-            assert step['id'] == 'choice_id'
-            assert step['choices'] == ['Option 1', 'Option 2']
+        # Mock user selections
+        mock_ui.select.return_value = "Single Selection - Choose one option from a list"
+        mock_ui.prompt.side_effect = [
+            "choice_id", "Choose option:", 
+            "Option 1", "Option 2", ""  # Choices, empty to finish
+        ]
+        mock_ui.confirm.side_effect = [False, False, False, False]  # No optional fields
+        
+        step = designer.create_step()
+        
+        assert step is not None
+        assert step['type'] == 'select'
+        assert step['id'] == 'choice_id'
+        assert step['choices'] == ['Option 1', 'Option 2']
     
-    def test_create_output_mapping(self, temp_flows_dir):
+    def test_create_output_mapping(self, mock_ui, temp_flows_dir):
         """Test creating output mapping."""
         designer = InteractiveFlowDesigner(flows_dir=str(temp_flows_dir))
         
@@ -337,19 +342,16 @@ class TestInteractiveFlowDesigner:
             {'id': 'computed_value', 'type': 'computed'}  # Should be skipped
         ]
         
-        with patch.object(designer.ui, 'confirm') as mock_confirm, \
-             patch.object(designer.ui, 'prompt') as mock_prompt:
-            
-            # Mock confirmations for mapping steps
-            mock_confirm.side_effect = [True, True]  # Map both non-computed steps
-            mock_prompt.side_effect = ["user.name", "user.email"]
-            
-            mapping = designer.create_output_mapping(steps)
-            
-            assert mapping == {
-                'name': 'user.name',
-                'email': 'user.email'
-            }
+        # Mock confirmations for mapping steps
+        mock_ui.confirm.side_effect = [True, True]  # Map both non-computed steps
+        mock_ui.prompt.side_effect = ["user.name", "user.email"]
+        
+        mapping = designer.create_output_mapping(steps)
+        
+        assert mapping == {
+            'name': 'user.name',
+            'email': 'user.email'
+        }
 
 
 class TestCLIIntegration:
@@ -367,13 +369,31 @@ class TestCLIIntegration:
         assert preview is not None
         assert demo is not None
     
-    @patch('sys.argv', ['tui-designer', '--help'])
-    def test_cli_help(self):
+    def test_cli_help(self, monkeypatch):
         """Test CLI help functionality."""
         from tui_form_designer.tools.cli import main
         
+        monkeypatch.setattr('sys.argv', ['tui-designer', '--help'])
         with pytest.raises(SystemExit) as exc_info:
             main()
         
         # Help should exit with code 0
-        assert exc_info.value.code == 0
\ No newline at end of file
+        assert exc_info.value.code == 0
+    
+    def test_cli_only_builds_selected_command_arguments(self, capsys):
+        """Test the parser only gets arguments for the requested command."""
+        from tui_form_designer.tools.cli import _build_parser, _find_command
+        
+        assert _find_command(["--flows-dir", "validate", "test"]) == "test"
+        assert _find_command(["--flows-dir=x", "validate", "-i"]) == "validate"
+        assert _find_command(["unknown"]) is None
+        assert _find_command(["--flows-dir=x", "test"]) == "test"
+        assert _find_command(["--flows", "x", "preview", "-l"]) == "preview"
+        assert _find_command(["--flows=design", "demo"]) == "demo"
+        assert _find_command(["--flows-dir"]) is None
+        assert capsys.readouterr().err == ""
+        
+        args = _build_parser("validate").parse_args(["validate", "-j", "2", "a.yml"])
+        assert args.jobs == 2
+        assert args.flows == ["a.yml"]
+        assert not hasattr(args, "mock_data")
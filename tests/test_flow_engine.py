@@ -6,7 +6,7 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from tui_form_designer.core.flow_engine import FlowEngine
-from tui_form_designer.core.exceptions import FlowValidationError, FlowExecutionError
+from tui_form_designer.core.exceptions import FlowValidationError
 
 
 class TestFlowEngine:
@@ -53,40 +53,56 @@ class TestFlowEngine:
         flow_def = flow_engine._load_flow("test_flow")
         assert flow_def == sample_flow_definition
     
+    def test_load_flow_reuses_unchanged_file(
+        self, flow_engine, sample_flow_file, sample_flow_definition, write_flow, monkeypatch
+    ):
+        """Test unchanged flows are not re-parsed and callers get copies."""
+        mock_load = MagicMock(wraps=yaml.load)
+        monkeypatch.setattr('tui_form_designer.core.flow_engine.yaml.load', mock_load)
+        first = flow_engine._load_flow("test_flow")
+        first['steps'].clear()
+        second = flow_engine._load_flow("test_flow")
+        assert mock_load.call_count == 1
+        assert len(second['steps']) == 4
+        
+        write_flow(sample_flow_file, {**sample_flow_definition, 'extra_field': 'changed'})
+        assert flow_engine._load_flow("test_flow")['extra_field'] == "changed"
+        assert mock_load.call_count == 2
+    
     def test_load_flow_not_found(self, flow_engine):
         """Test loading a non-existent flow."""
         with pytest.raises(FlowValidationError, match="Flow definition not found"):
             flow_engine._load_flow("nonexistent")
     
-    def test_validate_flow_valid(self, flow_engine, sample_flow_definition):
+    def test_validate_flow_valid(self, shared_flow_engine, sample_flow_definition):
         """Test validation of a valid flow."""
-        errors = flow_engine.validate_flow(sample_flow_definition)
+        errors = shared_flow_engine.validate_flow(sample_flow_definition)
         assert errors == []
     
-    def test_validate_flow_missing_required_fields(self, flow_engine):
+    def test_validate_flow_missing_required_fields(self, shared_flow_engine):
         """Test validation of flow missing required fields."""
         invalid_flow = {}
-        errors = flow_engine.validate_flow(invalid_flow)
+        errors = shared_flow_engine.validate_flow(invalid_flow)
         assert len(errors) == 3  # Missing flow_id, title, steps
         assert any("Missing required field: flow_id" in error for error in errors)
         assert any("Missing required field: title" in error for error in errors)
         assert any("Missing required field: steps" in error for error in errors)
     
-    def test_validate_flow_invalid_steps(self, flow_engine, invalid_flow_definition):
+    def test_validate_flow_invalid_steps(self, shared_flow_engine, invalid_flow_definition):
         """Test validation of flow with invalid steps."""
-        errors = flow_engine.validate_flow(invalid_flow_definition)
+        errors = shared_flow_engine.validate_flow(invalid_flow_definition)
         assert len(errors) > 0
         assert any("Missing 'id' field" in error for error in errors)
         assert any("Duplicate step ID" in error for error in errors)
         assert any("Invalid step type" in error for error in errors)
     
-    def test_should_show_step_no_condition(self, flow_engine):
+    def test_should_show_step_no_condition(self, shared_flow_engine):
         """Test step visibility with no condition."""
         step = {'id': 'test', 'type': 'text', 'message': 'Test'}
         context = {}
-        assert flow_engine._should_show_step(step, context) is True
+        assert shared_flow_engine._should_show_step(step, context) is True
     
-    def test_should_show_step_with_condition_true(self, flow_engine):
+    def test_should_show_step_with_condition_true(self, shared_flow_engine):
         """Test step visibility with condition that evaluates to true."""
         step = {
             'id': 'test',
@@ -95,9 +111,9 @@ class TestFlowEngine:
             'condition': 'enable_feature == true'
         }
         context = {'enable_feature': True}
-        assert flow_engine._should_show_step(step, context) is True
+        assert shared_flow_engine._should_show_step(step, context) is True
     
-    def test_should_show_step_with_condition_false(self, flow_engine):
+    def test_should_show_step_with_condition_false(self, shared_flow_engine):
         """Test step visibility with condition that evaluates to false."""
         step = {
             'id': 'test',
@@ -106,27 +122,27 @@ class TestFlowEngine:
             'condition': 'enable_feature == true'
         }
         context = {'enable_feature': False}
-        assert flow_engine._should_show_step(step, context) is False
+        assert shared_flow_engine._should_show_step(step, context) is False
     
-    def test_evaluate_expression_equality(self, flow_engine):
+    def test_evaluate_expression_equality(self, shared_flow_engine):
         """Test expression evaluation with equality operators."""
         context = {'value': 'test', 'number': 42, 'flag': True}
         
-        assert flow_engine._evaluate_expression('value == test', context) is True
-        assert flow_engine._evaluate_expression('value == other', context) is False
-        assert flow_engine._evaluate_expression('number == 42', context) is True
-        assert flow_engine._evaluate_expression('flag == true', context) is True
-        assert flow_engine._evaluate_expression('flag == false', context) is False
+        assert shared_flow_engine._evaluate_expression('value == test', context) is True
+        assert shared_flow_engine._evaluate_expression('value == other', context) is False
+        assert shared_flow_engine._evaluate_expression('number == 42', context) is True
+        assert shared_flow_engine._evaluate_expression('flag == true', context) is True
+        assert shared_flow_engine._evaluate_expression('flag == false', context) is False
     
-    def test_evaluate_expression_boolean_check(self, flow_engine):
+    def test_evaluate_expression_boolean_check(self, shared_flow_engine):
         """Test expression evaluation with boolean checks."""
         context = {'enabled': True, 'disabled': False}
         
-        assert flow_engine._evaluate_expression('enabled', context) is True
-        assert flow_engine._evaluate_expression('disabled', context) is False
-        assert flow_engine._evaluate_expression('nonexistent', context) is False
+        assert shared_flow_engine._evaluate_expression('enabled', context) is True
+        assert shared_flow_engine._evaluate_expression('disabled', context) is False
+        assert shared_flow_engine._evaluate_expression('nonexistent', context) is False
     
-    def test_get_nested_value(self, flow_engine):
+    def test_get_nested_value(self, shared_flow_engine):
         """Test getting nested values from context."""
         context = {
             'user': {
@@ -137,27 +153,27 @@ class TestFlowEngine:
             }
         }
         
-        assert flow_engine._get_nested_value(context, 'user.name') == 'John'
-        assert flow_engine._get_nested_value(context, 'user.profile.email') == 'john@example.com'
-        assert flow_engine._get_nested_value(context, 'user.nonexistent') is None
+        assert shared_flow_engine._get_nested_value(context, 'user.name') == 'John'
+        assert shared_flow_engine._get_nested_value(context, 'user.profile.email') == 'john@example.com'
+        assert shared_flow_engine._get_nested_value(context, 'user.nonexistent') is None
     
-    def test_format_preview(self, flow_engine):
+    def test_format_preview(self, shared_flow_engine):
         """Test preview text formatting."""
         context = {'name': 'John', 'age': 25}
         template = "User {name} is {age} years old"
         
-        result = flow_engine._format_preview(template, context)
+        result = shared_flow_engine._format_preview(template, context)
         assert result == "User John is 25 years old"
     
-    def test_apply_output_mapping_simple(self, flow_engine):
+    def test_apply_output_mapping_simple(self, shared_flow_engine):
         """Test simple output mapping."""
         answers = {'name': 'John', 'age': 25}
         mapping = {'user_name': 'name', 'user_age': 'age'}
         
-        result = flow_engine._apply_output_mapping(answers, mapping)
+        result = shared_flow_engine._apply_output_mapping(answers, mapping)
         assert result == {'user_name': 'John', 'user_age': 25}
     
-    def test_apply_output_mapping_nested(self, flow_engine):
+    def test_apply_output_mapping_nested(self, shared_flow_engine):
         """Test nested output mapping."""
         answers = {'name': 'John', 'email': 'john@example.com', 'subscribe': True}
         mapping = {
@@ -170,7 +186,7 @@ class TestFlowEngine:
             }
         }
         
-        result = flow_engine._apply_output_mapping(answers, mapping)
+        result = shared_flow_engine._apply_output_mapping(answers, mapping)
         expected = {
             'user': {
                 'name': 'John',
@@ -197,120 +213,72 @@ class TestFlowEngine:
         # Should have printed flow header
         mock_print.assert_called()
     
-    def test_build_question_text(self, flow_engine):
-        """Test building text question."""
-        step = {
+    @pytest.mark.parametrize("step", [
+        {
             'id': 'test',
             'type': 'text',
             'message': 'Enter text:',
             'default': 'default_value',
             'instruction': 'Help text'
-        }
-        context = {}
-        
-        question = flow_engine._build_question(step, context)
-        assert question is not None
-        # Can't easily test questionary internals, but verify it was created
-    
-    def test_build_question_select(self, flow_engine):
-        """Test building select question."""
-        step = {
+        },
+        {
             'id': 'test',
             'type': 'select',
             'message': 'Choose option:',
             'choices': ['Option 1', 'Option 2', 'Option 3'],
             'default': 'Option 1'
-        }
-        context = {}
-        
-        question = flow_engine._build_question(step, context)
-        assert question is not None
-    
-    def test_build_question_confirm(self, flow_engine):
-        """Test building confirm question."""
-        step = {
+        },
+        {
             'id': 'test',
             'type': 'confirm',
             'message': 'Confirm action?',
             'default': True
-        }
-        context = {}
-        
-        question = flow_engine._build_question(step, context)
-        assert question is not None
-    
-    def test_build_question_password(self, flow_engine):
-        """Test building password question."""
-        step = {
+        },
+        {
             'id': 'test',
             'type': 'password',
             'message': 'Enter password:',
             'instruction': 'At least 8 characters'
-        }
-        context = {}
-        
-        question = flow_engine._build_question(step, context)
+        },
+    ], ids=["text", "select", "confirm", "password"])
+    def test_build_question(self, shared_flow_engine, step):
+        """Test building a question for each step type."""
+        question = shared_flow_engine._build_question(step, {})
         assert question is not None
+        # Can't easily test questionary internals, but verify it was created
     
-    def test_validators_required(self, flow_engine):
-        """Test required validator."""
-        validator = flow_engine.validators['required']
-        
-        assert validator('test') is True
-        
-        with pytest.raises(Exception):  # ValidationError
-            validator('')
-        
-        with pytest.raises(Exception):  # ValidationError
-            validator('   ')
-    
-    def test_validators_email(self, flow_engine):
-        """Test email validator."""
-        validator = flow_engine.validators['email']
-        
-        assert validator('test@example.com') is True
-        assert validator('') is True  # Allow empty for optional fields
-        
-        with pytest.raises(Exception):  # ValidationError
-            validator('invalid-email')
-    
-    def test_validators_integer(self, flow_engine):
-        """Test integer validator."""
-        validator = flow_engine.validators['integer']
-        
-        assert validator('123') is True
-        assert validator('0') is True
-        assert validator('') is True  # Allow empty for optional fields
-        
-        with pytest.raises(Exception):  # ValidationError
-            validator('not-a-number')
-    
-    def test_validators_password_length(self, flow_engine):
-        """Test password length validator."""
-        validator = flow_engine.validators['password_length']
+    @pytest.mark.parametrize("name, valid, invalid", [
+        ('required', ['test'], ['', '   ']),
+        # Empty input is allowed for optional fields
+        ('email', ['test@example.com', ''], ['invalid-email']),
+        ('integer', ['123', '0', ''], ['not-a-number']),
+        ('password_length', ['12345678', 'verylongpassword'], ['short']),
+    ])
+    def test_validators(self, shared_flow_engine, name, valid, invalid):
+        """Test each built-in validator accepts and rejects the right input."""
+        validator = shared_flow_engine.validators[name]
         
-        assert validator('12345678') is True
-        assert validator('verylongpassword') is True
+        for value in valid:
+            assert validator(value) is True
         
-        with pytest.raises(Exception):  # ValidationError
-            validator('short')
+        for value in invalid:
+            with pytest.raises(Exception):  # ValidationError
+                validator(value)
     
     def test_load_flow_invalid_yaml(self, flow_engine, temp_flows_dir):
         """Test loading flow with invalid YAML."""
         # Create invalid YAML file
         invalid_yaml = temp_flows_dir / "invalid.yml"
-        with open(invalid_yaml, 'w') as f:
-            f.write("invalid: yaml: content: [")
+        invalid_yaml.write_bytes(b"invalid: yaml: content: [")
         
         with pytest.raises(FlowValidationError, match="Invalid YAML"):
             flow_engine._load_flow("invalid")
     
-    def test_execute_flow_validation_error(self, flow_engine, temp_flows_dir, invalid_flow_definition):
+    def test_execute_flow_validation_error(self, flow_engine, temp_flows_dir, invalid_flow_bytes):
         """Test flow execution with validation errors."""
         # Create flow file with validation errors
         flow_path = temp_flows_dir / "invalid_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(invalid_flow_definition, f)
+        flow_path.write_bytes(invalid_flow_bytes)
         
         with pytest.raises(FlowValidationError):
             flow_engine.execute_flow("invalid_flow")
\ No newline at end of file
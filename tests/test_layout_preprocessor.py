@@ -0,0 +1,123 @@
+"""Tests for the tui_form_engine LayoutPreprocessor."""
+
+import pytest
+import yaml
+
+from tui_form_engine.preprocessing.layout_preprocessor import LayoutPreprocessor
+
+MAIN_LAYOUT = """\
+title: Main Layout
+steps:
+  - id: intro
+    type: text
+    message: 'Intro:'
+  - subid: choices
+    sublayout: choices.yml
+"""
+
+CHOICES_SUBLAYOUT = """\
+steps:
+  - id: color
+    type: select
+    message: 'Pick a color:'
+    choices:
+      - name: Red
+        value: red
+      - Blue
+"""
+
+
+def _sublayout(step_ids):
+    """YAML text for a sublayout holding one text step per ID."""
+    return "steps:\n" + "".join(
+        f"  - id: {step_id}\n    type: text\n    message: '{step_id}:'\n"
+        for step_id in step_ids
+    )
+
+
+def _main_layout(sublayouts):
+    """YAML text for a main layout referencing the given sublayout files."""
+    return "title: Main Layout\nsteps:\n" + "".join(
+        f"  - sublayout: {name}\n" for name in sublayouts
+    )
+
+
+@pytest.fixture
+def layout_dir(tmp_path):
+    """A layouts directory with a main layout and one sublayout."""
+    (tmp_path / "main.yml").write_text(MAIN_LAYOUT)
+    (tmp_path / "choices.yml").write_text(CHOICES_SUBLAYOUT)
+    return tmp_path
+
+
+class TestLayoutPreprocessor:
+    """Test suite for LayoutPreprocessor."""
+    
+    def test_returned_steps_do_not_alias_cache(self, layout_dir):
+        """Test modifying nested step values leaves the next reconstruction intact."""
+        preprocessor = LayoutPreprocessor(layout_dir)
+        layout = preprocessor.reconstruct_virtual_layout(layout_dir / "main.yml")
+        color = layout['steps'][1]
+        color['choices'][0]['value'] = 'changed'
+        color['choices'].append('Green')
+        
+        layout = preprocessor.reconstruct_virtual_layout(layout_dir / "main.yml")
+        assert layout['steps'][1]['choices'] == [{'name': 'Red', 'value': 'red'}, 'Blue']
+    
+    def test_saved_layout_matches_one_shot_dump(self, layout_dir, tmp_path_factory):
+        """Test the streamed virtual layout file matches dumping it in one call."""
+        output_path = tmp_path_factory.mktemp("virtual") / "main_virtual.yml"
+        layout = LayoutPreprocessor(layout_dir).reconstruct_virtual_layout(
+            layout_dir / "main.yml", save_virtual=True, output_path=output_path
+        )
+        
+        expected = yaml.safe_dump(
+            layout,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+            width=10_000
+        )
+        assert output_path.read_text(encoding='utf-8') == expected
+        assert yaml.safe_load(output_path.read_text(encoding='utf-8')) == layout
+    
+    def test_sublayout_referenced_twice(self, tmp_path):
+        """Test a sublayout used twice is not circular but repeats its step IDs."""
+        (tmp_path / "shared.yml").write_text(_sublayout(['name']))
+        (tmp_path / "main.yml").write_text(_main_layout(['shared.yml', 'shared.yml']))
+        
+        with pytest.raises(ValueError, match="Duplicate step IDs found: name"):
+            LayoutPreprocessor(tmp_path).reconstruct_virtual_layout(tmp_path / "main.yml")
+    
+    @pytest.mark.parametrize("others", [0, 3], ids=["serial", "pool"])
+    def test_circular_reference(self, tmp_path, others):
+        """Test a layout that references itself still raises on both load paths."""
+        names = [f"sub_{i}.yml" for i in range(others)]
+        for i, name in enumerate(names):
+            (tmp_path / name).write_text(_sublayout([f'step_{i}']))
+        (tmp_path / "main.yml").write_text(_main_layout(names + ['main.yml']))
+        
+        with pytest.raises(ValueError, match="Circular sublayout reference detected"):
+            LayoutPreprocessor(tmp_path).reconstruct_virtual_layout(tmp_path / "main.yml")
+    
+    def test_pool_keeps_load_order(self, tmp_path):
+        """Test sublayouts read on the thread pool are merged in reference order."""
+        # Differently sized files so reads are unlikely to finish in order
+        step_ids = {}
+        for i in range(6):
+            step_ids[f"sub_{i}.yml"] = [f'sub{i}_step{j}' for j in range((6 - i) * 20)]
+            (tmp_path / f"sub_{i}.yml").write_text(_sublayout(step_ids[f"sub_{i}.yml"]))
+        names = list(step_ids)
+        (tmp_path / "main.yml").write_text(
+            _main_layout(names[:3])
+            + "  - id: inline\n    type: text\n    message: 'Inline:'\n"
+            + "".join(f"  - sublayout: {name}\n" for name in names[3:])
+        )
+        expected = [step_id for name in names[:3] for step_id in step_ids[name]]
+        expected.append('inline')
+        expected.extend(step_id for name in names[3:] for step_id in step_ids[name])
+        
+        preprocessor = LayoutPreprocessor(tmp_path)
+        layout = preprocessor.reconstruct_virtual_layout(tmp_path / "main.yml")
+        assert [step['id'] for step in layout['steps']] == expected
+        assert preprocessor.loaded_sublayouts == {(tmp_path / name).resolve() for name in names}
@@ -7,6 +7,30 @@ from io import StringIO
 from tui_form_designer.ui.questionary_ui import QuestionaryUI
 
 
+@pytest.fixture(autouse=True)
+def interactive_stdout(monkeypatch):
+    """Make QuestionaryUI see a terminal so styled output is exercised."""
+    monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+
+
+@pytest.fixture
+def mock_print(monkeypatch):
+    """Record what QuestionaryUI writes through questionary's print."""
+    mock = MagicMock()
+    monkeypatch.setattr("tui_form_designer.ui.questionary_ui.qprint", mock)
+    return mock
+
+
+@pytest.fixture(scope="class")
+def ui():
+    """One QuestionaryUI per test class for tests that keep no UI state."""
+    # Built before the function-scoped interactive_stdout patch applies, so
+    # pin the terminal check for construction here
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("sys.stdout.isatty", lambda: True)
+        return QuestionaryUI()
+
+
 class TestQuestionaryUI:
     """Test suite for QuestionaryUI."""
     
@@ -25,10 +49,8 @@ class TestQuestionaryUI:
         ui = QuestionaryUI(theme="minimal")
         assert ui.style is not None
     
-    def test_get_theme_style(self):
+    def test_get_theme_style(self, ui):
         """Test theme style retrieval."""
-        ui = QuestionaryUI()
-        
         # Test all theme types
         default_style = ui._get_theme_style("default")
         dark_style = ui._get_theme_style("dark")
@@ -42,10 +64,12 @@ class TestQuestionaryUI:
         unknown_style = ui._get_theme_style("unknown")
         assert unknown_style == default_style
     
-    @patch('tui_form_designer.ui.questionary_ui.qprint')
-    def test_show_title(self, mock_print):
+    def test_theme_styles_shared_between_instances(self):
+        """Test theme styles are built once and shared by all instances."""
+        assert QuestionaryUI(theme="dark").style is QuestionaryUI(theme="dark").style
+    
+    def test_show_title(self, mock_print, ui):
         """Test showing title."""
-        ui = QuestionaryUI()
         ui.show_title("Test Title", "🚀")
         
         assert mock_print.call_count == 2
@@ -54,10 +78,8 @@ class TestQuestionaryUI:
         # Second call should be the separator
         mock_print.assert_any_call("============", style="blue")
     
-    @patch('tui_form_designer.ui.questionary_ui.qprint')
-    def test_show_phase_header(self, mock_print):
+    def test_show_phase_header(self, mock_print, ui):
         """Test showing phase header."""
-        ui = QuestionaryUI()
         ui.show_phase_header("Phase 1", "Description", "📋")
         
         assert mock_print.call_count == 3
@@ -65,52 +87,85 @@ class TestQuestionaryUI:
         mock_print.assert_any_call("   Description", style="italic")
         mock_print.assert_any_call("-" * 50, style="dim")
     
-    @patch('tui_form_designer.ui.questionary_ui.qprint')
-    def test_show_section_header(self, mock_print):
+    def test_show_section_header(self, mock_print, ui):
         """Test showing section header."""
-        ui = QuestionaryUI()
         ui.show_section_header("Section", "🔧")
         
         mock_print.assert_called_once_with("\\n🔧 Section", style="bold yellow")
     
-    @patch('tui_form_designer.ui.questionary_ui.qprint')
-    def test_show_messages(self, mock_print):
+    @pytest.mark.parametrize("method, message, expected, style", [
+        ("show_success", "Success message", "✅ Success message", "bold green"),
+        ("show_error", "Error message", "❌ Error message", "bold red"),
+        ("show_warning", "Warning message", "⚠️ Warning message", "bold yellow"),
+        ("show_info", "Info message", "ℹ️ Info message", "bold"),
+        ("show_step", "Step message", "   → Step message", "dim"),
+    ])
+    def test_show_messages(self, mock_print, method, message, expected, style, ui):
         """Test showing different message types."""
+        getattr(ui, method)(message)
+        mock_print.assert_called_once_with(expected, style=style)
+    
+    def test_show_messages_plain_when_not_tty(self, mock_print, monkeypatch, capsys):
+        """Test messages skip icons and styling when stdout is not a terminal."""
+        monkeypatch.setattr("sys.stdout.isatty", lambda: False)
         ui = QuestionaryUI()
         
-        ui.show_success("Success message")
-        mock_print.assert_called_with("✅ Success message", style="bold green")
-        
-        ui.show_error("Error message")
-        mock_print.assert_called_with("❌ Error message", style="bold red")
+        ui.show_title("Report")
+        ui.show_section_header("Checks")
+        ui.show_success("All good")
+        ui.show_steps(["one", "two"])
+        ui.show_error("Broken")
         
-        ui.show_warning("Warning message")
-        mock_print.assert_called_with("⚠️ Warning message", style="bold yellow")
+        mock_print.assert_not_called()
+        assert capsys.readouterr().out == (
+            "\nReport\n============\n\nChecks\nAll good\n"
+            "   → one\n   → two\nBroken\n"
+        )
+    
+    def test_show_steps(self, mock_print, ui):
+        """Test showing several step messages in one write."""
+        ui.show_steps(["First", "Second"])
         
-        ui.show_info("Info message")
-        mock_print.assert_called_with("ℹ️ Info message", style="bold")
+        mock_print.assert_called_once_with("   → First\n   → Second", style="dim")
         
-        ui.show_step("Step message")
-        mock_print.assert_called_with("   → Step message", style="dim")
+        mock_print.reset_mock()
+        ui.show_steps([])
+        mock_print.assert_not_called()
     
-    @patch('tui_form_designer.ui.questionary_ui.qprint')
     def test_show_progress(self, mock_print):
         """Test showing progress indicator."""
         ui = QuestionaryUI()
         ui.show_progress(3, 10, "Processing")
         
         # Should show progress bar with percentage
-        mock_print.assert_called_once()
-        call_args = mock_print.call_args[0][0]
-        assert "[" in call_args and "]" in call_args
-        assert "30%" in call_args
-        assert "(3/10)" in call_args
-        assert "Processing" in call_args
+        mock_print.assert_called_once_with(
+            "[██████░░░░░░░░░░░░░░] 30% (3/10) - Processing", style="bold blue"
+        )
+    
+    def test_show_progress_past_end(self, mock_print):
+        """Test progress beyond the total draws a full bar instead of failing."""
+        ui = QuestionaryUI()
+        ui.show_progress(5, 3, "x")
+        
+        mock_print.assert_called_once_with(
+            "[████████████████████] 166% (5/3) - x", style="bold blue"
+        )
+    
+    def test_show_progress_skips_unchanged_redraw(self, mock_print):
+        """Test repeated identical progress updates are only drawn once."""
+        ui = QuestionaryUI()
+        ui.show_progress(3, 10)
+        ui.show_progress(3, 10)
+        ui.show_progress(10, 10)
+        
+        assert mock_print.call_count == 2
+        mock_print.assert_called_with(
+            "[████████████████████] 100% (10/10)", style="bold blue"
+        )
     
     @patch('questionary.confirm')
-    def test_confirm(self, mock_confirm):
+    def test_confirm(self, mock_confirm, ui):
         """Test confirmation prompt."""
-        ui = QuestionaryUI()
         mock_confirm.return_value.ask.return_value = True
         
         result = ui.confirm("Continue?", default=True)
@@ -119,20 +174,19 @@ class TestQuestionaryUI:
         mock_confirm.assert_called_once_with("Continue?", default=True, style=ui.style)
     
     @patch('questionary.confirm')
-    def test_confirm_keyboard_interrupt(self, mock_confirm):
+    def test_confirm_keyboard_interrupt(self, mock_confirm, monkeypatch, ui):
         """Test confirmation prompt with keyboard interrupt."""
-        ui = QuestionaryUI()
         mock_confirm.return_value.ask.side_effect = KeyboardInterrupt()
         
-        with patch.object(ui, 'show_error') as mock_error:
-            result = ui.confirm("Continue?")
-            assert result is False
-            mock_error.assert_called_once_with("Operation cancelled by user")
+        mock_error = MagicMock()
+        monkeypatch.setattr(QuestionaryUI, 'show_error', mock_error)
+        result = ui.confirm("Continue?")
+        assert result is False
+        mock_error.assert_called_once_with("Operation cancelled by user")
     
     @patch('tui_form_designer.ui.questionary_ui.text')
-    def test_prompt(self, mock_text):
+    def test_prompt(self, mock_text, ui):
         """Test text prompt."""
-        ui = QuestionaryUI()
         mock_text.return_value.ask.return_value = "test input"
         
         result = ui.prompt("Enter text:", default="default", allow_empty=True)
@@ -146,22 +200,21 @@ class TestQuestionaryUI:
         )
     
     @patch('tui_form_designer.ui.questionary_ui.text')
-    def test_prompt_empty_not_allowed(self, mock_text):
+    def test_prompt_empty_not_allowed(self, mock_text, monkeypatch, ui):
         """Test text prompt with empty input not allowed."""
-        ui = QuestionaryUI()
         # First call returns empty, second returns valid input
         mock_text.return_value.ask.side_effect = ["", "valid input"]
         
-        with patch.object(ui, 'show_error') as mock_error:
-            result = ui.prompt("Enter text:", allow_empty=False)
-            
-            assert result == "valid input"
-            mock_error.assert_called_once_with("This field is required")
+        mock_error = MagicMock()
+        monkeypatch.setattr(QuestionaryUI, 'show_error', mock_error)
+        result = ui.prompt("Enter text:", allow_empty=False)
+        
+        assert result == "valid input"
+        mock_error.assert_called_once_with("This field is required")
     
     @patch('tui_form_designer.ui.questionary_ui.text')
-    def test_prompt_int(self, mock_text):
+    def test_prompt_int(self, mock_text, ui):
         """Test integer prompt."""
-        ui = QuestionaryUI()
         mock_text.return_value.ask.return_value = "42"
         
         result = ui.prompt_int("Enter number:", default=10, min_value=1, max_value=100)
@@ -169,35 +222,34 @@ class TestQuestionaryUI:
         assert result == 42
     
     @patch('tui_form_designer.ui.questionary_ui.text')
-    def test_prompt_int_invalid_then_valid(self, mock_text):
+    def test_prompt_int_invalid_then_valid(self, mock_text, monkeypatch, ui):
         """Test integer prompt with invalid then valid input."""
-        ui = QuestionaryUI()
         mock_text.return_value.ask.side_effect = ["invalid", "42"]
         
-        with patch.object(ui, 'show_error') as mock_error:
-            result = ui.prompt_int("Enter number:")
-            
-            assert result == 42
-            mock_error.assert_called_with("Please enter a valid number")
+        mock_error = MagicMock()
+        monkeypatch.setattr(QuestionaryUI, 'show_error', mock_error)
+        result = ui.prompt_int("Enter number:")
+        
+        assert result == 42
+        mock_error.assert_called_with("Please enter a valid number")
     
     @patch('tui_form_designer.ui.questionary_ui.text')
-    def test_prompt_int_out_of_range(self, mock_text):
+    def test_prompt_int_out_of_range(self, mock_text, monkeypatch, ui):
         """Test integer prompt with out of range values."""
-        ui = QuestionaryUI()
         mock_text.return_value.ask.side_effect = ["0", "101", "50"]
         
-        with patch.object(ui, 'show_error') as mock_error:
-            result = ui.prompt_int("Enter number:", min_value=1, max_value=100)
-            
-            assert result == 50
-            assert mock_error.call_count == 2
-            mock_error.assert_any_call("Value must be at least 1")
-            mock_error.assert_any_call("Value must be at most 100")
+        mock_error = MagicMock()
+        monkeypatch.setattr(QuestionaryUI, 'show_error', mock_error)
+        result = ui.prompt_int("Enter number:", min_value=1, max_value=100)
+        
+        assert result == 50
+        assert mock_error.call_count == 2
+        mock_error.assert_any_call("Value must be at least 1")
+        mock_error.assert_any_call("Value must be at most 100")
     
     @patch('questionary.password')
-    def test_prompt_password(self, mock_password):
+    def test_prompt_password(self, mock_password, ui):
         """Test password prompt."""
-        ui = QuestionaryUI()
         mock_password.return_value.ask.return_value = "secret123"
         
         result = ui.prompt_password("Enter password:")
@@ -210,21 +262,20 @@ class TestQuestionaryUI:
         )
     
     @patch('questionary.password')
-    def test_prompt_password_empty_retry(self, mock_password):
+    def test_prompt_password_empty_retry(self, mock_password, monkeypatch, ui):
         """Test password prompt with empty input retry."""
-        ui = QuestionaryUI()
         mock_password.return_value.ask.side_effect = ["", "secret123"]
         
-        with patch.object(ui, 'show_error') as mock_error:
-            result = ui.prompt_password("Enter password:")
-            
-            assert result == "secret123"
-            mock_error.assert_called_once_with("Password cannot be empty")
+        mock_error = MagicMock()
+        monkeypatch.setattr(QuestionaryUI, 'show_error', mock_error)
+        result = ui.prompt_password("Enter password:")
+        
+        assert result == "secret123"
+        mock_error.assert_called_once_with("Password cannot be empty")
     
     @patch('tui_form_designer.ui.questionary_ui.select')
-    def test_select(self, mock_select):
+    def test_select(self, mock_select, ui):
         """Test select prompt."""
-        ui = QuestionaryUI()
         mock_select.return_value.ask.return_value = "Option 2"
         
         choices = ["Option 1", "Option 2", "Option 3"]
@@ -239,9 +290,8 @@ class TestQuestionaryUI:
         )
     
     @patch('tui_form_designer.ui.questionary_ui.select')
-    def test_select_with_dict_choices(self, mock_select):
+    def test_select_with_dict_choices(self, mock_select, ui):
         """Test select prompt with dictionary choices."""
-        ui = QuestionaryUI()
         mock_select.return_value.ask.return_value = "Choice 1"
         
         choices = [{"name": "Choice 1", "value": "val1"}, {"name": "Choice 2", "value": "val2"}]
@@ -257,17 +307,14 @@ class TestQuestionaryUI:
             style=ui.style
         )
     
-    def test_select_empty_choices(self):
+    def test_select_empty_choices(self, ui):
         """Test select prompt with empty choices list."""
-        ui = QuestionaryUI()
-        
         with pytest.raises(ValueError, match="Choices list cannot be empty"):
             ui.select("Choose option:", [])
     
     @patch('questionary.checkbox')
-    def test_multiselect(self, mock_checkbox):
+    def test_multiselect(self, mock_checkbox, ui):
         """Test multiselect prompt."""
-        ui = QuestionaryUI()
         mock_checkbox.return_value.ask.return_value = ["Option 1", "Option 3"]
         
         choices = ["Option 1", "Option 2", "Option 3"]
@@ -281,17 +328,15 @@ class TestQuestionaryUI:
         )
     
     @patch('questionary.press_any_key_to_continue')
-    def test_pause(self, mock_pause):
+    def test_pause(self, mock_pause, ui):
         """Test pause functionality."""
-        ui = QuestionaryUI()
         ui.pause("Press any key...")
         
         mock_pause.assert_called_once_with("Press any key...")
     
     @patch('tui_form_designer.ui.questionary_ui.form')
-    def test_form(self, mock_form):
+    def test_form(self, mock_form, ui):
         """Test form functionality."""
-        ui = QuestionaryUI()
         mock_form.return_value.ask.return_value = {"name": "John", "age": 30}
         
         questions = [
@@ -303,11 +348,31 @@ class TestQuestionaryUI:
         
         assert result == {"name": "John", "age": 30}
     
-    @patch('tui_form_designer.ui.questionary_ui.qprint')
-    def test_table(self, mock_print):
+    @patch('tui_form_designer.ui.questionary_ui.form')
+    @patch('tui_form_designer.ui.questionary_ui.select')
+    @patch('tui_form_designer.ui.questionary_ui.text')
+    def test_form_dispatches_by_type(self, mock_text, mock_select, mock_form, ui):
+        """Test form builds each question with the builder for its type."""
+        ui.form([
+            {"name": "name", "message": "Name:"},
+            {"name": "color", "type": "select", "message": "Color:", "choices": ["red"]},
+        ])
+        
+        mock_text.assert_called_once_with("Name:", default="", style=ui.style)
+        mock_select.assert_called_once_with(
+            "Color:", choices=["red"], default=None, style=ui.style
+        )
+        mock_form.assert_called_once_with(
+            name=mock_text.return_value, color=mock_select.return_value, style=ui.style
+        )
+    
+    def test_form_unknown_type(self, ui):
+        """Test form rejects unsupported question types."""
+        with pytest.raises(ValueError, match="Unsupported question type: slider"):
+            ui.form([{"name": "level", "type": "slider", "message": "Level:"}])
+    
+    def test_table(self, mock_print, ui):
         """Test table display."""
-        ui = QuestionaryUI()
-        
         data = [
             {"name": "John", "age": 30, "city": "NYC"},
             {"name": "Jane", "age": 25, "city": "LA"}
@@ -316,21 +381,32 @@ class TestQuestionaryUI:
         
         ui.table(data, headers)
         
-        # Should print header and data rows
-        assert mock_print.call_count >= 3  # Header, separator, data rows
+        # Header, separator and the data block are each written once
+        assert mock_print.call_count == 3
+        mock_print.assert_any_call("name | age | city", style="bold blue")
+        mock_print.assert_any_call("-----------------", style="blue")
+        mock_print.assert_any_call("John | 30  | NYC \nJane | 25  | LA  ", style=None)
     
-    @patch('tui_form_designer.ui.questionary_ui.qprint')
-    def test_table_empty_data(self, mock_print):
+    def test_table_empty_data(self, mock_print, ui):
         """Test table display with empty data."""
-        ui = QuestionaryUI()
         ui.table([], ["name", "age"])
         
         mock_print.assert_called_once_with("ℹ️ No data to display", style="bold")
     
     @patch('os.system')
-    def test_clear_screen(self, mock_system):
-        """Test screen clearing."""
-        ui = QuestionaryUI()
-        ui.clear_screen()
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_clear_screen(self, mock_stdout, mock_system, ui):
+        """Test screen clearing writes the ANSI escape sequence."""
+        with patch('tui_form_designer.ui.questionary_ui._VT_SUPPORTED', True):
+            ui.clear_screen()
+        
+        assert mock_stdout.getvalue() == "\x1b[H\x1b[2J"
+        mock_system.assert_not_called()
+    
+    @patch('os.system')
+    def test_clear_screen_legacy_console(self, mock_system, ui):
+        """Test screen clearing falls back to the shell without VT support."""
+        with patch('tui_form_designer.ui.questionary_ui._VT_SUPPORTED', False):
+            ui.clear_screen()
         
         mock_system.assert_called_once_with('clear')
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""Tests for the tui_form_engine production renderer."""
+
+import io
+import json
+
+import pytest
+
+from tui_form_engine.core.form_executor import FormExecutor
+from tui_form_engine.renderer import FormRenderer, main
+
+# rich is what the renderer draws with, but it is not a declared dependency
+Console = pytest.importorskip("rich.console").Console
+
+MAIN_LAYOUT = """\
+title: Setup
+metadata:
+  id: setup
+steps:
+  - id: name
+    type: text
+    message: 'Name:'
+  - subid: contact
+    sublayout: contact.yml
+"""
+
+CONTACT_SUBLAYOUT = """\
+steps:
+  - id: email
+    type: text
+    message: 'Email:'
+"""
+
+
+@pytest.fixture
+def layout_path(tmp_path):
+    """A main layout with one sublayout."""
+    (tmp_path / "contact.yml").write_text(CONTACT_SUBLAYOUT)
+    path = tmp_path / "setup.yml"
+    path.write_text(MAIN_LAYOUT)
+    return path
+
+
+@pytest.fixture
+def console_output():
+    """A non-terminal console whose output is kept in memory."""
+    return io.StringIO()
+
+
+@pytest.fixture
+def renderer(console_output, monkeypatch):
+    """FormRenderer writing to console_output, with questionary output muted."""
+    monkeypatch.setattr('questionary.print', lambda *args, **kwargs: None)
+    return FormRenderer(console=Console(file=console_output, force_terminal=False))
+
+
+class TestFormRenderer:
+    """Test suite for FormRenderer."""
+    
+    def test_render_flow_with_sublayouts(self, renderer, layout_path, tmp_path):
+        """Test a headless run merges sublayouts and writes the JSON output."""
+        output_file = tmp_path / "out" / "responses.json"
+        result = renderer.render_flow(
+            str(layout_path),
+            mock_responses={'name': 'Ann', 'email': 'ann@example.com'},
+            output_file=str(output_file),
+            quiet=True
+        )
+        
+        assert result['flow_id'] == "setup"
+        assert result['responses'] == {'name': 'Ann', 'email': 'ann@example.com'}
+        assert result['metadata'] == {
+            'total_steps': 2,
+            'execution_time': result['completed_at']
+        }
+        assert json.loads(output_file.read_text(encoding='utf-8')) == result
+    
+    def test_plain_summary_without_terminal(self, renderer, layout_path, console_output):
+        """Test piped output gets one-line summaries instead of panels."""
+        renderer.render_flow(
+            str(layout_path), mock_responses={'name': 'Ann', 'email': 'ann@example.com'}
+        )
+        
+        output = console_output.getvalue()
+        assert "Flow: Setup (2 steps)" in output
+        assert "Completed: 2 responses" in output
+        assert "Welcome" not in output
+    
+    def test_sublayout_defaults_applied(self, renderer, layout_path, tmp_path, monkeypatch):
+        """Test global and sublayout defaults reach the steps the engine runs."""
+        layout_path.write_text(MAIN_LAYOUT + "defaults_file: global_defaults.yml\n")
+        (tmp_path / "contact.yml").write_text(
+            CONTACT_SUBLAYOUT + "sublayout_defaults: contact_defaults.yml\n"
+        )
+        (tmp_path / "global_defaults.yml").write_text(
+            "defaults:\n  name: Global\n  email: global@example.com\n"
+        )
+        (tmp_path / "contact_defaults.yml").write_text(
+            "defaults:\n  email: contact@example.com\n"
+        )
+        flows = []
+        execute_flow = FormExecutor.execute_flow
+        
+        def record_flow(self, flow_id, **kwargs):
+            flows.append(kwargs['flow_data'])
+            return execute_flow(self, flow_id, **kwargs)
+        
+        # FormExecutor has __slots__, so patch the class rather than the instance
+        monkeypatch.setattr(FormExecutor, 'execute_flow', record_flow)
+        
+        renderer.render_flow(
+            str(layout_path), mock_responses={'name': 'Ann', 'email': 'ann@example.com'}, quiet=True
+        )
+        
+        assert {step['id']: step['default'] for step in flows[0]['steps']} == {
+            'name': 'Global', 'email': 'contact@example.com'
+        }
+    
+    def test_invalid_flow(self, renderer, tmp_path):
+        """Test structural errors are reported together as a ValueError."""
+        path = tmp_path / "broken.yml"
+        path.write_text("steps:\n  - type: select\n")
+        
+        with pytest.raises(ValueError) as excinfo:
+            renderer.render_flow(str(path), quiet=True)
+        message = str(excinfo.value)
+        assert "Missing required field: 'title'" in message
+        assert "Missing required field 'id'" in message
+        assert "Select type requires 'choices' field" in message
+    
+    def test_missing_flow(self, renderer, tmp_path):
+        """Test a missing flow file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="Flow definition not found"):
+            renderer.render_flow(str(tmp_path / "missing.yml"), quiet=True)
+    
+    def test_main_quiet_prints_responses(self, layout_path, tmp_path, monkeypatch, capsys):
+        """Test the CLI's quiet mode writes just the responses as JSON."""
+        mock_path = tmp_path / "mock.json"
+        mock_path.write_text(json.dumps({'name': 'Ann', 'email': 'ann@example.com'}))
+        monkeypatch.setattr('questionary.print', lambda *args, **kwargs: None)
+        monkeypatch.setattr(
+            'sys.argv', ['renderer', str(layout_path), '--mock', str(mock_path), '--quiet']
+        )
+        
+        main()
+        
+        captured = capsys.readouterr()
+        assert captured.err == ""
+        assert json.loads(captured.out) == {'name': 'Ann', 'email': 'ann@example.com'}
@@ -2,50 +2,90 @@
 
 These tests ensure that Ctrl+C (KeyboardInterrupt) and None-returning prompts
 are both treated as user cancellations and surfaced as FlowExecutionError.
+
+Nothing here benefits from the result cache, so when iterating on this file
+alone, skip the .pytest_cache reads and writes with:
+
+    pytest -p no:cacheprovider tests/test_signal_handling.py
 """
 
+import signal
+
 import pytest
-from types import SimpleNamespace
 
+from tui_form_designer.core.flow_engine import FlowEngine
 from tui_form_designer.core.exceptions import FlowExecutionError
 
 
-def test_execute_flow_treats_none_as_cancellation(
-    flow_engine, sample_flow_file, monkeypatch
-):
-    """If a prompt returns None (swallowed Ctrl+C), raise FlowExecutionError."""
+@pytest.fixture(scope="module")
+def flow_engine(tmp_path_factory, sample_flow_yaml):
+    """One engine over the sample flow, shared by every test in this module."""
+    # Tests here only patch _build_question and _load_flow (undone by
+    # monkeypatch), so the engine and its flow file are never left modified
+    flows_dir = tmp_path_factory.mktemp("signal_flows")
+    (flows_dir / "test_flow.yml").write_bytes(sample_flow_yaml)
+    return FlowEngine(flows_dir=str(flows_dir))
 
-    class DummyQuestion:
-        def ask(self):
-            return None
 
-    # Ensure every built question returns our dummy that yields None
-    monkeypatch.setattr(
-        type(flow_engine),
-        "_build_question",
-        lambda self, step, ctx: DummyQuestion(),
-        raising=True,
-    )
+# A single prompt step is all the cancellation branch needs
+_CANCEL_FLOW = {
+    "flow_id": "cancel",
+    "title": "Cancel",
+    "steps": [{"id": "name", "type": "text", "message": "Name:"}],
+}
 
-    with pytest.raises(FlowExecutionError, match="cancelled by user"):
-        flow_engine.execute_flow("test_flow")
 
+class NoneQuestion:
+    """A prompt whose library swallowed Ctrl+C and returned None."""
 
-def test_execute_flow_keyboardinterrupt_raises(
-    flow_engine, sample_flow_file, monkeypatch
-):
-    """If a prompt raises KeyboardInterrupt, it should surface as FlowExecutionError."""
+    def ask(self):
+        return None
 
-    class InterruptQuestion:
-        def ask(self):
-            raise KeyboardInterrupt()
 
+class InterruptQuestion:
+    """A prompt interrupted by Ctrl+C."""
+
+    def ask(self):
+        raise KeyboardInterrupt()
+
+
+@pytest.fixture
+def cancelling_question(request, flow_engine, monkeypatch):
+    """Make the shared engine build the parametrized question double."""
+    # The doubles are stateless, so every step gets the same instance
+    question = request.param
+    # Patch the shared instance only, never the FlowEngine class
     monkeypatch.setattr(
-        type(flow_engine),
+        flow_engine,
         "_build_question",
-        lambda self, step, ctx: InterruptQuestion(),
+        lambda step, ctx: question,
         raising=True,
     )
 
-    with pytest.raises(FlowExecutionError, match="cancelled by user"):
+
+@pytest.mark.parametrize(
+    "cancelling_question",
+    [NoneQuestion(), InterruptQuestion()],
+    ids=["none", "interrupt"],
+    indirect=True,
+)
+def test_step_cancellation(flow_engine, monkeypatch, cancelling_question):
+    """A None answer or KeyboardInterrupt should surface as FlowExecutionError."""
+    monkeypatch.setattr(flow_engine, "_load_flow", lambda flow_id: _CANCEL_FLOW)
+
+    with pytest.raises(FlowExecutionError) as excinfo:
+        flow_engine._execute_flow_internal("cancel")
+    assert "cancelled by user" in str(excinfo.value)
+
+
+@pytest.mark.parametrize(
+    "cancelling_question", [InterruptQuestion()], ids=["interrupt"], indirect=True
+)
+def test_execute_flow_cancellation(flow_engine, cancelling_question):
+    """Ctrl+C during execute_flow cancels the flow and restores SIGINT handling."""
+    original_handler = signal.getsignal(signal.SIGINT)
+
+    with pytest.raises(FlowExecutionError) as excinfo:
         flow_engine.execute_flow("test_flow")
+    assert "cancelled by user" in str(excinfo.value)
+    assert signal.getsignal(signal.SIGINT) is original_handler
@@ -0,0 +1,80 @@
+"""Tests for the tui_form_engine cached YAML loader."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from tui_form_engine.core import yaml_loader
+from tui_form_engine.core.yaml_loader import clear_yaml_cache, load_yaml
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and finish every test with an empty parse cache."""
+    clear_yaml_cache()
+    yield
+    clear_yaml_cache()
+
+
+@pytest.fixture
+def mock_parse(monkeypatch):
+    """Count the YAML parses the loader performs."""
+    mock = MagicMock(wraps=yaml_loader.yaml.load)
+    monkeypatch.setattr(yaml_loader.yaml, 'load', mock)
+    return mock
+
+
+class TestLoadYaml:
+    """Test suite for load_yaml."""
+    
+    def test_unchanged_file_parsed_once(self, tmp_path, mock_parse):
+        """Test repeat loads of an unchanged file reuse the parsed tree."""
+        path = tmp_path / "flow.yml"
+        path.write_text("steps:\n  - id: a\n")
+        
+        assert load_yaml(path) == {'steps': [{'id': 'a'}]}
+        assert load_yaml(path) == {'steps': [{'id': 'a'}]}
+        assert mock_parse.call_count == 1
+    
+    def test_changed_file_reparsed(self, tmp_path, mock_parse):
+        """Test an edit (new size or mtime) is picked up on the next load."""
+        path = tmp_path / "flow.yml"
+        path.write_text("title: old\n")
+        assert load_yaml(path) == {'title': 'old'}
+        
+        path.write_text("title: newer\n")
+        assert load_yaml(path) == {'title': 'newer'}
+        assert mock_parse.call_count == 2
+    
+    def test_copies_and_shared_tree(self, tmp_path):
+        """Test callers get private copies unless they ask for the shared tree."""
+        path = tmp_path / "flow.yml"
+        path.write_text("steps:\n  - id: a\n")
+        
+        load_yaml(path)['steps'].append({'id': 'b'})
+        assert load_yaml(path) == {'steps': [{'id': 'a'}]}
+        assert load_yaml(path, shared=True) is load_yaml(path, shared=True)
+    
+    def test_least_recently_used_evicted(self, tmp_path, mock_parse, monkeypatch):
+        """Test the cache drops the least recently used file once full."""
+        monkeypatch.setattr(yaml_loader, '_CACHE_SIZE', 2)
+        paths = []
+        for name in ('a', 'b', 'c'):
+            path = tmp_path / f"{name}.yml"
+            path.write_text(f"name: {name}\n")
+            paths.append(path)
+        
+        load_yaml(paths[0])
+        load_yaml(paths[1])
+        load_yaml(paths[0])  # 'a' becomes the most recently used
+        load_yaml(paths[2])  # evicts 'b'
+        assert mock_parse.call_count == 3
+        
+        load_yaml(paths[0])
+        assert mock_parse.call_count == 3
+        load_yaml(paths[1])
+        assert mock_parse.call_count == 4
+    
+    def test_missing_file(self, tmp_path):
+        """Test a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_yaml(tmp_path / "missing.yml")